@@ -5,15 +5,77 @@ def initVarCommon():
     Returns:
         var = {
             "input_dir": Path("input"),
+            "form_extensions": [".docx", ".pdf", ".xlsx", ".csv"],
             "db_file": Path("data") / "database.db",
             "ifsc_dataset_path": Path("data") / "IFSC.csv",
+            "ifsc_backend": "dict",  # "dict" | "sqlite" | "mmap" | "columnar"
+            "ifsc_quick_backend": "mmap",  # ifsc / database commands
+            "ifsc_daemon": False,  # Share one loaded dataset across runs
+            "ifsc_socket_path": Path("data") / "ifsc.sock",
+            "ifsc_daemon_idle_timeout": 8 * 60 * 60,
+            "docx_reader": "python-docx",  # "python-docx" | "stream"
+            "prefetch_forms": 4,  # Forms parsed ahead of the operator
+            "form_cache": True,  # Reuse parsed forms by file contents
+            "form_cache_path": Path("data") / "forms.cache",
+            "form_cache_max_bytes": 64 * 2**20,
+            "batch_workers": None,  # None: one per CPU
+            "parser_pool_cost": 10,  # Parsers this costly run in the pool
+            "estimate_cache_path": Path("data") / "estimate.cache.json",
+            "batch_rules": {  # Auto-accept checks of the batch command
+                "valid_classes": True,
+                "resolvable_ifsc": True,
+                "known_district": True,
+                "no_duplicates": True,
+            },
+            "db_pragmas": {  # Applied on every database connection
+                "journal_mode": "wal",  # Readers do not block the writer
+                "synchronous": "normal",
+                "cache_size": -64 * 2**10,  # KiB
+                "mmap_size": 256 * 2**20,
+                "temp_store": "memory",
+            },
+            "db_busy_timeout": 30,  # Seconds to wait on a locked database
+            "account_filter": True,  # Check clean forms in memory, not SQL
+            "django_db_file": Path("create_forms") / "django" / "db.sqlite3",
+            "web_import_batch": 50,  # Web forms per transaction
             "district_dataset": loadDistrictDataset(),
         }
     """
     var = {
         "input_dir": Path("input"),
+        "form_extensions": [".docx", ".pdf", ".xlsx", ".csv"],
         "db_file": Path("data") / "database.db",
         "ifsc_dataset_path": Path("data") / "IFSC.csv",
+        "ifsc_backend": "dict",
+        "ifsc_quick_backend": "mmap",
+        "ifsc_daemon": False,
+        "ifsc_socket_path": Path("data") / "ifsc.sock",
+        "ifsc_daemon_idle_timeout": 8 * 60 * 60,
+        "docx_reader": "python-docx",
+        "prefetch_forms": 4,
+        "form_cache": True,
+        "form_cache_path": Path("data") / "forms.cache",
+        "form_cache_max_bytes": 64 * 2**20,
+        "batch_workers": None,
+        "parser_pool_cost": 10,
+        "estimate_cache_path": Path("data") / "estimate.cache.json",
+        "batch_rules": {
+            "valid_classes": True,
+            "resolvable_ifsc": True,
+            "known_district": True,
+            "no_duplicates": True,
+        },
+        "db_pragmas": {
+            "journal_mode": "wal",
+            "synchronous": "normal",
+            "cache_size": -64 * 2**10,
+            "mmap_size": 256 * 2**20,
+            "temp_store": "memory",
+        },
+        "db_busy_timeout": 30,
+        "account_filter": True,
+        "django_db_file": Path("create_forms") / "django" / "db.sqlite3",
+        "web_import_batch": 50,
         "district_dataset": loadDistrictDataset(),
     }
     return var
@@ -30,6 +92,13 @@ def initVarCmd():
             "excel": "spreadsheet",
             "bank": "neft",
             "final": "final",
+            "ifsc_update": "ifsc-update",
+            "ifsc_daemon": "ifsc-daemon",
+            "cache_clear": "cache-clear",
+            "cache_stats": "cache-stats",
+            "batch": "batch",
+            "web_import": "web-import",
+            "migrate": "migrate",
         }
     """
     cmd = {
@@ -39,6 +108,13 @@ def initVarCmd():
         "excel": "spreadsheet",
         "bank": "neft",
         "final": "final",
+        "ifsc_update": "ifsc-update",
+        "ifsc_daemon": "ifsc-daemon",
+        "cache_clear": "cache-clear",
+        "cache_stats": "cache-stats",
+        "batch": "batch",
+        "web_import": "web-import",
+        "migrate": "migrate",
     }
     return cmd
 
@@ -0,0 +1,358 @@
+import sqlite3      # SQLite DB operations
+import os           # Process id of shared connections
+import sys          # Account filter size
+
+# Schema of database.db, upgraded in place by migrateDB().
+#
+# MIGRATIONS[n] moves a database from version n to n + 1 and the reached
+# version is stored in PRAGMA user_version. Databases created before
+# versioning report 0 and already have the tables, so every step only
+# creates what is missing. Append new steps, never edit applied ones.
+#
+# Commands get their connection from connectDB(), one per process and
+# database file, in WAL mode so exports can read while the database
+# command writes. Only commands that write migrate, exports read the
+# database as it is.
+
+CONNECTIONS = {}
+
+
+# ========================== [ @MIGRATION_STEPS ] ========================== #
+
+
+def createTables(conn):
+    conn.execute("""
+    CREATE TABLE IF NOT EXISTS Schools (
+        SchoolID INTEGER PRIMARY KEY AUTOINCREMENT,
+        SchoolName,
+        District,
+        Place,
+        Phone,
+        Email
+    )
+    """)
+    conn.execute("""
+    CREATE TABLE IF NOT EXISTS Students (
+        StudentID INTEGER PRIMARY KEY AUTOINCREMENT,
+        SchoolID,
+        StudentName,
+        Class,
+        IFSC,
+        AccNo UNIQUE,
+        AccHolder,
+        Branch,
+        Verified
+    )
+    """)
+
+
+def createHotPathIndexes(conn):
+    # Duplicate checks look up Students.AccNo. The UNIQUE constraint
+    # already indexes it, only older hand-made databases lack one.
+    if not hasIndexOn(conn, "Students", "AccNo"):
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS StudentsAccNo ON Students (AccNo)"
+        )
+    # Exports and findVacancySpots read one school's students, by class
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS StudentsSchoolClass "
+        "ON Students (SchoolID, Class)"
+    )
+    # Exports list one district's schools
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS SchoolsDistrict ON Schools (District)"
+    )
+
+
+def createWebImports(conn):
+    # Web form submissions already handled by the web-import command
+    conn.execute("""
+    CREATE TABLE IF NOT EXISTS WebImports (
+        InstitutionID INTEGER PRIMARY KEY,
+        SchoolID INTEGER,
+        Status TEXT NOT NULL,
+        Reason TEXT,
+        Imported TEXT NOT NULL
+    )
+    """)
+
+
+MIGRATIONS = [
+    createTables,
+    createHotPathIndexes,
+    createWebImports,
+]
+
+SCHEMA_VERSION = len(MIGRATIONS)
+
+
+# ========================== [ @MIGRATION_FUNCTIONS ] ========================== #
+
+
+def getSchemaVersion(conn):
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def hasIndexOn(conn, table, column):
+    """
+    Returns: True if an index of table starts with column
+    """
+    for index in conn.execute(f"PRAGMA index_list({table})").fetchall():
+        index_name = index[1]
+        info = conn.execute(f"PRAGMA index_info({index_name})").fetchall()
+        if info and info[0][2] == column:
+            return True
+    return False
+
+
+def migrateDB(conn):
+    """
+    Parameter: Connection to database.db
+    Returns: List of applied migration names, empty if already current
+
+    Brings the schema up to SCHEMA_VERSION, all steps in one transaction.
+    Raises: RuntimeError if the database is newer than this code
+    """
+    version = getSchemaVersion(conn)
+    if version > SCHEMA_VERSION:
+        raise RuntimeError(
+            f"Database schema v{version} is newer than supported "
+            f"v{SCHEMA_VERSION}, update Scholar CAP"
+        )
+    if version == SCHEMA_VERSION:
+        return []
+
+    applied = []
+    conn.commit()
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        for migration in MIGRATIONS[version:]:
+            migration(conn)
+            applied.append(migration.__name__)
+        conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        conn.commit()
+    except BaseException:
+        conn.rollback()
+        raise
+    return applied
+
+
+# ========================== [ @EXPORT_QUERIES ] ========================== #
+
+
+# Shared by the spreadsheet, NEFT, final and school list exports
+SCHOOLS_OF_DISTRICT_SQL = """
+SELECT * FROM Schools WHERE District = ?
+"""
+
+STUDENTS_OF_SCHOOL_SQL = """
+SELECT * FROM Students WHERE SchoolID = ?
+"""
+
+
+# ========================== [ @QUERY_PLAN_FUNCTIONS ] ========================== #
+
+
+TABLES = ["Schools", "Students", "WebImports"]
+
+
+def getHotQueries():
+    """
+    Returns: List of (name, SQL, parameters) of the queries run once per
+             form or per school, the same SQL the commands execute
+    """
+    # function loads config and the parsers, only needed here
+    import function as fn
+
+    return [
+        (
+            "Duplicate analysis",
+            fn.DUPLICATE_ANALYSIS_SQL.format("?, ?"),
+            ("0", "1"),
+        ),
+        (
+            "Students of school",
+            STUDENTS_OF_SCHOOL_SQL,
+            (1,),
+        ),
+        (
+            "Schools of district",
+            SCHOOLS_OF_DISTRICT_SQL,
+            ("Kollam",),
+        ),
+    ]
+
+
+def explainQuery(conn, sql, params=()):
+    """
+    Returns: Detail lines of EXPLAIN QUERY PLAN for sql
+    """
+    plan = conn.execute(f"EXPLAIN QUERY PLAN {sql}", params).fetchall()
+    return [row[-1] for row in plan]
+
+
+def isIndexedPlan(plan):
+    """
+    Returns: False if any step scans a whole stored table. Scans of
+             materialized subqueries (WITH ... AS) only read query results.
+    """
+    for detail in plan:
+        words = detail.split()
+        # SQLite before 3.36 writes "SCAN TABLE Students"
+        if words[1:2] == ["TABLE"]:
+            del words[1]
+        if words[0] == "SCAN" and words[1] in TABLES and "INDEX" not in detail:
+            return False
+    return True
+
+
+def checkQueryPlans(conn):
+    """
+    Returns: List of (name, indexed, plan) for every getHotQueries() entry
+    """
+    results = []
+    for name, sql, params in getHotQueries():
+        plan = explainQuery(conn, sql, params)
+        results.append((name, isIndexedPlan(plan), plan))
+    return results
+
+
+# ========================== [ @CONNECTION_FUNCTIONS ] ========================== #
+
+
+def connectDB(var, db_file=None, migrate=False):
+    """
+    Parameters: (var, db_file, migrate)
+        - db_file: Database path (None: var["db_file"])
+        - migrate: Write commands pass True to create the database if
+                   missing and bring the schema up to date on first connect
+    Returns: Shared connection of this process, tuned by var["db_pragmas"]
+    Raises: FileNotFoundError if the database is missing and migrate is False
+
+    Do not close it, closeDB() does that when the command ends
+    """
+    if db_file is None:
+        db_file = var["db_file"]
+    # Forked pool workers must not reuse the parent's connection
+    key = (os.getpid(), os.path.abspath(db_file))
+    conn = CONNECTIONS.get(key)
+    if conn is not None:
+        return conn
+
+    # sqlite3.connect() would leave an empty database behind
+    if not migrate and not os.path.exists(db_file):
+        raise FileNotFoundError(f"Database not found: {db_file}")
+
+    conn = sqlite3.connect(db_file, timeout=var["db_busy_timeout"])
+    for pragma, value in var["db_pragmas"].items():
+        conn.execute(f"PRAGMA {pragma} = {value}")
+    if migrate:
+        migrateDB(conn)
+    CONNECTIONS[key] = conn
+    return conn
+
+
+def closeDB():
+    """
+    Closes the shared connections of this process, rolling back anything
+    left uncommitted
+    """
+    pid = os.getpid()
+    for key in [key for key in CONNECTIONS if key[0] == pid]:
+        CONNECTIONS.pop(key).close()
+
+
+# ========================== [ @ACCOUNT_FILTER ] ========================== #
+
+
+class AccountFilter:
+    """
+    Account numbers of the Students table, held in memory so clean forms
+    skip the duplicate query. Answers "maybe" or "no": a "maybe" still
+    goes to SQL, a "no" is always right.
+
+        - hashes: Set of hash(str(AccNo)), smaller than the account
+                  strings. AccNo has no type, so older databases hold
+                  integers where forms give strings.
+        - last_student_id: Highest StudentID seen, for rows added later
+    """
+
+    def __init__(self, conn):
+        self.conn = conn
+        self.hashes = set()
+        self.last_student_id = 0
+        self.data_version = None
+        self.load()
+
+    def load(self):
+        rows = self.conn.execute(
+            "SELECT MAX(StudentID) FROM Students"
+        ).fetchone()
+        self.last_student_id = rows[0] or 0
+        self.data_version = self.getDataVersion()
+        self.hashes = {
+            hash(str(row[0])) for row in self.conn.execute(
+                "SELECT AccNo FROM Students WHERE StudentID <= ?",
+                (self.last_student_id,),
+            )
+        }
+
+    def getDataVersion(self):
+        # Changes only when another connection commits
+        return self.conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def sync(self):
+        """
+        Picks up rows other processes committed since the last check.
+        Deleted rows stay in the filter, they only cost a SQL check.
+        """
+        data_version = self.getDataVersion()
+        if data_version == self.data_version:
+            return
+        self.data_version = data_version
+        rows = self.conn.execute(
+            "SELECT StudentID, AccNo FROM Students WHERE StudentID > ?",
+            (self.last_student_id,),
+        ).fetchall()
+        for student_id, acc_no in rows:
+            self.hashes.add(hash(str(acc_no)))
+            self.last_student_id = max(self.last_student_id, student_id)
+
+    def add(self, acc_nos):
+        """
+        Records accounts this process inserted. A rolled back insert
+        leaves a false "maybe", never a wrong "no".
+        """
+        self.hashes.update(hash(str(acc_no)) for acc_no in acc_nos)
+
+    def mightContainAny(self, acc_nos):
+        self.sync()
+        return not self.hashes.isdisjoint(
+            hash(str(acc_no)) for acc_no in acc_nos
+        )
+
+    def __len__(self):
+        return len(self.hashes)
+
+    def getSize(self):
+        """
+        Returns: Approximate memory use in bytes
+        """
+        # Set table plus one int object per hash
+        return sys.getsizeof(self.hashes) + 32 * len(self.hashes)
+
+
+def loadAccountFilter(var, conn):
+    """
+    Loads the account filter of this session into var["account_filter_store"],
+    where analyzeDuplicates, insertForm and updateClassVacancies find it
+
+    Returns: AccountFilter, None if disabled in config
+    """
+    if not var["account_filter"]:
+        return None
+    account_filter = AccountFilter(conn)
+    var["account_filter_store"] = account_filter
+    size = account_filter.getSize() / 2**20
+    print(f"ℹ️ {len(account_filter)} accounts in memory ({size:.1f} MiB)")
+    return account_filter
@@ -0,0 +1,263 @@
+from xml.etree import ElementTree    # Incremental XML parsing
+import posixpath    # Zip member paths
+import zipfile      # Docx container
+
+# Streams word/document.xml out of the .docx zip and yields body text as it
+# is parsed, without building python-docx Paragraph/Table/Cell wrappers.
+# Text follows python-docx rules so both readers return the same strings:
+#   - Paragraph: direct w:r / w:hyperlink runs of a body-level w:p
+#   - Cell: its direct paragraphs joined by "\n"
+#   - Row: one entry per grid column, gridSpan / vMerge cells repeated
+
+W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+REL = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+OFFICE_DOCUMENT = (
+    "http://schemas.openxmlformats.org/officeDocument/2006/relationships/"
+    "officeDocument"
+)
+
+W_BODY = W + "body"
+W_P = W + "p"
+W_R = W + "r"
+W_HYPERLINK = W + "hyperlink"
+W_TBL = W + "tbl"
+W_TBLGRID = W + "tblGrid"
+W_GRIDCOL = W + "gridCol"
+W_TR = W + "tr"
+W_TC = W + "tc"
+W_TCPR = W + "tcPr"
+W_GRIDSPAN = W + "gridSpan"
+W_VMERGE = W + "vMerge"
+W_VAL = W + "val"
+
+RUN_TEXT = {
+    W + "tab": "\t",
+    W + "ptab": "\t",
+    W + "cr": "\n",
+    W + "noBreakHyphen": "-",
+}
+
+
+# ============================ [ @TEXT_FUNCTIONS ] ============================ #
+
+
+def getRunText(r):
+    text = []
+    for child in r:
+        tag = child.tag
+        if tag == W + "t":
+            text.append(child.text or "")
+        elif tag == W + "br":
+            # Page and column breaks have no text equivalent
+            if child.get(W + "type", "textWrapping") == "textWrapping":
+                text.append("\n")
+        elif tag in RUN_TEXT:
+            text.append(RUN_TEXT[tag])
+    return "".join(text)
+
+
+def getParagraphText(p):
+    text = []
+    for child in p:
+        if child.tag == W_R:
+            text.append(getRunText(child))
+        elif child.tag == W_HYPERLINK:
+            text.extend(getRunText(r) for r in child if r.tag == W_R)
+    return "".join(text)
+
+
+def getCellText(tc):
+    return "\n".join(getParagraphText(p) for p in tc if p.tag == W_P)
+
+
+def getCellMerge(tc):
+    """
+    Returns: (grid_span, vertically merged into the cell above)
+    """
+    tcPr = tc.find(W_TCPR)
+    if tcPr is None:
+        return 1, False
+    grid_span = tcPr.find(W_GRIDSPAN)
+    span = int(grid_span.get(W_VAL)) if grid_span is not None else 1
+    v_merge = tcPr.find(W_VMERGE)
+    merged = v_merge is not None and v_merge.get(W_VAL, "continue") == "continue"
+    return span, merged
+
+
+# =========================== [ @STREAM_FUNCTIONS ] =========================== #
+
+
+def getDocumentPartName(archive):
+    """
+    Returns: Zip member holding the main document, normally word/document.xml
+    """
+    try:
+        rels = ElementTree.fromstring(archive.read("_rels/.rels"))
+    except KeyError:
+        return "word/document.xml"
+    for rel in rels.iter(REL + "Relationship"):
+        if rel.get("Type") == OFFICE_DOCUMENT:
+            return posixpath.normpath(rel.get("Target").lstrip("/"))
+    return "word/document.xml"
+
+
+class TableGrid:
+    """
+    Lays out the cells of one table the way python-docx does: every w:tc
+    is expanded to the grid columns it spans, then the flat list is cut
+    into rows of len(w:gridCol) entries.
+    """
+
+    def __init__(self):
+        self.col_count = 0
+        self.cells = []
+        self.row_count = 0
+        self.emitted = 0
+
+    def addRow(self, tr):
+        self.row_count += 1
+        cells = self.cells
+        for tc in tr:
+            if tc.tag != W_TC:
+                continue
+            span, merged = getCellMerge(tc)
+            for span_index in range(span):
+                if merged and len(cells) >= self.col_count > 0:
+                    cells.append(cells[-self.col_count])
+                elif span_index > 0:
+                    cells.append(cells[-1])
+                else:
+                    cells.append(getCellText(tc))
+
+    def popRows(self, final=False):
+        rows = []
+        col_count = self.col_count
+        while self.emitted < self.row_count:
+            start = self.emitted * col_count
+            end = start + col_count
+            if not final and len(self.cells) < end:
+                break  # Row continues in the next w:tr
+            rows.append(self.cells[start:end])
+            self.emitted += 1
+        return rows
+
+
+def iterDocxBody(docx_file):
+    """
+    Parameter: Document.docx file
+    Yields: Body content in document order
+        - ("paragraph", text) for each body-level paragraph
+        - ("row", table_index, [cell_text, ...]) for each top-level table row
+
+    Elements are dropped as soon as they are read so memory stays flat
+    however long the student table is.
+    """
+    with zipfile.ZipFile(docx_file) as archive:
+        part_name = getDocumentPartName(archive)
+        with archive.open(part_name) as document:
+            stack = []
+            table_index = -1
+            grid = None
+
+            for event, elem in ElementTree.iterparse(
+                document, events=("start", "end")
+            ):
+                if event == "start":
+                    if (
+                        elem.tag == W_TBL
+                        and stack and stack[-1].tag == W_BODY
+                    ):
+                        table_index += 1
+                        grid = TableGrid()
+                    stack.append(elem)
+                    continue
+
+                stack.pop()
+                if not stack:
+                    continue
+                parent = stack[-1]
+
+                if parent.tag == W_BODY:
+                    if elem.tag == W_P:
+                        yield "paragraph", getParagraphText(elem)
+                    elif elem.tag == W_TBL:
+                        for row in grid.popRows(final=True):
+                            yield "row", table_index, row
+                        grid = None
+                    parent.remove(elem)
+
+                elif grid is not None and len(stack) >= 2 and (
+                    stack[-2].tag == W_BODY and parent.tag == W_TBL
+                ):
+                    if elem.tag == W_TBLGRID:
+                        grid.col_count = sum(
+                            1 for col in elem if col.tag == W_GRIDCOL
+                        )
+                    elif elem.tag == W_TR:
+                        grid.addRow(elem)
+                        for row in grid.popRows():
+                            yield "row", table_index, row
+                        parent.remove(elem)
+
+
+# ========================== [ @DOCUMENT_FUNCTIONS ] ========================== #
+
+
+class Paragraph:
+    def __init__(self, text):
+        self.text = text
+
+
+class Cell:
+    def __init__(self, text):
+        self.text = text
+
+
+class Row:
+    def __init__(self, texts):
+        self.cells = tuple(Cell(text) for text in texts)
+
+
+class Table:
+    def __init__(self):
+        self.rows = []
+
+
+class Document:
+    """
+    Read-only stand-in for docx.Document exposing .paragraphs and
+    .tables[].rows[].cells[].text, so the readers in function.py
+    work on either.
+    """
+
+    def __init__(self, docx_file):
+        self.paragraphs = []
+        self.tables = []
+        for item in iterDocxBody(docx_file):
+            if item[0] == "paragraph":
+                self.paragraphs.append(Paragraph(item[1]))
+            else:
+                _, table_index, texts = item
+                while len(self.tables) <= table_index:
+                    self.tables.append(Table())
+                self.tables[table_index].rows.append(Row(texts))
+
+
+def getStudentDetailsDocxStream(docx_file):
+    """
+    Parameter: Document.docx file
+    Returns: A dictionary of tuples with Student details
+             (same as function.getStudentDetailsDocx)
+    """
+    data = {}
+    i = 0
+    for item in iterDocxBody(docx_file):
+        if item[0] != "row":
+            continue
+        cells = item[2]
+        first_column = cells[0]
+        if first_column != "" and first_column != "STUDENT NAME":
+            name, standard, ifsc, acc_no, holder, branch = cells[:6]
+            data[i] = name, standard, ifsc, acc_no, holder, branch
+            i = i + 1
+    return data
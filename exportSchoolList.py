@@ -1,8 +1,8 @@
-import sqlite3      # SQLite DB operations
 from openpyxl import Workbook       # Excel Workbook
 from openpyxl.styles import Font    # Excel Font Styles
 from pathlib import Path            # Modern OS Path
 import function as fn
+import database
 from function import var
 
 
@@ -16,6 +16,7 @@ def main():
         xlsx_file = Path(spreadsheet_dir) / f"{district}.xlsx"
         generateOutputSpreadsheet(db_file, district, xlsx_file)
         print(f"✅ {xlsx_file} generated for {district}")
+    database.closeDB()
 
 
 def generateOutputSpreadsheet(db_file, district, xlsx_file):
@@ -29,7 +30,8 @@ def generateOutputSpreadsheet(db_file, district, xlsx_file):
         Generated Excel.xlsx file
     """
 
-    conn = sqlite3.connect(db_file)
+    # Shared connection, reused for every district
+    conn = database.connectDB(var, db_file)
     cursor = conn.cursor()
     wb = Workbook()
     ws = wb.active
@@ -37,9 +39,7 @@ def generateOutputSpreadsheet(db_file, district, xlsx_file):
     # --------------------------------------------------------- [ SQL Queries ]
 
     if district != "Unknown":
-        schoolSQL = """
-        SELECT * FROM Schools WHERE District = ?
-        """
+        schoolSQL = database.SCHOOLS_OF_DISTRICT_SQL
         cursor.execute(schoolSQL, (district,))
 
     elif district == "Unknown":
@@ -84,4 +84,3 @@ def generateOutputSpreadsheet(db_file, district, xlsx_file):
         ws.append([school_name, school_no, school_mail])
 
     wb.save(xlsx_file)
-    conn.close()
@@ -0,0 +1,274 @@
+from pathlib import Path    # OS Independent filepath
+import threading    # Connection shared with the prefetch thread
+import hashlib      # Content hash of forms
+import sqlite3      # Cache storage
+import json         # Form serialisation
+import time         # LRU timestamps
+import os           # Owning process
+from multiprocessing import util    # Flush on process exit, pool workers too
+import config as cfg
+
+# Bump whenever parseForm output changes for the same file, so stale
+# entries stop matching instead of being served
+PARSER_VERSION = 1
+
+# Cache rows are keyed by (sha256 of file contents, PARSER_VERSION) and
+# hold the complete parseForm() result as JSON. Renaming or moving a form
+# between folders keeps its entry; editing it makes a new one.
+
+
+# ========================== [ @CACHE_FUNCTIONS ] ========================== #
+
+
+def getContentHash(file):
+    """
+    Parameter: Path to a file
+    Returns: SHA-256 hex digest of file contents
+    """
+    sha = hashlib.sha256()
+    with open(file, mode='rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            sha.update(chunk)
+    return sha.hexdigest()
+
+
+def encodeForm(form):
+    """
+    Returns: JSON text of a parsed form. Student keys are ints and rows
+             are tuples, which JSON cannot keep, so students are stored
+             as [[key, [cells]], ...]
+    """
+    record = dict(form)
+    record["students"] = [
+        [key, list(row)] for key, row in form["students"].items()
+    ]
+    return json.dumps(record, ensure_ascii=False, separators=(",", ":"))
+
+
+def decodeForm(text):
+    """
+    Returns: Parsed form dict from encodeForm() JSON text
+    """
+    form = json.loads(text)
+    form["students"] = {key: tuple(row) for key, row in form["students"]}
+    return form
+
+
+class FormCache:
+    """
+    Size-bounded store of parsed forms. Least recently used entries are
+    evicted once the stored JSON exceeds max_bytes.
+
+    Lookups only read. LastUsed stamps and hit / miss counters are kept
+    in memory and written every FLUSH_EVERY lookups, on put() and when
+    the process exits, so pool workers sharing the file rarely wait on
+    its write lock.
+    """
+
+    FLUSH_EVERY = 64
+
+    def __init__(self, cache_file, max_bytes):
+        self.cache_file = Path(cache_file)
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        self.pid = os.getpid()
+        self.touched = {}
+        self.counters = {}
+        self.pending = 0
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(
+            self.cache_file, timeout=30, check_same_thread=False
+        )
+        # Readers do not block the one writing process
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        self.conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS FormCache (
+                Hash TEXT NOT NULL,
+                ParserVersion INTEGER NOT NULL,
+                Form TEXT NOT NULL,
+                Size INTEGER NOT NULL,
+                LastUsed REAL NOT NULL,
+                PRIMARY KEY (Hash, ParserVersion)
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS FormCacheLastUsed
+                ON FormCache (LastUsed);
+            CREATE TABLE IF NOT EXISTS FormCacheStats (
+                Key TEXT PRIMARY KEY,
+                Value INTEGER NOT NULL
+            );
+            """
+        )
+        self.conn.commit()
+        util.Finalize(self, self.flush, exitpriority=10)
+
+    def count(self, key, amount=1):
+        self.counters[key] = self.counters.get(key, 0) + amount
+
+    def writeBuffered(self):
+        """
+        Writes buffered LastUsed stamps and counters, caller commits
+        """
+        self.conn.executemany(
+            "UPDATE FormCache SET LastUsed = MAX(LastUsed, ?) "
+            "WHERE Hash = ? AND ParserVersion = ?",
+            (
+                (last_used, digest, PARSER_VERSION)
+                for digest, last_used in self.touched.items()
+            ),
+        )
+        self.conn.executemany(
+            "INSERT INTO FormCacheStats (Key, Value) VALUES (?, ?) "
+            "ON CONFLICT (Key) DO UPDATE SET Value = Value + excluded.Value",
+            self.counters.items(),
+        )
+        self.touched = {}
+        self.counters = {}
+        self.pending = 0
+
+    def flush(self):
+        """
+        Writes buffered lookups now. A forked child leaves the parent's
+        buffer to the parent.
+        """
+        with self.lock:
+            if os.getpid() != self.pid or self.conn is None:
+                return
+            if self.touched or self.counters:
+                self.writeBuffered()
+                self.conn.commit()
+
+    def get(self, digest):
+        """
+        Returns: Parsed form, or None on a cache miss
+        """
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT Form FROM FormCache "
+                "WHERE Hash = ? AND ParserVersion = ?",
+                (digest, PARSER_VERSION),
+            ).fetchone()
+            if row is None:
+                self.count("misses")
+            else:
+                self.touched[digest] = time.time()
+                self.count("hits")
+            self.pending += 1
+            flush = self.pending >= self.FLUSH_EVERY
+        if flush:
+            self.flush()
+        if row is None:
+            return None
+        return decodeForm(row[0])
+
+    def put(self, digest, form):
+        text = encodeForm(form)
+        with self.lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO FormCache "
+                "(Hash, ParserVersion, Form, Size, LastUsed) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (digest, PARSER_VERSION, text, len(text), time.time()),
+            )
+            # Eviction below must see the buffered LastUsed stamps
+            self.writeBuffered()
+            self.evict()
+            self.conn.commit()
+
+    def evict(self):
+        """
+        Drops least recently used entries until the cache fits max_bytes
+        """
+        total = self.conn.execute(
+            "SELECT COALESCE(SUM(Size), 0) FROM FormCache"
+        ).fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        evicted = 0
+        rows = self.conn.execute(
+            "SELECT Hash, ParserVersion, Size FROM FormCache "
+            "ORDER BY LastUsed"
+        ).fetchall()
+        for digest, version, size in rows:
+            if total <= self.max_bytes:
+                break
+            self.conn.execute(
+                "DELETE FROM FormCache WHERE Hash = ? AND ParserVersion = ?",
+                (digest, version),
+            )
+            total -= size
+            evicted += 1
+        self.count("evictions", evicted)
+
+    def stats(self):
+        """
+        Returns: Dictionary of cache statistics
+
+        stats = {
+            "entries": 120,
+            "stale_entries": 4,  # Written by an older parser version
+            "bytes": 524288,
+            "max_bytes": 67108864,
+            "file_bytes": 610304,
+            "hits": 300,
+            "misses": 124,
+            "evictions": 0,
+        }
+        """
+        self.flush()
+        with self.lock:
+            entries, size = self.conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(Size), 0) FROM FormCache"
+            ).fetchone()
+            stale = self.conn.execute(
+                "SELECT COUNT(*) FROM FormCache WHERE ParserVersion != ?",
+                (PARSER_VERSION,),
+            ).fetchone()[0]
+            counters = dict(
+                self.conn.execute("SELECT Key, Value FROM FormCacheStats")
+            )
+        return {
+            "entries": entries,
+            "stale_entries": stale,
+            "bytes": size,
+            "max_bytes": self.max_bytes,
+            "file_bytes": self.cache_file.stat().st_size,
+            "hits": counters.get("hits", 0),
+            "misses": counters.get("misses", 0),
+            "evictions": counters.get("evictions", 0),
+        }
+
+    def clear(self):
+        """
+        Returns: Number of entries removed
+        """
+        with self.lock:
+            removed = self.conn.execute(
+                "SELECT COUNT(*) FROM FormCache"
+            ).fetchone()[0]
+            self.conn.execute("DELETE FROM FormCache")
+            self.conn.execute("DELETE FROM FormCacheStats")
+            self.touched = {}
+            self.counters = {}
+            self.pending = 0
+            self.conn.commit()
+            self.conn.execute("VACUUM")
+        return removed
+
+    def close(self):
+        self.flush()
+        with self.lock:
+            if self.conn is not None:
+                self.conn.close()
+                self.conn = None
+
+
+def openFormCache(var=None):
+    """
+    Returns: FormCache from config, or None when the cache is disabled
+    """
+    if var is None:
+        var = cfg.initVarCommon()
+    if not var["form_cache"]:
+        return None
+    return FormCache(var["form_cache_path"], var["form_cache_max_bytes"])
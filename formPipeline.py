@@ -0,0 +1,114 @@
+import threading    # Producer thread
+import queue        # Bounded hand-off to the operator loop
+import time         # Step timings
+import function as fn
+from function import var
+
+
+# ========================== [ @PIPELINE_FUNCTIONS ] ========================== #
+
+
+def prepareForm(file):
+    """
+    Parameter: Supported File
+    Returns: Everything the review loop needs before the operator sees it
+
+    job = {
+        "file": file,
+        "form": parseForm() data,
+        "students": cleaned and normalized student data,
+        "district_guess": "Ernakulam",
+        "district_list": District of every IFSC (see getDistrictGuess),
+        "error": Exception raised while preparing, re-raised on review,
+        "timings": Seconds spent per step (parse, normalize, district)
+    }
+
+    Nothing here prints, moves or renames files: that stays with the
+    operator loop so logs and file moves follow review order.
+    """
+    job = {
+        "file": file,
+        "form": None,
+        "students": {},
+        "district_guess": None,
+        "district_list": [],
+        "error": None,
+        "timings": {"parse": 0.0, "normalize": 0.0, "district": 0.0},
+    }
+    timings = job["timings"]
+    try:
+        start = time.perf_counter()
+        form = fn.parseForm(file)
+        job["form"] = form
+        timings["parse"] = time.perf_counter() - start
+        if form["format"]:
+            start = time.perf_counter()
+            student_data = fn.cleanStudentData(form["students"])
+            student_data = fn.normalizeStudentData(student_data)
+            job["students"] = student_data
+            timings["normalize"] = time.perf_counter() - start
+
+            start = time.perf_counter()
+            ifsc_list = fn.getStudentIfscList(student_data)
+            district, district_list = fn.getDistrictGuess(ifsc_list)
+            job["district_guess"] = district
+            job["district_list"] = district_list
+            timings["district"] = time.perf_counter() - start
+    except Exception as e:
+        job["error"] = e
+    return job
+
+
+class FormPipeline:
+    """
+    Prepares the next forms of file_list on a background thread while
+    the operator reviews the current one.
+
+    Jobs come out in file_list order. At most `lookahead` prepared forms
+    wait in the queue, so an operator who stops early has not paid for
+    parsing the whole directory.
+
+        pipeline = FormPipeline(file_list)
+        pipeline.start()
+        try:
+            for job in pipeline:
+                ...
+        finally:
+            pipeline.close()
+    """
+
+    def __init__(self, file_list, lookahead=None):
+        if lookahead is None:
+            lookahead = var["prefetch_forms"]
+        self.file_list = list(file_list)
+        self.queue = queue.Queue(maxsize=max(1, lookahead))
+        self.stop = threading.Event()
+        self.thread = threading.Thread(target=self.produce, daemon=True)
+
+    def produce(self):
+        for file in self.file_list:
+            job = prepareForm(file)
+            # Wake up now and then to notice close() while the queue is full
+            while not self.stop.is_set():
+                try:
+                    self.queue.put(job, timeout=0.2)
+                    break
+                except queue.Full:
+                    continue
+            if self.stop.is_set():
+                return
+
+    def start(self):
+        self.thread.start()
+
+    def __iter__(self):
+        for _ in self.file_list:
+            job = self.queue.get()
+            if job["error"] is not None:
+                raise job["error"]
+            yield job
+
+    def close(self):
+        self.stop.set()
+        if self.thread.is_alive():
+            self.thread.join()
@@ -3,17 +3,30 @@ from sqlite3 import IntegrityError  # SQLite AccNo error
 from prompt_toolkit import prompt   # Prompt for Autocompletion
 from collections import Counter     # Most Common Value
 from pandas import DataFrame        # Printing Tables
+from pandas import Series           # Batch column operations
 from pathlib import Path            # OS Independent filepath
 from sys import exit
 import threading    # Multithreading Stuff
-import csv          # CSV file manipulation
+import functools    # Memoization
+import re           # Class string tokenizer
 import os           # Directory path support
 import docx         # Docx parsing
+import docxStream   # Streaming docx reader
+import sqlite3      # Form cache errors
 import glob         # Finding files with extensions
 import pdfplumber   # PDF parsing
+import openpyxl     # Xlsx form parsing
+import csv          # CSV form parsing
+import zipfile      # Xlsx vs CSV
+import datetime     # Spreadsheet date cells
 import tabulate     # CLI Table Borders
+import ifscDataset
+import ifscDaemon
+import formCache
+import parserRegistry
 import config as cfg
 var = cfg.initVarCommon()
+form_cache_lock = threading.Lock()
 
 
 # =========================== [ @VAR_FUNCTIONS ] =========================== #
@@ -32,31 +45,53 @@ def loadIfscDataset(csv_file):
         'State': row['STATE'],
         'Address': row['ADDRESS'],
         'City': row['CITY'],
+        'ResolvedDistrict': resolveDistrict(row),
     }
     """
-    dataset = {}
-    with open(csv_file, mode='r', encoding='utf-8') as file:
-        reader = csv.DictReader(file)
-        for row in reader:
-            dataset[row['IFSC']] = {
-                'Bank': row['BANK'],
-                'Branch': row['BRANCH'],
-                'Centre': row['CENTRE'],
-                'District': row['DISTRICT'],
-                'State': row['STATE'],
-                'Address': row['ADDRESS'],
-                'City': row['CITY'],
-            }
-    return dataset
+    return ifscDataset.readIfscCsv(csv_file)
 
 
-def updateIfscInVar():
-    var["ifsc_dataset"] = loadIfscDataset(var["ifsc_dataset_path"])
+def updateIfscInVar(backend=None, columns=None):
+    """
+    Parameters: (backend, columns)
+        - backend: "dict" | "sqlite" | "mmap" | "columnar" (None: config)
+        - columns: IFSC dataset keys the command reads (None: all)
+    """
+    if backend is None:
+        backend = var["ifsc_backend"]
+    csv_file = var["ifsc_dataset_path"]
+
+    def loadInProcess():
+        return ifscDataset.loadIfscBackend(csv_file, backend, columns)
+
+    # Resident daemon already holds the dataset, else load in process
+    if var["ifsc_daemon"]:
+        socket_path = var["ifsc_socket_path"]
+        store = ifscDaemon.connectIfscDaemon(
+            socket_path, columns, fallback=loadInProcess
+        )
+        if store is not None:
+            var["ifsc_dataset"] = store
+            return
+
+    var["ifsc_dataset"] = loadInProcess()
 
 
-def getDistrictFromUser():
+def prefetchIfsc(ifsc_dataset, ifsc_list):
+    """
+    Resolves a batch of IFSC codes in one go on backends that support it
+    (IFSC daemon), so later .get() calls are answered locally.
+    """
+    prefetch = getattr(ifsc_dataset, "prefetch", None)
+    if prefetch is not None:
+        prefetch(ifsc_list)
+
 
-    csv_thread = threading.Thread(target=updateIfscInVar)
+def getDistrictFromUser(backend=None, columns=None):
+
+    csv_thread = threading.Thread(
+        target=updateIfscInVar, args=(backend, columns)
+    )
     csv_thread.start()
 
     # Get district while other thread works
@@ -88,51 +123,7 @@ def writeToDB(conn, district, institution, student_data):
         cursor = conn.cursor()
         conn.execute("BEGIN TRANSACTION")
 
-        # Insert Institution
-        inst_name = institution["name"]
-        inst_place = institution["place"]
-        inst_number = institution["number"]
-        inst_email = institution["email"]
-
-        schoolSQL = """
-        INSERT INTO Schools (
-            SchoolName,
-            District,
-            Place,
-            Phone,
-            Email
-        )
-        VALUES ( ?, ?, ?, ?, ?)
-        """
-        values = inst_name, district, inst_place, inst_number, inst_email
-        cursor.execute(schoolSQL, values)
-
-        # Get the auto-incremented SchoolID
-        school_id = cursor.lastrowid
-
-        # Insert Students
-        studentSQL = """
-        INSERT INTO Students (
-            SchoolID,
-            StudentName,
-            Class,
-            IFSC,
-            AccNo,
-            AccHolder,
-            Branch
-        )
-        VALUES ( ?, ?, ?, ?, ?, ?, ?)
-        """
-
-        for _, value in student_data.items():
-            name = value[0]
-            standard = value[1]
-            ifsc = value[2]
-            acc_no = value[3]
-            holder = value[4]
-            branch = value[5]
-            variables = school_id, name, standard, ifsc, acc_no, holder, branch
-            cursor.execute(studentSQL, variables)
+        insertForm(cursor, district, institution, student_data)
 
         print("ℹ️ Commiting Changes")
         conn.commit()
@@ -149,6 +140,116 @@ def writeToDB(conn, district, institution, student_data):
         return False
 
 
+def insertForm(cursor, district, institution, student_data):
+    """
+    Arguments: (cursor, district, institution, student_data)
+        Same as writeToDB, without transaction handling so callers can
+        group many forms into one transaction
+
+    Returns: SchoolID of the inserted institution
+    Raises: IntegrityError on duplicate account numbers
+    """
+    # Insert Institution
+    inst_name = institution["name"]
+    inst_place = institution["place"]
+    inst_number = institution["number"]
+    inst_email = institution["email"]
+
+    schoolSQL = """
+    INSERT INTO Schools (
+        SchoolName,
+        District,
+        Place,
+        Phone,
+        Email
+    )
+    VALUES ( ?, ?, ?, ?, ?)
+    """
+    values = inst_name, district, inst_place, inst_number, inst_email
+    cursor.execute(schoolSQL, values)
+
+    # Get the auto-incremented SchoolID
+    school_id = cursor.lastrowid
+
+    # Insert Students
+    studentSQL = """
+    INSERT INTO Students (
+        SchoolID,
+        StudentName,
+        Class,
+        IFSC,
+        AccNo,
+        AccHolder,
+        Branch
+    )
+    VALUES ( ?, ?, ?, ?, ?, ?, ?)
+    """
+
+    # One prepared statement for the whole form
+    cursor.executemany(
+        studentSQL, ((school_id, *value[:6]) for value in student_data.values())
+    )
+
+    account_filter = var.get("account_filter_store")
+    if account_filter is not None:
+        account_filter.add(value[3] for value in student_data.values())
+
+    return school_id
+
+
+def insertFormSavepoint(cursor, district, institution, student_data):
+    """
+    insertForm() inside a savepoint of the open transaction, so a rejected
+    form leaves the other forms of the transaction in place
+
+    Returns: (school_id, error)
+        - school_id: SchoolID, None if rejected
+        - error: IntegrityError message, None if inserted
+    """
+    cursor.execute("SAVEPOINT form")
+    try:
+        school_id = insertForm(cursor, district, institution, student_data)
+    except IntegrityError as e:
+        cursor.execute("ROLLBACK TO form")
+        cursor.execute("RELEASE form")
+        return None, str(e)
+    cursor.execute("RELEASE form")
+    return school_id, None
+
+
+def writeFormsToDB(conn, forms, record=None):
+    """
+    Arguments: (conn, forms, record)
+        conn: Connection to database.db using sqlite3.connect()
+        forms: List of (district, institution, student_data) as in writeToDB
+        record: Optional record(cursor, index, school_id, error), called
+                for every form inside the same transaction
+
+    Returns: List of (school_id, error) per form, see insertFormSavepoint.
+             Everything is rolled back and re-raised on other errors.
+
+    Writes all forms with one commit instead of one per form
+    """
+    cursor = conn.cursor()
+    results = []
+    conn.execute("BEGIN TRANSACTION")
+    try:
+        for index, (district, institution, student_data) in enumerate(forms):
+            school_id, error = insertFormSavepoint(
+                cursor, district, institution, student_data
+            )
+            if error is not None:
+                print(f"🔴 IntegrityError: {institution['name']}: {error}")
+            if record is not None:
+                record(cursor, index, school_id, error)
+            results.append((school_id, error))
+        conn.commit()
+    except BaseException:
+        conn.rollback()
+        raise
+    return results
+
+
 def getIndianState():
     indian_states = [
         "Andhra Pradesh",
@@ -261,266 +362,387 @@ def userVerifyStudentData(student_data):
 # ======================== [ @PROCESSOR_FUNCTIONS ] ======================== #
 
 
+# Known spellings of each class, as written on forms
+STD_ALIASES = {
+    1: [
+        "1",
+        "1a",
+        "1b",
+        "1c",
+        "1d",
+        "1e",
+        "1 a",
+        "1 b",
+        "1 c",
+        "1 d",
+        "1 e",
+        "i",
+        "1st",
+        "one",
+        "first"
+    ],
+    2: [
+        "2",
+        "2a",
+        "2b",
+        "2c",
+        "2d",
+        "2e",
+        "2 a",
+        "2 b",
+        "2 c",
+        "2 d",
+        "2 e",
+        "ii",
+        "2nd",
+        "two",
+        "second"
+    ],
+    3: [
+        "3",
+        "3a",
+        "3b",
+        "3c",
+        "3d",
+        "3e",
+        "3 a",
+        "3 b",
+        "3 c",
+        "3 d",
+        "3 e",
+        "iii",
+        "3rd",
+        "three",
+        "third"
+    ],
+    4: [
+        "4",
+        "4a",
+        "4b",
+        "4c",
+        "4d",
+        "4e",
+        "4 a",
+        "4 b",
+        "4 c",
+        "4 d",
+        "4 e",
+        "iv",
+        "1v",
+        "4th",
+        "four",
+        "fourth"
+    ],
+    5: [
+        "5",
+        "5a",
+        "5b",
+        "5c",
+        "5d",
+        "5e",
+        "5 a",
+        "5 b",
+        "5 c",
+        "5 d",
+        "5 e",
+        "v",
+        "5th",
+        "five",
+        "fifth",
+    ],
+    6: [
+        "6",
+        "6a",
+        "6b",
+        "6c",
+        "6d",
+        "6e",
+        "6 a",
+        "6 b",
+        "6 c",
+        "6 d",
+        "6 e",
+        "vi",
+        "v1",
+        "six",
+        "6th",
+        "sixth",
+    ],
+    7: [
+        "7",
+        "7a",
+        "7b",
+        "7c",
+        "7d",
+        "7e",
+        "7 a",
+        "7 b",
+        "7 c",
+        "7 d",
+        "7 e",
+        "vii",
+        "v11",
+        "7th",
+        "seven",
+        "seventh",
+    ],
+    8: [
+        "8",
+        "8a",
+        "8b",
+        "8c",
+        "8d",
+        "8e",
+        "8 a",
+        "8 b",
+        "8 c",
+        "8 d",
+        "8 e",
+        "v111",
+        "viii",
+        "8th",
+        "eight",
+        "eighth",
+    ],
+    9: [
+        "9",
+        "9a",
+        "9b",
+        "9c",
+        "9d",
+        "9e",
+        "9 a",
+        "9 b",
+        "9 c",
+        "9 d",
+        "9 e",
+        "1x",
+        "ix",
+        "9th",
+        "nine",
+        "nineth",
+    ],
+    10: [
+        "10",
+        "10a",
+        "10b",
+        "10c",
+        "10d",
+        "10e",
+        "10 a",
+        "10 b",
+        "10 c",
+        "10 d",
+        "10 e",
+        "x",
+        "10th",
+        "ten",
+        "tenth",
+    ],
+    11: [
+        "11",
+        "x1",
+        "xi",
+        "11th",
+        "plus one",
+        "plusone",
+        "+1",
+        "+1 science",
+        "+1 commerce",
+        "+1 humanities",
+    ],
+    12: [
+        "12",
+        "x11",
+        "xii",
+        "12th",
+        "plus two",
+        "plustwo",
+        "+2",
+        "+2 science",
+        "+2 commerce",
+        "+2 humanities",
+    ],
+    13: [
+        "1 dc",
+        "1dc",
+        "i dc",
+        "idc",
+        "ist dc",
+        "1stdc",
+        "1st dc"
+    ],
+    14: [
+        "2 dc",
+        "2dc",
+        "ii dc",
+        "iidc",
+        "iind dc",
+        "2nddc",
+        "2nd dc"
+    ],
+    15: [
+        "3 dc",
+        "3dc",
+        "iii dc",
+        "iiidc",
+        "iiird dc",
+        "3rddc",
+        "3rd dc"
+    ],
+    16: [
+        "1 pg",
+        "1pg",
+        "i pg",
+        "ipg",
+        "ist pg",
+        "1st pg",
+        "1stpg"
+    ],
+    17: [
+        "2 pg",
+        "2pg",
+        "ii pg",
+        "iipg",
+        "iind pg",
+        "2ndpg",
+        "2nd pg"
+    ],
+}
+
+# Alias -> Class lookup, first class listing an alias wins
+STD_ALIAS_INDEX = {}
+for std, aliases in STD_ALIASES.items():
+    for alias in aliases:
+        STD_ALIAS_INDEX.setdefault(alias, std)
+
+# Number words accepted by the class grammar
+STD_NUMBER_WORDS = {
+    "one": 1, "two": 2, "three": 3, "four": 4, "five": 5, "six": 6,
+    "seven": 7, "eight": 8, "nine": 9, "ten": 10,
+    "eleven": 11, "twelve": 12,
+    "first": 1, "second": 2, "third": 3, "fourth": 4, "fifth": 5,
+    "sixth": 6, "seventh": 7, "eighth": 8, "ninth": 9, "nineth": 9,
+    "tenth": 10, "eleventh": 11, "twelfth": 12,
+    "ist": 1, "iind": 2, "iiird": 3,
+    "i": 1, "ii": 2, "iii": 3, "iv": 4, "v": 5, "vi": 6, "vii": 7,
+    "viii": 8, "ix": 9, "x": 10, "xi": 11, "xii": 12,
+    # Common OCR / typing slips of roman numerals
+    "1v": 4, "v1": 6, "v11": 7, "v111": 8, "1x": 9, "x1": 11, "x11": 12,
+}
+STD_FILLER_WORDS = {"class", "std", "standard", "grade", "th"}
+# Only filler in "1st year DC / PG", "1st year" alone is a college student
+STD_YEAR_WORDS = {"year", "yr"}
+STD_HIGHER_WORDS = {"dc", "degree", "pg"}
+STD_ORDINALS = {"st", "nd", "rd", "th"}
+STD_STREAM_WORDS = {
+    "science", "sci", "commerce", "com", "humanities", "hum", "arts",
+    "bio", "biology", "cs", "computer",
+}
+STD_DIVISIONS = set("abcdefgh")
+STD_TOKEN = re.compile(r"\d+(?:st|nd|rd|th)|\+|\d+|[a-z]+")
+
+
+def parseStdNumber(token):
+    """
+    Parameter: Single token (eg: "10", "2nd", "xii", "two")
+    Returns: Integer value, or None if token is not a number
+    """
+    if token.isdigit():
+        return int(token)
+    if token[:-2].isdigit() and token[-2:] in ("st", "nd", "rd", "th"):
+        return int(token[:-2])
+    return STD_NUMBER_WORDS.get(token)
+
+
+def parseStdGrammar(tokens):
+    """
+    Parameter: Tokens of a class string with filler words removed
+    Returns: Class number (1 - 17) or None
+
+    Grammar:
+        school  := number [division]              (1 - 12)
+        plus    := "+" | "plus"  number [stream]  (+1 / +2 -> 11 / 12)
+        degree  := number ("dc" | "degree")       (1 - 3 -> 13 - 15)
+        pg      := number "pg"                    (1 - 2 -> 16 - 17)
+    """
+    if not tokens:
+        return None
+
+    # +1 / Plus Two [stream]
+    if tokens[0] in ("+", "plus") and len(tokens) >= 2:
+        number = parseStdNumber(tokens[1])
+        rest = tokens[2:]
+        if number in (1, 2) and all(t in STD_STREAM_WORDS for t in rest):
+            return 10 + number
+        return None
+
+    number = parseStdNumber(tokens[0])
+    if number is None:
+        return None
+    rest = tokens[1:]
+
+    if not rest:
+        if 1 <= number <= 12:
+            return number
+        return None
+
+    if len(rest) == 1:
+        suffix = rest[0]
+        if suffix in ("dc", "degree") and 1 <= number <= 3:
+            return 12 + number
+        if suffix == "pg" and 1 <= number <= 2:
+            return 15 + number
+        if suffix in STD_DIVISIONS and 1 <= number <= 12:
+            return number
+        if suffix in STD_STREAM_WORDS and 11 <= number <= 12:
+            return number
+
+    return None
+
+
+@functools.lru_cache(maxsize=4096)
+def lookupStd(text):
+    """
+    Parameter: Stripped, lowercased class string
+    Returns: Class number (1 - 17) or None
+    """
+    std = STD_ALIAS_INDEX.get(text)
+    if std is not None:
+        return std
+
+    tokens = STD_TOKEN.findall(text)
+
+    # "1 st dc" written with a space before the ordinal
+    merged = []
+    for token in tokens:
+        if token in STD_ORDINALS and merged and merged[-1].isdigit():
+            merged[-1] += token
+        else:
+            merged.append(token)
+
+    higher = any(t in STD_HIGHER_WORDS for t in merged)
+    tokens = [
+        t for t in merged
+        if t not in STD_FILLER_WORDS and not (higher and t in STD_YEAR_WORDS)
+    ]
+    return parseStdGrammar(tokens)
+
+
 def convertStdToNum(data):
     """
     Parameter: Student Standard / Class Number
     Returns: Numeric Value if String
+
+    Known aliases resolve through STD_ALIAS_INDEX, other spellings
+    (eg: "10 B", "XII", "2nd DC", "1st year PG") through parseStdGrammar()
     """
     data = str(data)
     data = data.strip().lower()
 
-    std_dataset = {
-        1: [
-            "1",
-            "1a",
-            "1b",
-            "1c",
-            "1d",
-            "1e",
-            "1 a",
-            "1 b",
-            "1 c",
-            "1 d",
-            "1 e",
-            "i",
-            "1st",
-            "one",
-            "first"
-        ],
-        2: [
-            "2",
-            "2a",
-            "2b",
-            "2c",
-            "2d",
-            "2e",
-            "2 a",
-            "2 b",
-            "2 c",
-            "2 d",
-            "2 e",
-            "ii",
-            "2nd",
-            "two",
-            "second"
-        ],
-        3: [
-            "3",
-            "3a",
-            "3b",
-            "3c",
-            "3d",
-            "3e",
-            "3 a",
-            "3 b",
-            "3 c",
-            "3 d",
-            "3 e",
-            "iii",
-            "3rd",
-            "three",
-            "third"
-        ],
-        4: [
-            "4",
-            "4a",
-            "4b",
-            "4c",
-            "4d",
-            "4e",
-            "4 a",
-            "4 b",
-            "4 c",
-            "4 d",
-            "4 e",
-            "iv",
-            "1v",
-            "4th",
-            "four",
-            "fourth"
-        ],
-        5: [
-            "5",
-            "5a",
-            "5b",
-            "5c",
-            "5d",
-            "5e",
-            "5 a",
-            "5 b",
-            "5 c",
-            "5 d",
-            "5 e",
-            "v",
-            "5th",
-            "five",
-            "fifth",
-        ],
-        6: [
-            "6",
-            "6a",
-            "6b",
-            "6c",
-            "6d",
-            "6e",
-            "6 a",
-            "6 b",
-            "6 c",
-            "6 d",
-            "6 e",
-            "vi",
-            "v1",
-            "six",
-            "6th",
-            "sixth",
-        ],
-        7: [
-            "7",
-            "7a",
-            "7b",
-            "7c",
-            "7d",
-            "7e",
-            "7 a",
-            "7 b",
-            "7 c",
-            "7 d",
-            "7 e",
-            "vii",
-            "v11",
-            "7th",
-            "seven",
-            "seventh",
-        ],
-        8: [
-            "8",
-            "8a",
-            "8b",
-            "8c",
-            "8d",
-            "8e",
-            "8 a",
-            "8 b",
-            "8 c",
-            "8 d",
-            "8 e",
-            "v111",
-            "viii",
-            "8th",
-            "eight",
-            "eighth",
-        ],
-        9: [
-            "9",
-            "9a",
-            "9b",
-            "9c",
-            "9d",
-            "9e",
-            "9 a",
-            "9 b",
-            "9 c",
-            "9 d",
-            "9 e",
-            "1x",
-            "ix",
-            "9th",
-            "nine",
-            "nineth",
-        ],
-        10: [
-            "10",
-            "10a",
-            "10b",
-            "10c",
-            "10d",
-            "10e",
-            "10 a",
-            "10 b",
-            "10 c",
-            "10 d",
-            "10 e",
-            "x",
-            "10th",
-            "ten",
-            "tenth",
-        ],
-        11: [
-            "11",
-            "x1",
-            "xi",
-            "11th",
-            "plus one",
-            "plusone",
-            "+1",
-            "+1 science",
-            "+1 commerce",
-            "+1 humanities",
-        ],
-        12: [
-            "12",
-            "x11",
-            "xii",
-            "12th",
-            "plus two",
-            "plustwo",
-            "+2",
-            "+2 science",
-            "+2 commerce",
-            "+2 humanities",
-        ],
-        13: [
-            "1 dc",
-            "1dc",
-            "i dc",
-            "idc",
-            "ist dc",
-            "1stdc",
-            "1st dc"
-        ],
-        14: [
-            "2 dc",
-            "2dc",
-            "ii dc",
-            "iidc",
-            "iind dc",
-            "2nddc",
-            "2nd dc"
-        ],
-        15: [
-            "3 dc",
-            "3dc",
-            "iii dc",
-            "iiidc",
-            "iiird dc",
-            "3rddc",
-            "3rd dc"
-        ],
-        16: [
-            "1 pg",
-            "1pg",
-            "i pg",
-            "ipg",
-            "ist pg",
-            "1st pg",
-            "1stpg"
-        ],
-        17: [
-            "2 pg",
-            "2pg",
-            "ii pg",
-            "iipg",
-            "iind pg",
-            "2ndpg",
-            "2nd pg"
-        ],
-    }
-    if isinstance(data, str):
-        data = data.lower()
-        for key, values in std_dataset.items():
-            for value in values:
-                if data == value:
-                    data = key
+    std = lookupStd(data)
+    if std is not None:
+        return std
     return data
 
 
@@ -560,36 +782,9 @@ def normalizeStudentData(student_data):
         2: (name, standard, ifsc, acc_no, holder, branch)
     }
     """
-    ifsc_dataset = var["ifsc_dataset"]
-    i = 0
-    data = {}
-    for _, value in student_data.items():
-        name = value[0]
-        standard = value[1]
-        ifsc = value[2]
-        acc_no = value[3]
-        holder = value[4]
-        branch = value[5]
-
-        # Empty Acc Holder fix
-        if holder == "":
-            holder = name
-
-        # Normalizing Standard standard to Int variant
-        standard = convertStdToNum(standard)
-
-        # Normalizing Branch from IFSC using RazorPay Dataset
-        rbi_branch = getBranchFromIfsc(ifsc, ifsc_dataset)
-
-        # "," fix and long branch name fix
-        if rbi_branch and "," not in rbi_branch and len(rbi_branch) < 30:
-            branch = rbi_branch
-
-        # Extracted data
-        data[i] = name, standard, ifsc, acc_no, holder, branch
-        i = i + 1
-
-    return data
+    columns = studentDataToColumns(student_data)
+    columns = normalizeStudentColumns(columns)
+    return columnsToStudentData(columns)
 
 
 def get_most_common_value(a_list):
@@ -607,8 +802,22 @@ def guessDistrictFromIfscList(ifsc_list):
     Parameters: (ifsc_list)
     Returns: Guessed District as a String
     """
+    district, district_list = getDistrictGuess(ifsc_list)
+    printDistrictGuess(district_list)
+    return district
+
+
+def getDistrictGuess(ifsc_list):
+    """
+    Parameters: (ifsc_list)
+    Returns: (district, district_list) without printing anything, so it
+             can run off the main thread (see formPipeline)
+        - district: Guessed District as a String
+        - district_list: District of every IFSC, the data behind the guess
+    """
     district_list = []
     ifsc_dataset = var["ifsc_dataset"]
+    prefetchIfsc(ifsc_dataset, ifsc_list)
     # Create a list of Districts
     for ifsc in ifsc_list:
         district = getDistrictFromIfsc(ifsc, ifsc_dataset)
@@ -617,11 +826,6 @@ def guessDistrictFromIfscList(ifsc_list):
     # Finding the most occured District
     district = get_most_common_value(district_list)
 
-    # If District is Unknown, log data for user to verify
-    if district == "Unknown":
-        print("Couldn't decide District :(")
-        print(f"Guess Data: {district_list}\n")
-
     # If District is unrecognized district, select from most common 3 values
     district_dataset = var["district_dataset"]
     if district not in district_dataset:
@@ -632,50 +836,34 @@ def guessDistrictFromIfscList(ifsc_list):
                 district = i[0]
                 break
 
-    return district
+    return district, district_list
+
+
+def printDistrictGuess(district_list):
+    """
+    If District is Unknown, log data for user to verify
+    """
+    if get_most_common_value(district_list) == "Unknown":
+        print("Couldn't decide District :(")
+        print(f"Guess Data: {district_list}\n")
 
 
 def getDistrictFromIfsc(ifsc, ifsc_dataset):
     """
     Parameters: (ifsc_code, ifsc_dataset)
     Returns: District as a String
+
+    Uses the ResolvedDistrict column computed when the dataset was built,
+    resolving from the row only if the dataset does not carry it.
     """
     district = "Unknown"
     ifsc_info = ifsc_dataset.get(ifsc)
-    district_list = var["district_dataset"]
 
     if ifsc_info:
-
-        # District Finder (Initial Algorithm)
-        district = ifsc_info["District"]
-        # Return correct item from district data
-        for item in district_list:
-            if item.lower() == district.lower():
-                district = item
-
-        # District Finder v2.0 (New Algorithm)
-        if district not in district_list:
-            value_list = []
-            for value in ifsc_info.values():
-                value_list.append(value)
-            district = get_most_common_value(value_list)
-
-            # Return correct item from district data
-            for item in district_list:
-                if item.lower() == district.lower():
-                    district = item
-
-        # District Finder v1.0 (Fallback)
-        if district not in district_list:
-            for item in district_list:
-                address = ifsc_info["Address"]
-                if item.lower() in address.lower():
-                    district = item
-
-            # Return correct item from district data
-            for item in district_list:
-                if item.lower() == district.lower():
-                    district = item
+        district = ifsc_info.get("ResolvedDistrict")
+        if district is None:
+            district_list = var["district_dataset"]
+            district = ifscDataset.resolveDistrict(ifsc_info, district_list)
 
     return district
 
@@ -706,43 +894,16 @@ def cleanStudentData(student_data):
         2: (name, standard, ifsc, acc_no, holder, branch)
     }
     """
-    i = 0
-    data = {}
-    for _, value in student_data.items():
-        name = value[0]
-        standard = value[1]
-        ifsc = value[2]
-        acc_no = value[3]
-        holder = value[4]
-        branch = value[5]
-
-        # Cleaning spaces and newline from data
-        name = convertParagraphToLine(name)
-        standard = convertParagraphToLine(standard)
-        holder = convertParagraphToLine(holder)
-        branch = convertParagraphToLine(branch)
-
-        # Cleaning up important data
-        acc_no = str(acc_no).strip()
-        ifsc = str(ifsc).strip()
-        name = name.strip()
-        holder = holder.strip()
-
-        # Extracted data
-        data[i] = name, standard, ifsc, acc_no, holder, branch
-        i = i + 1
-
-    return data
+    columns = studentDataToColumns(student_data)
+    columns = cleanStudentColumns(columns)
+    return columnsToStudentData(columns)
 
 
 def renameFilenameToInstitution(file, institution):
     file_path = Path(file)
 
     dir = file_path.parent
-    extension = file_path.suffix
-
-    new_name = institution["name"].replace(".", "").replace(",", "")
-    new_name = f"{new_name}{extension}"
+    new_name = getInstitutionFilename(institution, file_path.suffix)
 
     new_path = dir / new_name
     file_path.rename(new_path)
@@ -750,6 +911,175 @@ def renameFilenameToInstitution(file, institution):
     return new_path
 
 
+def getInstitutionFilename(institution, extension):
+    new_name = institution["name"].replace(".", "").replace(",", "")
+    return f"{new_name}{extension}"
+
+
+def getAvailablePath(directory, file_name, taken=()):
+    """
+    Parameters: (directory, file_name, taken)
+        - taken: Paths already claimed but not yet written
+    Returns: directory / file_name, with " (2)", " (3)"... added before
+             the extension if that file exists or is taken
+    """
+    path = Path(directory) / file_name
+    number = 2
+    while path.exists() or path in taken:
+        path = Path(directory) / f"{Path(file_name).stem} ({number}){path.suffix}"
+        number += 1
+    return path
+
+
+# ========================== [ @BATCH_FUNCTIONS ] ========================== #
+
+
+STUDENT_COLUMNS = ("name", "standard", "ifsc", "acc_no", "holder", "branch")
+
+
+def studentDataToColumns(student_data):
+    """
+    Parameter: Student Data from getStudentDetails()
+    Returns: Dictionary of column lists
+
+    columns = {
+        "name": [name1, name2],
+        "standard": [standard1, standard2],
+        "ifsc": [ifsc1, ifsc2],
+        "acc_no": [acc_no1, acc_no2],
+        "holder": [holder1, holder2],
+        "branch": [branch1, branch2]
+    }
+    """
+    rows = list(student_data.values())
+    columns = {}
+    for i, key in enumerate(STUDENT_COLUMNS):
+        columns[key] = [row[i] for row in rows]
+    return columns
+
+
+def columnsToStudentData(columns):
+    """
+    Parameter: Dictionary of column lists / pandas Series
+    Returns: A dictionary of tuples with Student details
+
+    data = {
+        0: (name, standard, ifsc, acc_no, holder, branch),
+        1: (name, standard, ifsc, acc_no, holder, branch)
+    }
+    """
+    rows = zip(*(list(columns[key]) for key in STUDENT_COLUMNS))
+    return dict(enumerate(rows))
+
+
+def mapColumn(column, func):
+    """
+    Parameters: (column, func)
+        - column: List or pandas Series
+        - func: Function applied to every value
+
+    Returns: Column of the same kind with func applied. Each distinct
+             value is only computed once.
+    """
+    values = list(column)
+    computed = {}
+    result = []
+    for value in values:
+        try:
+            if value not in computed:
+                computed[value] = func(value)
+            result.append(computed[value])
+        except TypeError:  # Unhashable value
+            result.append(func(value))
+    return likeColumn(column, result)
+
+
+def likeColumn(column, values):
+    """
+    Returns: values as a pandas Series if column is one, else as a list
+    """
+    if isinstance(column, Series):
+        return Series(values, index=column.index, name=column.name)
+    return values
+
+
+def cleanStudentColumns(columns):
+    """
+    Parameter: Dictionary of column lists / pandas Series (STUDENT_COLUMNS)
+    Returns: Columns with spaces and newlines cleaned up for processing
+    """
+    def cleanLine(text):
+        return convertParagraphToLine(text).strip()
+
+    def cleanCode(text):
+        return str(text).strip()
+
+    data = {
+        # Cleaning spaces and newline from data
+        "name": mapColumn(columns["name"], cleanLine),
+        "standard": mapColumn(columns["standard"], convertParagraphToLine),
+        # Cleaning up important data
+        "ifsc": mapColumn(columns["ifsc"], cleanCode),
+        "acc_no": mapColumn(columns["acc_no"], cleanCode),
+        "holder": mapColumn(columns["holder"], cleanLine),
+        "branch": mapColumn(columns["branch"], convertParagraphToLine),
+    }
+    return data
+
+
+def normalizeStudentColumns(columns, ifsc_dataset=None):
+    """
+    Parameters: (columns, ifsc_dataset)
+        - columns: Cleaned columns from cleanStudentColumns()
+        - ifsc_dataset: IFSC dataset, var["ifsc_dataset"] if None
+
+    Returns: Columns with holder filled in, standards converted to int
+             and branches corrected from the RazorPay dataset.
+             Distinct IFSC codes are resolved in a single batch.
+    """
+    if ifsc_dataset is None:
+        ifsc_dataset = var["ifsc_dataset"]
+
+    names = list(columns["name"])
+    holders = list(columns["holder"])
+    ifsc_list = list(columns["ifsc"])
+    branches = list(columns["branch"])
+
+    # Empty Acc Holder fix
+    holders = [
+        name if holder == "" else holder
+        for name, holder in zip(names, holders)
+    ]
+
+    # Normalizing Standard to Int variant
+    standards = mapColumn(columns["standard"], convertStdToNum)
+
+    # Normalizing Branch from IFSC using RazorPay Dataset
+    unique_ifsc = list(dict.fromkeys(
+        ifsc for ifsc in ifsc_list if type(ifsc) is str
+    ))
+    prefetchIfsc(ifsc_dataset, unique_ifsc)
+    rbi_branches = {
+        ifsc: getBranchFromIfsc(ifsc, ifsc_dataset) for ifsc in unique_ifsc
+    }
+
+    for i, ifsc in enumerate(ifsc_list):
+        rbi_branch = rbi_branches.get(ifsc, "") if type(ifsc) is str else ""
+        # "," fix and long branch name fix
+        if rbi_branch and "," not in rbi_branch and len(rbi_branch) < 30:
+            branches[i] = rbi_branch
+
+    data = {
+        "name": columns["name"],
+        "standard": standards,
+        "ifsc": columns["ifsc"],
+        "acc_no": columns["acc_no"],
+        "holder": likeColumn(columns["holder"], holders),
+        "branch": likeColumn(columns["branch"], branches),
+    }
+    return data
+
+
 # ========================== [ @DIFF_FUNCTIONS ] ========================== #
 
 
@@ -875,17 +1205,31 @@ def findVacancySpots(school_id, cursor):
     if school_id == None:
         return None, []
 
-    # Lowest class entry available in the school
     query = """
-    SELECT MIN(Class)
+    SELECT DISTINCT Class
     FROM Students
     WHERE SchoolID = ?
     """
     cursor.execute(query, (school_id,))
-    lowest_class = cursor.fetchone()[0]
+    school_classes = [row[0] for row in cursor.fetchall()]
 
-    if not lowest_class:
-        return school_id, []  # No students found in the school
+    return school_id, getVacancyList(school_classes)
+
+
+def getVacancyList(school_classes):
+    """
+    Parameters:
+    - school_classes (list): Classes of every student in a school
+
+    Returns:
+    - list: Vacant classes from the start of the lowest class's group up to
+            the lowest class itself
+    """
+    # Lowest class entry available in the school
+    numbered = [cls for cls in school_classes if type(cls) is int]
+    if not numbered:
+        return []  # No students found in the school
+    lowest_class = min(numbered)
 
     # Determine class group range
     if 1 <= lowest_class <= 10:
@@ -897,20 +1241,82 @@ def findVacancySpots(school_id, cursor):
     elif 16 <= lowest_class <= 17:
         class_group = range(16, lowest_class + 1)
     else:
-        return school_id, []
+        return []
 
     # Find vacancies
-    query = """
-    SELECT DISTINCT Class
+    occupied_classes = set(numbered)
+    return [cls for cls in class_group if cls not in occupied_classes]
+
+
+# Matched rows are tagged 1, the school's classes 0. The school part
+# only runs when every match is in the same school. Plain CTEs and an
+# aggregate without HAVING keep it working on SQLite before 3.39.
+DUPLICATE_ANALYSIS_SQL = """
+WITH Matched AS (
+    SELECT SchoolID, Class, StudentName, AccNo, IFSC, Branch
     FROM Students
-    WHERE SchoolID = ? AND Class >= ? AND Class <= ?
-    """
-    cursor.execute(query, (school_id, class_group.start, lowest_class))
-    occupied_classes = {row[0] for row in cursor.fetchall()}
+    WHERE AccNo IN ({})
+),
+School AS (
+    SELECT MIN(SchoolID) AS SchoolID, COUNT(DISTINCT SchoolID) AS Schools
+    FROM Matched
+)
+SELECT 1, SchoolID, Class, StudentName, AccNo, IFSC, Branch
+FROM Matched
+UNION ALL
+SELECT DISTINCT 0, SchoolID, Class, NULL, NULL, NULL, NULL
+FROM Students
+WHERE SchoolID = (SELECT SchoolID FROM School WHERE Schools = 1)
+"""
+
+
+def analyzeDuplicates(studentDetails, cursor):
+    """
+    Everything processForms needs about duplicate accounts in one query:
+    the matching students plus, when they all belong to one school, that
+    school's classes.
+
+    Parameters:
+    - studentDetails (dict): output of getStudentDetails()
+    - cursor (sqlite3.Cursor): SQLite database cursor object to execute queries.
+
+    Returns:
+    - dict:
+        analysis = {
+            "existing": [(db_class, db_name, db_acc, db_ifsc, db_branch)],
+            "school_id": SchoolID if all are in one school, else None,
+            "vacancies": Vacant classes of that school, see findVacancySpots,
+        }
+        "existing" matches getExistingAccounts(), empty for a clean form.
+    """
+    analysis = {"existing": [], "school_id": None, "vacancies": []}
+    acc_nos = [entry[3] for entry in studentDetails.values()]  # entry[3] is acc_no
+    if not acc_nos:
+        return analysis
+
+    # Clean forms are settled in memory when the session loaded the filter
+    account_filter = var.get("account_filter_store")
+    if account_filter is not None and not account_filter.mightContainAny(acc_nos):
+        return analysis
 
-    vacancy_list = [cls for cls in class_group if cls not in occupied_classes]
+    query = DUPLICATE_ANALYSIS_SQL.format(','.join('?' for _ in acc_nos))
+    cursor.execute(query, acc_nos)
+
+    school_ids = set()
+    school_classes = []
+    for matched, school_id, db_class, db_name, db_acc, db_ifsc, db_branch in cursor:
+        if matched:
+            school_ids.add(school_id)
+            analysis["existing"].append(
+                (db_class, db_name, db_acc, db_ifsc, db_branch)
+            )
+        else:
+            school_classes.append(db_class)
 
-    return school_id, vacancy_list
+    if len(school_ids) == 1:
+        analysis["school_id"] = school_ids.pop()
+        analysis["vacancies"] = getVacancyList(school_classes)
+    return analysis
 
 
 def updateClassVacancies(school_id, vacancies, studentDetails, cursor):
@@ -941,6 +1347,9 @@ def updateClassVacancies(school_id, vacancies, studentDetails, cursor):
             cursor.execute(query, (school_id, name, standard, ifsc, acc_no, holder, branch, 'False'))
             vacancies.remove(standard)
             added_students.append(student)
+            account_filter = var.get("account_filter_store")
+            if account_filter is not None:
+                account_filter.add([acc_no])
         else:
             remaining_students.append(student)
 
@@ -1030,6 +1439,150 @@ def printExistingAccountsDiff(studentData, existingAccounts):
 # ========================== [ @PARSER_FUNCTIONS ] ========================== #
 
 
+def parseForm(file):
+    """
+    Parameter: Supported File, format detected from contents (see
+               parserRegistry) so dots in the name do not matter
+    Returns: Parsed form with format check, institution and student details
+
+    form = {
+        "format": True / False (see correctFormat),
+        "format_errors": ["Entry not found: Place"],
+        "institution": getInstitutionDetails() data,
+        "students": getStudentDetails() data
+    }
+
+    Results are cached by file contents (see formCache), so a form that
+    comes back from "for checking" is not parsed again.
+    """
+    form = {
+        "format": False,
+        "format_errors": [],
+        "institution": {},
+        "students": {},
+    }
+    parser = parserRegistry.detectParser(file)
+    if parser is None:
+        form["format_errors"].append("⚠️ Unsupported file format")
+        return form
+
+    return parseFormCached(file, parser.parse)
+
+
+def getFormCache():
+    """
+    Returns: FormCache shared by this process, opened on first use.
+             None if the cache is disabled or cannot be opened.
+    """
+    with form_cache_lock:
+        # A forked pool worker opens its own connection
+        store = var.get("form_cache_store")
+        if store is not None and store.pid != os.getpid():
+            del var["form_cache_store"]
+        if "form_cache_store" not in var:
+            try:
+                var["form_cache_store"] = formCache.openFormCache(var)
+            except (OSError, sqlite3.Error) as e:
+                print(f"⚠️ Form cache disabled: {e}")
+                var["form_cache_store"] = None
+    return var["form_cache_store"]
+
+
+def parseFormCached(file, parser):
+    """
+    Parameters: (file, parser)
+        - parser: Form parser, e.g. parseDocxForm / parsePdfForm
+    Returns: Parsed form (see parseForm) from cache, parsing on a miss
+    """
+    cache = getFormCache()
+    if cache is None:
+        return parser(file)
+
+    digest = formCache.getContentHash(file)
+    form = cache.get(digest)
+    if form is None:
+        form = parser(file)
+        cache.put(digest, form)
+    return form
+
+
+def openDocx(docx_file, reader=None):
+    """
+    Parameters: (docx_file, reader)
+        - reader: "python-docx" | "stream" (default: var["docx_reader"])
+    Returns: Document with .paragraphs and .tables for the docx readers
+    """
+    if reader is None:
+        reader = var["docx_reader"]
+    if reader == "stream":
+        return docxStream.Document(docx_file)
+    return docx.Document(docx_file)
+
+
+def parseDocxForm(docx_file, reader=None):
+    """
+    Parameter: (docx_file, reader)
+        - reader: see openDocx
+    Returns: Parsed form (see parseForm) from a single unzip + XML parse
+    """
+    doc = openDocx(docx_file, reader)
+    status, errors = checkDocxFormat(doc)
+    form = {
+        "format": status,
+        "format_errors": errors,
+        "institution": {},
+        "students": {},
+    }
+    if status:
+        form["institution"] = readInstitutionDetailsDocx(doc)
+        form["students"] = readStudentDetailsDocx(doc)
+    return form
+
+
+def parsePdfForm(pdf_file):
+    """
+    Parameter: Document.pdf file
+    Returns: Parsed form (see parseForm)
+
+    Text and table layout analysis run once per page and every answer
+    is read from those results. Scanning stops at the first page without
+    a table after the student table has started.
+    """
+    pages = []
+    institution_found = False
+    table_found = False
+
+    with pdfplumber.open(pdf_file) as pdf:
+        for page in pdf.pages:
+            text = page.extract_text() or ""
+            table = page.extract_table()
+            pages.append((text, table))
+
+            if "Institution Details" in text:
+                institution_found = True
+            if table:
+                table_found = True
+            elif table_found and institution_found:
+                break  # Student table has ended
+
+    status, errors = checkPdfFormat(pages)
+    form = {
+        "format": status,
+        "format_errors": errors,
+        "institution": {},
+        "students": {},
+    }
+    if status:
+        form["institution"] = readInstitutionDetailsPdf(pages)
+        form["students"] = readStudentDetailsPdf(pages)
+    return form
+
+
+def printFormatErrors(form):
+    for error in form["format_errors"]:
+        print(error)
+
+
 def getInstitutionDetails(file):
     """
     Parameters: Supported File
@@ -1042,18 +1595,15 @@ def getInstitutionDetails(file):
         "email": email_id
     }
     """
-    _, file_extension = os.path.basename(file).split(".")
-    data = {}
+    # Cached parse only holds details of forms that passed the format check
+    form = parseForm(file)
+    if form["format"]:
+        return form["institution"]
 
-    if file_extension == "docx":
-        docx_file = file
-        data = getInstitutionDetailsDocx(docx_file)
-
-    if file_extension == "pdf":
-        pdf_file = file
-        data = getInstitutionDetailsPdf(pdf_file)
-
-    return data
+    parser = parserRegistry.detectParser(file)
+    if parser is None:
+        return {}
+    return parser.institution(file)
 
 
 def getStudentDetails(file):
@@ -1067,18 +1617,15 @@ def getStudentDetails(file):
         2: (name, standard, ifsc, acc_no, holder, branch)
     }
     """
-    _, file_extension = os.path.basename(file).split(".")
-    data = {}
-
-    if file_extension == "docx":
-        docx_file = file
-        data = getStudentDetailsDocx(docx_file)
+    # Cached parse only holds details of forms that passed the format check
+    form = parseForm(file)
+    if form["format"]:
+        return form["students"]
 
-    if file_extension == "pdf":
-        pdf_file = file
-        data = getStudentDetailsPdf(pdf_file)
-
-    return data
+    parser = parserRegistry.detectParser(file)
+    if parser is None:
+        return {}
+    return parser.students(file)
 
 
 def getInstitutionDetailsDocx(docx_file):
@@ -1095,6 +1642,14 @@ def getInstitutionDetailsDocx(docx_file):
     """
 
     doc = docx.Document(docx_file)
+    return readInstitutionDetailsDocx(doc)
+
+
+def readInstitutionDetailsDocx(doc):
+    """
+    Parameters: Parsed docx.Document
+    Returns: Dictionary of Institution Details (see getInstitutionDetailsDocx)
+    """
     inside_institution_details = False
     name_of_institution = ""
     place = ""
@@ -1146,6 +1701,15 @@ def getStudentDetailsDocx(docx_file):
     """
 
     doc = docx.Document(docx_file)
+    return readStudentDetailsDocx(doc)
+
+
+def readStudentDetailsDocx(doc):
+    """
+    Parameter: Parsed docx.Document
+    Returns: A dictionary of tuples with Student details
+             (see getStudentDetailsDocx)
+    """
     data = {}
     i = 0
     # Iterate through the tables in the document
@@ -1166,6 +1730,24 @@ def getStudentDetailsDocx(docx_file):
     return data
 
 
+def extractPdfPages(pdf_file, text=True, tables=True):
+    """
+    Parameters: (pdf_file, text, tables)
+        - pdf_file: PDF File
+        - text: Run page.extract_text() on every page
+        - tables: Run page.extract_table() on every page
+
+    Returns: List of (text, table) per page, None for skipped extractions
+    """
+    pages = []
+    with pdfplumber.open(pdf_file) as pdf:
+        for page in pdf.pages:
+            page_text = (page.extract_text() or "") if text else None
+            page_table = page.extract_table() if tables else None
+            pages.append((page_text, page_table))
+    return pages
+
+
 def getStudentDetailsPdf(pdf_file):
     """
     Parameter: PDF File
@@ -1177,33 +1759,41 @@ def getStudentDetailsPdf(pdf_file):
         2: (name, standard, ifsc, acc_no, holder, branch)
     }
     """
-    with pdfplumber.open(pdf_file) as pdf:
-        data = {}
-        i = -1
-        for page in pdf.pages:
-            # Generate CSV list from PDF table
-            table = page.extract_table()
-            if table:
-                for row in table:
-                    # Replace \n substring with space
-                    cleaned_row = []
-                    for cell in row:
-                        if isinstance(cell, str):
-                            cleaned_row.append(cell.replace('\n', ' '))
-                        else:
-                            cleaned_row.append(cell)
-
-                    name = cleaned_row[0]
-                    standard = cleaned_row[1]
-                    ifsc = cleaned_row[2]
-                    acc_no = cleaned_row[3]
-                    holder = cleaned_row[4]
-                    branch = cleaned_row[5]
-
-                    # Extracted data
-                    if name:  # For avoiding empty rows
-                        data[i] = name, standard, ifsc, acc_no, holder, branch
-                        i = i + 1
+    pages = extractPdfPages(pdf_file, text=False)
+    return readStudentDetailsPdf(pages)
+
+
+def readStudentDetailsPdf(pages):
+    """
+    Parameter: Pages from extractPdfPages()
+    Returns: A dictionary of tuples with Student details
+             (see getStudentDetailsPdf)
+    """
+    data = {}
+    i = -1
+    for _, table in pages:
+        # CSV list from PDF table
+        if table:
+            for row in table:
+                # Replace \n substring with space
+                cleaned_row = []
+                for cell in row:
+                    if isinstance(cell, str):
+                        cleaned_row.append(cell.replace('\n', ' '))
+                    else:
+                        cleaned_row.append(cell)
+
+                name = cleaned_row[0]
+                standard = cleaned_row[1]
+                ifsc = cleaned_row[2]
+                acc_no = cleaned_row[3]
+                holder = cleaned_row[4]
+                branch = cleaned_row[5]
+
+                # Extracted data
+                if name:  # For avoiding empty rows
+                    data[i] = name, standard, ifsc, acc_no, holder, branch
+                    i = i + 1
 
     # Removes unwanted Header data
     data.pop(-1)
@@ -1223,20 +1813,26 @@ def getInstitutionDetailsPdf(pdf_file):
         "email": email_id
     }
     """
+    pages = extractPdfPages(pdf_file, tables=False)
+    return readInstitutionDetailsPdf(pages)
+
+
+def readInstitutionDetailsPdf(pages):
+    """
+    Parameters: Pages from extractPdfPages()
+    Returns: Dictionary of Institution Details (see getInstitutionDetailsPdf)
+    """
     institution_details = ""
     name_of_institution = ""
     place = ""
     phone_number = ""
     email_id = ""
 
-    with pdfplumber.open(pdf_file) as pdf:
-        for page in pdf.pages:
-            # Extract PDF as text
-            text = page.extract_text()
-            if "Institution Details" in text:
-                start = text.index("Name of the Institution")
-                end = text.index("Student Details")
-                institution_details = text[start:end]
+    for text, _ in pages:
+        if "Institution Details" in text:
+            start = text.index("Name of the Institution")
+            end = text.index("Student Details")
+            institution_details = text[start:end]
 
     # Splitting text at '\n' into a list
     lines = institution_details.split('\n')
@@ -1267,6 +1863,250 @@ def getInstitutionDetailsPdf(pdf_file):
     return data
 
 
+# Spreadsheets sent instead of the template: a few "key: value" rows
+# with institution details, then a header row and one row per student
+TABULAR_HEADER_ALIASES = {
+    "name": [
+        "student name", "name of student", "name of the student", "name",
+        "students name", "student",
+    ],
+    "standard": ["class", "std", "standard", "class/course", "course"],
+    "ifsc": ["ifsc", "ifsc code", "ifsc no", "ifsccode"],
+    "acc_no": [
+        "account no", "account number", "acc no", "a/c no", "ac no",
+        "bank account number", "bank account no", "account",
+    ],
+    "holder": [
+        "holder", "account holder", "name of account holder", "acc holder",
+        "account holder name", "a/c holder",
+    ],
+    "branch": ["branch", "bank branch", "branch name", "name of branch"],
+}
+TABULAR_REQUIRED = ["name", "standard", "ifsc", "acc_no"]
+
+TABULAR_INSTITUTION_ALIASES = {
+    "name": [
+        "name of the institution", "name of institution", "institution",
+        "institution name", "school", "school name",
+    ],
+    "place": ["place"],
+    "number": ["phone number", "phone", "phone no", "contact number"],
+    "email": ["email id", "email", "e-mail", "email address"],
+}
+
+TABULAR_HEADER_INDEX = {}
+for key, aliases in TABULAR_HEADER_ALIASES.items():
+    for alias in aliases:
+        TABULAR_HEADER_INDEX[alias] = key
+
+TABULAR_INSTITUTION_INDEX = {}
+for key, aliases in TABULAR_INSTITUTION_ALIASES.items():
+    for alias in aliases:
+        TABULAR_INSTITUTION_INDEX[alias] = key
+
+
+def normalizeTabularKey(text):
+    """
+    Returns: Header / key cell lowercased with "." ":" "_" dropped and
+             spaces collapsed ("Acc. No:" -> "acc no")
+    """
+    text = text.lower().replace(".", " ").replace(":", " ").replace("_", " ")
+    return " ".join(text.split())
+
+
+def convertCellToText(value):
+    """
+    Returns: Spreadsheet cell as the text a docx form would have held
+    """
+    if value is None:
+        return ""
+    if isinstance(value, float) and value.is_integer():
+        # Account numbers typed into Excel come back as floats
+        return str(int(value))
+    if isinstance(value, (datetime.datetime, datetime.date)):
+        return value.isoformat()
+    return str(value)
+
+
+def iterTabularRows(file):
+    """
+    Parameter: Spreadsheet (.xlsx) or .csv file
+    Yields: Each row as a list of cell strings, without loading the sheet
+
+    Xlsx is read from the first sheet in openpyxl read-only mode, CSV as
+    UTF-8 or else cp1252 (see parserRegistry.getCsvEncoding).
+    """
+    if not zipfile.is_zipfile(file):
+        encoding = parserRegistry.getCsvEncoding(file)
+        with open(file, mode="r", encoding=encoding, newline="") as f:
+            # Excel saves ";" separated CSV in some locales. Rows differ in
+            # width (key/value rows vs table), so csv.Sniffer gives up.
+            sample = f.read(4096)
+            f.seek(0)
+            delimiter = max(",;\t", key=sample.count)
+            for row in csv.reader(f, delimiter=delimiter):
+                yield row
+        return
+
+    workbook = openpyxl.load_workbook(file, read_only=True, data_only=True)
+    try:
+        sheet = workbook.worksheets[0]
+        for row in sheet.iter_rows(values_only=True):
+            yield [convertCellToText(value) for value in row]
+    finally:
+        workbook.close()
+
+
+def getTabularHeader(row):
+    """
+    Parameter: Row of cell strings
+    Returns: {"name": 0, "standard": 1, ...} column positions if the row is
+             the student table header, else None
+    """
+    header = {}
+    for position, text in enumerate(row):
+        key = TABULAR_HEADER_INDEX.get(normalizeTabularKey(text))
+        if key is not None and key not in header:
+            header[key] = position
+    if all(key in header for key in TABULAR_REQUIRED):
+        return header
+    return None
+
+
+def getTabularKeyValue(row):
+    """
+    Parameter: Row of cell strings
+    Returns: (key, value) of an institution detail row, key None otherwise.
+             Accepts "Place" | "Kochi" and "Place: Kochi" in one cell.
+    """
+    cells = [text.strip() for text in row if text.strip() != ""]
+    if not cells:
+        return None, ""
+    if len(cells) == 1 and ":" in cells[0]:
+        key, value = cells[0].split(":", 1)
+    elif len(cells) >= 2:
+        key, value = cells[0], cells[1]
+    else:
+        return None, ""
+    key = TABULAR_INSTITUTION_INDEX.get(normalizeTabularKey(key))
+    return key, value.strip()
+
+
+def readTabularForm(file):
+    """
+    Parameter: Spreadsheet (.xlsx) or .csv file
+    Returns: (status, errors, institution, students) from one pass
+        - status, errors: Format check (see checkDocxFormat)
+        - institution: see getInstitutionDetails
+        - students: see getStudentDetails, every cell as text
+    """
+    institution = {"name": "", "place": "", "number": "", "email": ""}
+    found = set()
+    header = None
+    data = {}
+    i = 0
+
+    for row in iterTabularRows(file):
+        if header is None:
+            header = getTabularHeader(row)
+            if header is None:
+                key, value = getTabularKeyValue(row)
+                if key is not None and key not in found:
+                    institution[key] = value
+                    found.add(key)
+            continue
+
+        student = []
+        for key in STUDENT_COLUMNS:
+            position = header.get(key)
+            if position is None or position >= len(row):
+                student.append("")
+            else:
+                student.append(row[position])
+
+        name = student[0]
+        # Blank rows and header rows repeated on every printed page
+        if name.strip() == "" or getTabularHeader(row) is not None:
+            continue
+        data[i] = tuple(student)
+        i = i + 1
+
+    errors = []
+    if "name" not in found:
+        errors.append("Heading not found: Name of the Institution")
+    if "place" not in found:
+        errors.append("Entry not found: Place")
+    if "number" not in found:
+        errors.append("Entry not found: Number")
+    if "email" not in found:
+        errors.append("Entry not found: Email")
+    if header is None:
+        errors.append("Header not found: Student Name, Class, IFSC, Account No")
+
+    status = not errors
+    return status, errors, institution, data
+
+
+def parseTabularForm(file):
+    """
+    Parameter: Spreadsheet (.xlsx) or .csv file
+    Returns: Parsed form (see parseForm)
+    """
+    status, errors, institution, students = readTabularForm(file)
+    form = {
+        "format": status,
+        "format_errors": errors,
+        "institution": {},
+        "students": {},
+    }
+    if status:
+        form["institution"] = institution
+        form["students"] = students
+    return form
+
+
+def getInstitutionDetailsTabular(file):
+    """
+    Parameter: Spreadsheet (.xlsx) or .csv file
+    Returns: Dictionary of Institution Details (see getInstitutionDetails)
+    """
+    _, _, institution, _ = readTabularForm(file)
+    return institution
+
+
+def getStudentDetailsTabular(file):
+    """
+    Parameter: Spreadsheet (.xlsx) or .csv file
+    Returns: A dictionary of tuples with Student details
+             (see getStudentDetails)
+    """
+    _, _, _, students = readTabularForm(file)
+    return students
+
+
+# Cheapest formats first: zip member checks before the text heuristic
+parserRegistry.registerParser(
+    "docx", parserRegistry.isDocx, parseDocxForm,
+    getInstitutionDetailsDocx, getStudentDetailsDocx,
+    cost=parserRegistry.COST_CHEAP,
+)
+parserRegistry.registerParser(
+    "xlsx", parserRegistry.isXlsx, parseTabularForm,
+    getInstitutionDetailsTabular, getStudentDetailsTabular,
+    cost=parserRegistry.COST_MEDIUM,
+)
+parserRegistry.registerParser(
+    "pdf", parserRegistry.isPdf, parsePdfForm,
+    getInstitutionDetailsPdf, getStudentDetailsPdf,
+    cost=parserRegistry.COST_HEAVY,
+)
+parserRegistry.registerParser(
+    "csv", parserRegistry.isCsv, parseTabularForm,
+    getInstitutionDetailsTabular, getStudentDetailsTabular,
+    cost=parserRegistry.COST_CHEAP,
+)
+
+
 # ======================== [ @VALIDATION_FUNCTIONS ] ======================== #
 
 
@@ -1290,27 +2130,32 @@ def correctFormat(file):
     """
     Returns True if file is in correct Format
     """
-    data = False
-    try:
-        _, file_extension = os.path.basename(file).split(".")
+    # Format check result is part of the cached parse (see parseForm)
+    form = parseForm(file)
+    printFormatErrors(form)
+    return form["format"]
 
-        if file_extension == "docx":
-            docx_file = file
-            data = correctDocxFormat(docx_file)
 
-        if file_extension == "pdf":
-            pdf_file = file
-            data = correctPdfFormat(pdf_file)
+def correctPdfFormat(pdf_file):
+    """
+    Returns True if PDF is in correct Format
+    """
+    pages = extractPdfPages(pdf_file)
+    status, errors = checkPdfFormat(pages)
 
-    except ValueError:
-        print("⚠️ ValueError: Possible dot in file name")
+    # Logs
+    for error in errors:
+        print(error)
 
-    return data
+    return status
 
 
-def correctPdfFormat(pdf_file):
+def checkPdfFormat(pages):
     """
-    Returns True if PDF is in correct Format
+    Parameter: Pages from extractPdfPages()
+    Returns: (status, errors)
+        - status: True if PDF is in correct Format
+        - errors: List of log messages for missing entries
     """
     flags = {
         "Institution Heading": False,
@@ -1319,54 +2164,68 @@ def correctPdfFormat(pdf_file):
         "Student Table": False
     }
     try:
-        with pdfplumber.open(pdf_file) as pdf:
-            for page in pdf.pages:
+        for text, table in pages:
 
-                # ====== TEXT PARAGRAPH STARTS ====== #
-                text = page.extract_text()
+            # ====== TEXT PARAGRAPH STARTS ====== #
 
-                # Check Heading: Institution Details
-                if "Institution Details" in text:
-                    flags["Institution Heading"] = True
+            # Check Heading: Institution Details
+            if "Institution Details" in text:
+                flags["Institution Heading"] = True
 
-                    # Check Length: Institution Details
-                    start = text.index("Name of the Institution")
-                    end = text.index("Student Details")
-                    institution_details = text[start:end].splitlines()
-                    if len(institution_details) == 4:
-                        flags["Institution Lines"] = True
+                # Check Length: Institution Details
+                start = text.index("Name of the Institution")
+                end = text.index("Student Details")
+                institution_details = text[start:end].splitlines()
+                if len(institution_details) == 4:
+                    flags["Institution Lines"] = True
 
-                # Check Heading: Student Details
-                if "Student Details" in text:
-                    flags["Student Heading"] = True
+            # Check Heading: Student Details
+            if "Student Details" in text:
+                flags["Student Heading"] = True
 
-                # =========== TABLE STARTS =========== #
-                table = page.extract_table()
+            # =========== TABLE STARTS =========== #
 
-                # Check Content: Student Table
-                if table:
-                    flags["Student Table"] = True
+            # Check Content: Student Table
+            if table:
+                flags["Student Table"] = True
     except ValueError:
         pass
 
-    # Logs
+    errors = []
     if flags["Institution Heading"] is False:
-        print("Heading not found: Institution Details")
+        errors.append("Heading not found: Institution Details")
     if flags["Institution Lines"] is False:
-        print("Data Incomplete: Institution Details")
+        errors.append("Data Incomplete: Institution Details")
     if flags["Student Heading"] is False:
-        print("Heading not found: Student Details")
+        errors.append("Heading not found: Student Details")
     if flags["Student Table"] is False:
-        print("Object not found: Student Table")
+        errors.append("Object not found: Student Table")
 
     status = all(flags.values())
-    return status
+    return status, errors
 
 
 def correctDocxFormat(docx_file):
     """
     Returns True if DOCX is in correct Format
     """
+    doc = docx.Document(docx_file)
+    status, errors = checkDocxFormat(doc)
+
+    # Logs
+    for error in errors:
+        print(error)
+
+    return status
+
+
+def checkDocxFormat(doc):
+    """
+    Parameter: Parsed docx.Document
+    Returns: (status, errors)
+        - status: True if DOCX is in correct Format
+        - errors: List of log messages for missing entries
+    """
     inside_institution_details = False
     flags = {
         "name": False,
@@ -1374,7 +2233,6 @@ def correctDocxFormat(docx_file):
         "number": False,
         "email": False,
     }
-    doc = docx.Document(docx_file)
     for paragraph in doc.paragraphs:
         text = paragraph.text
         if text.startswith("Institution Details"):
@@ -1389,18 +2247,18 @@ def correctDocxFormat(docx_file):
             if text.startswith("Email Id"):
                 flags["email"] = True
 
-    # Logs
+    errors = []
     if flags["name"] is False:
-        print("Heading not found: Name of the Institution")
+        errors.append("Heading not found: Name of the Institution")
     if flags["place"] is False:
-        print("Entry not found: Place")
+        errors.append("Entry not found: Place")
     if flags["number"] is False:
-        print("Entry not found: Number")
+        errors.append("Entry not found: Number")
     if flags["email"] is False:
-        print("Entry not found: Email")
+        errors.append("Entry not found: Email")
 
     status = all(flags.values())
-    return status
+    return status, errors
 
 
 # ========================== [ @OTHER_FUNCTIONS ] ========================== #
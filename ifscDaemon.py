@@ -0,0 +1,305 @@
+from pathlib import Path            # OS Independent filepath
+import socketserver     # Unix socket server
+import subprocess       # Starting daemon in background
+import threading        # Idle watcher / client lock
+import socket           # Unix socket client
+import json             # Line protocol
+import time             # Idle tracking
+import sys              # Interpreter path and exit
+import os               # Stale socket cleanup
+import ifscDataset
+import config as cfg
+
+# Protocol: one JSON object per line in each direction
+#   -> {"op": "ping"}
+#   <- {"ok": true, "rows": 177000}
+#   -> {"op": "get", "codes": ["SBIN0001234", ...], "columns": ["Branch"]}
+#   <- {"ok": true, "rows": {"SBIN0001234": {"Branch": "..."}, ...}}
+
+
+def isSupported():
+    """
+    Returns True if this platform has Unix domain sockets
+    """
+    return hasattr(socket, "AF_UNIX")
+
+
+# =========================== [ @SERVER_FUNCTIONS ] =========================== #
+
+
+class IfscDaemonState:
+    """
+    Dataset held by the daemon, reloaded when IFSC.csv changes on disk
+    """
+
+    def __init__(self, csv_file):
+        self.csv_file = csv_file
+        self.lock = threading.Lock()
+        self.stamp = None
+        self.dataset = {}
+        self.last_used = time.monotonic()
+        self.reload()
+
+    def reload(self):
+        stamp = ifscDataset.getFileStamp(self.csv_file)
+        if stamp != self.stamp:
+            self.dataset = ifscDataset.loadIfscDatasetCached(self.csv_file)
+            self.stamp = stamp
+
+    def lookup(self, codes, columns=None):
+        with self.lock:
+            self.last_used = time.monotonic()
+            self.reload()
+            dataset = self.dataset
+
+        rows = {}
+        for ifsc in codes:
+            row = dataset.get(ifsc)
+            if row is not None and columns:
+                row = {key: row[key] for key in columns if key in row}
+            rows[ifsc] = row
+        return rows
+
+
+class IfscRequestHandler(socketserver.StreamRequestHandler):
+
+    def handle(self):
+        state = self.server.state
+        for line in self.rfile:
+            try:
+                request = json.loads(line)
+                op = request.get("op")
+                if op == "ping":
+                    response = {"ok": True, "rows": len(state.dataset)}
+                elif op == "get":
+                    rows = state.lookup(
+                        request.get("codes", []), request.get("columns")
+                    )
+                    response = {"ok": True, "rows": rows}
+                else:
+                    response = {"ok": False, "error": f"Unknown op: {op}"}
+            except (ValueError, AttributeError) as e:
+                response = {"ok": False, "error": str(e)}
+
+            self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+            self.wfile.flush()
+
+
+class IfscDaemonServer(socketserver.ThreadingMixIn,
+                       socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def isDaemonRunning(socket_path):
+    """
+    Returns True if a daemon answers on socket_path
+    """
+    client = IfscDaemonStore.connect(socket_path)
+    if client is None:
+        return False
+    client.close()
+    return True
+
+
+def serveIfsc(csv_file, socket_path, idle_timeout):
+    """
+    Parameters: (csv_file, socket_path, idle_timeout)
+        - csv_file: CSV Dataset from RazorPay
+        - socket_path: Unix socket to listen on
+        - idle_timeout: Seconds without requests before shutting down
+    """
+    socket_path = str(socket_path)
+    if isDaemonRunning(socket_path):
+        print("ℹ️ IFSC daemon already running")
+        return
+
+    # Left behind by a daemon that did not shut down cleanly
+    if os.path.exists(socket_path):
+        os.unlink(socket_path)
+
+    state = IfscDaemonState(csv_file)
+    server = IfscDaemonServer(socket_path, IfscRequestHandler)
+    server.state = state
+
+    def watchIdle():
+        while True:
+            time.sleep(min(60, idle_timeout))
+            if time.monotonic() - state.last_used > idle_timeout:
+                server.shutdown()
+                return
+
+    threading.Thread(target=watchIdle, daemon=True).start()
+
+    print(f"🔵 IFSC daemon serving {len(state.dataset)} rows on {socket_path}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("Caught the Keyboard Interrupt ;D")
+    finally:
+        server.server_close()
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+        print("🔵 IFSC daemon stopped")
+
+
+def startIfscDaemon():
+    """
+    Starts the daemon as a detached background process
+    """
+    subprocess.Popen(
+        [sys.executable, str(Path(__file__).resolve())],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+
+
+# =========================== [ @CLIENT_FUNCTIONS ] =========================== #
+
+
+class IfscDaemonStore:
+    """
+    Client side of the daemon with the dataset .get(ifsc) interface.
+
+    prefetch(codes) resolves a whole form in one round trip; rows are
+    memoized so the following .get() calls stay in process.
+
+    If the daemon stops answering mid-session, fallback() loads the
+    dataset in process and every later lookup goes there instead.
+    """
+
+    def __init__(self, sock, columns=None, fallback=None):
+        self.sock = sock
+        self.file = sock.makefile("rwb")
+        self.columns = list(columns) if columns else None
+        self.cache = {}
+        self.lock = threading.Lock()
+        self.fallback = fallback
+        self.local = None
+
+    @classmethod
+    def connect(cls, socket_path, columns=None, fallback=None,
+                timeout=2.0, request_timeout=120.0):
+        """
+        Parameters: (socket_path, columns, fallback, timeout, request_timeout)
+            - timeout: Connect and ping, a missing daemon fails fast
+            - request_timeout: Later requests, the daemon may be reloading
+              a changed CSV
+        Returns: IfscDaemonStore, or None if no daemon is listening
+        """
+        if not isSupported():
+            return None
+        try:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.settimeout(timeout)
+            sock.connect(str(socket_path))
+        except OSError:
+            return None
+
+        store = cls(sock, columns, fallback)
+        try:
+            store.send({"op": "ping"})
+        except (OSError, ValueError):
+            store.close()
+            return None
+        sock.settimeout(request_timeout)
+        return store
+
+    def send(self, payload):
+        with self.lock:
+            self.file.write(json.dumps(payload).encode("utf-8") + b"\n")
+            self.file.flush()
+            line = self.file.readline()
+        if not line:
+            raise ConnectionError("IFSC daemon closed the connection")
+        response = json.loads(line)
+        if not response.get("ok"):
+            raise ValueError(response.get("error"))
+        return response
+
+    def request(self, payload):
+        """
+        Returns: Daemon response, None once switched to the in-process
+                 dataset because the daemon is gone or timed out
+        """
+        try:
+            return self.send(payload)
+        except OSError as e:
+            if self.fallback is None:
+                raise
+            self.useLocal(e)
+            return None
+
+    def useLocal(self, error):
+        with self.lock:
+            if self.local is None:
+                print(f"⚠️ IFSC daemon unavailable ({error}), loading in process")
+                self.local = self.fallback()
+        self.close()
+
+    def prefetch(self, codes):
+        if self.local is not None:
+            return
+        codes = [
+            ifsc for ifsc in dict.fromkeys(codes)
+            if type(ifsc) is str and ifsc not in self.cache
+        ]
+        if codes:
+            payload = {"op": "get", "codes": codes, "columns": self.columns}
+            response = self.request(payload)
+            if response is not None:
+                self.cache.update(response["rows"])
+
+    def get(self, ifsc, default=None):
+        if type(ifsc) is not str:
+            return default
+        if ifsc not in self.cache:
+            self.prefetch([ifsc])
+        if self.local is not None and ifsc not in self.cache:
+            return self.local.get(ifsc, default)
+        row = self.cache.get(ifsc)
+        if row is None:
+            return default
+        return row
+
+    def __contains__(self, ifsc):
+        return self.get(ifsc) is not None
+
+    def close(self):
+        try:
+            self.file.close()
+            self.sock.close()
+        except OSError:
+            pass
+
+
+def connectIfscDaemon(socket_path, columns=None, autostart=True,
+                      fallback=None):
+    """
+    Parameters: (socket_path, columns, autostart, fallback)
+        - fallback: fallback() -> dataset, used if the daemon goes away
+    Returns: IfscDaemonStore, or None if the daemon is not running.
+             With autostart, a missing daemon is started in the background
+             so the next command finds it loaded.
+    """
+    store = IfscDaemonStore.connect(socket_path, columns, fallback)
+    if store is None and autostart and isSupported():
+        print("ℹ️ Starting IFSC daemon for next runs")
+        startIfscDaemon()
+    return store
+
+
+def main():
+    var = cfg.initVarCommon()
+    if not isSupported():
+        sys.exit("Error: Unix domain sockets not supported on this platform")
+    serveIfsc(
+        var["ifsc_dataset_path"],
+        var["ifsc_socket_path"],
+        var["ifsc_daemon_idle_timeout"],
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,1011 @@
+from pathlib import Path            # OS Independent filepath
+import hashlib      # CSV content hashing
+import pickle       # Fast binary serialization
+import csv          # CSV file manipulation
+import os           # File stats and atomic replace
+import gc           # Pausing GC during bulk loads
+import sqlite3      # Indexed IFSC lookups
+import threading    # Shared lookup connection
+import struct       # Fixed-width index records
+import mmap         # Shared read-only index pages
+from array import array     # Compact integer columns
+from collections import Counter     # Most Common Value
+import datetime     # ISO Date format
+import shutil       # Copying files
+import json         # Dataset version record
+import config as cfg
+
+
+# Bump on any change to the snapshot layout to force a rebuild
+SNAPSHOT_VERSION = 2
+# Bump on any change to the SQLite index schema to force a rebuild
+INDEX_VERSION = 2
+# Bump on any change to the mmap index layout to force a rebuild
+MMAP_VERSION = 2
+
+# mmap index layout:
+#   header:  magic, version, count, csv_size, csv_mtime_ns, csv_sha256
+#   entries: count * (ifsc, offset, length), sorted by ifsc
+#   data:    UTF-8 row fields separated by MMAP_FIELD_SEP
+MMAP_MAGIC = b"IFSCIDX\0"
+MMAP_HEADER = struct.Struct("<8sHIQq32s")
+MMAP_ENTRY = struct.Struct("<11sQI")
+MMAP_KEY_SIZE = 11
+MMAP_FIELD_SEP = "\x1f"
+
+# Dataset columns: (key in dataset, column in RazorPay CSV)
+IFSC_COLUMNS = (
+    ('Bank', 'BANK'),
+    ('Branch', 'BRANCH'),
+    ('Centre', 'CENTRE'),
+    ('District', 'DISTRICT'),
+    ('State', 'STATE'),
+    ('Address', 'ADDRESS'),
+    ('City', 'CITY'),
+)
+
+# Columns computed once per IFSC at build time: (key in dataset, None)
+IFSC_DERIVED_COLUMNS = (
+    ('ResolvedDistrict', None),
+)
+
+IFSC_DATASET_COLUMNS = IFSC_COLUMNS + IFSC_DERIVED_COLUMNS
+DERIVED_KEYS = {key for key, _ in IFSC_DERIVED_COLUMNS}
+
+
+# ============================ [ @CSV_FUNCTIONS ] ============================ #
+
+
+def getProjection(columns=None):
+    """
+    Parameter: Iterable of dataset keys to keep, None keeps all
+    Returns: Tuple of (key in dataset, column in RazorPay CSV) pairs,
+             in IFSC_DATASET_COLUMNS order (column is None if derived)
+    """
+    if columns is None:
+        return IFSC_DATASET_COLUMNS
+    columns = set(columns)
+    unknown = columns - {key for key, _ in IFSC_DATASET_COLUMNS}
+    if unknown:
+        raise ValueError(f"Unknown IFSC columns: {sorted(unknown)}")
+    return tuple((k, c) for k, c in IFSC_DATASET_COLUMNS if k in columns)
+
+
+def iterIfscCsv(csv_file, projection=IFSC_DATASET_COLUMNS):
+    """
+    Parameters: (csv_file, projection)
+        - csv_file: CSV Dataset from RazorPay
+        - projection: Output of getProjection()
+
+    Yields: (ifsc, [value, ...]) with values in projection order.
+    Only the projected columns are picked out of each parsed row,
+    derived columns are computed from the full row.
+    """
+    derived = any(column is None for _, column in projection)
+    district_list = cfg.loadDistrictDataset()
+
+    with open(csv_file, mode='r', encoding='utf-8') as file:
+        reader = csv.reader(file)
+        header = next(reader, [])
+        width = len(header)
+        ifsc_position = header.index('IFSC')
+        positions = [
+            header.index(column) if column else None
+            for _, column in projection
+        ]
+        raw_positions = [(k, header.index(c)) for k, c in IFSC_COLUMNS]
+
+        for row in reader:
+            if len(row) < width:
+                # Short row: missing fields read as "", like a blank cell
+                row = row + [""] * (width - len(row))
+
+            if derived:
+                ifsc_info = {key: row[i] for key, i in raw_positions}
+                resolved = resolveDistrict(ifsc_info, district_list)
+                values = [
+                    row[i] if i is not None else resolved for i in positions
+                ]
+            else:
+                values = [row[i] for i in positions]
+            yield row[ifsc_position], values
+
+
+def readIfscCsv(csv_file, columns=None):
+    """
+    Parameters: (csv_file, columns)
+        - csv_file: CSV Dataset from RazorPay
+        - columns: Dataset keys to keep (eg: ["Branch"]), None keeps all
+
+    Returns: Dataset Dictionary loaded into memory
+
+    dataset[row['IFSC']] = {
+        'Bank': row['BANK'],
+        'Branch': row['BRANCH'],
+        'Centre': row['CENTRE'],
+        'District': row['DISTRICT'],
+        'State': row['STATE'],
+        'Address': row['ADDRESS'],
+        'City': row['CITY'],
+        'ResolvedDistrict': resolveDistrict(row),
+    }
+    """
+    projection = getProjection(columns)
+    keys = [key for key, _ in projection]
+    dataset = {}
+    for ifsc, values in iterIfscCsv(csv_file, projection):
+        dataset[ifsc] = dict(zip(keys, values))
+    return dataset
+
+
+def resolveDistrict(ifsc_info, district_list):
+    """
+    Parameters: (ifsc_info, district_list)
+        - ifsc_info: Dataset row with the RazorPay columns
+        - district_list: Canonical district names
+
+    Returns: District as a String, canonical name if it is one of
+             district_list, else the best raw guess
+    """
+    canonical = {item.lower(): item for item in district_list}
+
+    # District Finder (Initial Algorithm)
+    district = ifsc_info.get("District", "")
+    district = canonical.get(district.lower(), district)
+
+    # District Finder v2.0 (New Algorithm)
+    if district not in district_list:
+        count = Counter(
+            value for key, value in ifsc_info.items()
+            if key not in DERIVED_KEYS
+        )
+        district = count.most_common(1)[0][0]
+        district = canonical.get(district.lower(), district)
+
+    # District Finder v1.0 (Fallback)
+    if district not in district_list:
+        address = ifsc_info.get("Address", "").lower()
+        for item in district_list:
+            if item.lower() in address:
+                district = item
+
+    return district
+
+
+def getFileStamp(file):
+    """
+    Parameter: Path to a file
+    Returns: (size, mtime_ns) used for cheap change detection
+    """
+    stat = os.stat(file)
+    return stat.st_size, stat.st_mtime_ns
+
+
+def getFileHash(file):
+    """
+    Parameter: Path to a file
+    Returns: SHA-256 hex digest of file contents
+    """
+    sha = hashlib.sha256()
+    with open(file, mode='rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            sha.update(chunk)
+    return sha.hexdigest()
+
+
+# ========================= [ @SNAPSHOT_FUNCTIONS ] ========================= #
+
+
+def getSnapshotPath(csv_file, columns=None):
+    """
+    Parameters: (csv_file, columns)
+    Returns: Path to the compiled snapshot stored next to the CSV
+             (IFSC.snapshot, or eg: IFSC.Branch.snapshot for a projection)
+    """
+    csv_file = Path(csv_file)
+    projection = getProjection(columns)
+    if projection == IFSC_DATASET_COLUMNS:
+        return csv_file.with_suffix(".snapshot")
+    tag = "-".join(key for key, _ in projection)
+    return csv_file.with_name(f"{csv_file.stem}.{tag}.snapshot")
+
+
+def readSnapshotHeader(snapshot_file):
+    """
+    Parameter: Path to snapshot file
+    Returns: Header dictionary, or None if missing / unreadable
+
+    header = {
+        "version": SNAPSHOT_VERSION,
+        "size": csv_size,
+        "mtime_ns": csv_mtime_ns,
+        "sha256": csv_hash,
+    }
+    """
+    try:
+        with open(snapshot_file, mode='rb') as f:
+            header = pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError, ValueError, TypeError):
+        return None
+    if not isinstance(header, dict):
+        return None
+    if header.get("version") != SNAPSHOT_VERSION:
+        return None
+    return header
+
+
+def writeSnapshot(snapshot_file, header, dataset):
+    """
+    Writes header and dataset into snapshot_file atomically.
+    The header is pickled first so it can be checked without
+    loading the dataset.
+    """
+    snapshot_file = Path(snapshot_file)
+    tmp_file = snapshot_file.with_name(snapshot_file.name + ".tmp")
+    with open(tmp_file, mode='wb') as f:
+        pickle.dump(header, f, protocol=pickle.HIGHEST_PROTOCOL)
+        pickle.dump(dataset, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_file, snapshot_file)
+
+
+def loadSnapshot(snapshot_file):
+    """
+    Parameter: Path to snapshot file
+    Returns: Dataset Dictionary stored in snapshot
+    """
+    with open(snapshot_file, mode='rb') as f:
+        pickle.load(f)  # Skip header
+        # Nothing to collect while building ~170k dicts
+        gc.disable()
+        try:
+            return pickle.load(f)
+        finally:
+            gc.enable()
+
+
+def buildIfscSnapshot(csv_file, snapshot_file=None, columns=None):
+    """
+    Parses csv_file (projected to columns) and compiles it into a snapshot.
+    Returns: Dataset Dictionary parsed from CSV
+    """
+    if snapshot_file is None:
+        snapshot_file = getSnapshotPath(csv_file, columns)
+
+    dataset = readIfscCsv(csv_file, columns)
+    header = getSourceHeader(csv_file, SNAPSHOT_VERSION)
+    try:
+        writeSnapshot(snapshot_file, header, dataset)
+    except OSError as e:
+        print(f"⚠️ Could not write IFSC snapshot: {e}")
+    return dataset
+
+
+def getSourceState(csv_file, header):
+    """
+    Parameters: (csv_file, header)
+        - csv_file: Path to IFSC.csv
+        - header: Stamp dictionary stored alongside a compiled dataset
+
+    Returns:
+        - "fresh": compiled from the current csv_file
+        - "touched": csv_file stamp changed but its contents did not
+        - "stale": missing, outdated or unreadable
+
+    Size and mtime are compared first, the CSV is only hashed when
+    the size matches but the mtime does not.
+    """
+    if header is None:
+        return "stale"
+
+    size, mtime_ns = getFileStamp(csv_file)
+    if header["size"] != size:
+        return "stale"
+    if header["mtime_ns"] == mtime_ns:
+        return "fresh"
+    if header["sha256"] == getFileHash(csv_file):
+        return "touched"
+    return "stale"
+
+
+def getSourceHeader(csv_file, version):
+    """
+    Returns: Stamp dictionary describing the current csv_file
+    """
+    size, mtime_ns = getFileStamp(csv_file)
+    header = {
+        "version": version,
+        "size": size,
+        "mtime_ns": mtime_ns,
+        "sha256": getFileHash(csv_file),
+    }
+    return header
+
+
+def getSnapshotState(csv_file, snapshot_file):
+    """
+    Returns: "fresh", "touched" or "stale" (see getSourceState)
+    """
+    header = readSnapshotHeader(snapshot_file)
+    return getSourceState(csv_file, header)
+
+
+def loadIfscDatasetCached(csv_file, columns=None):
+    """
+    Parameters: (csv_file, columns)
+        - csv_file: CSV Dataset from RazorPay
+        - columns: Dataset keys to keep, None keeps all
+
+    Returns: Dataset Dictionary, loaded from snapshot when it is fresh,
+             otherwise parsed from CSV and compiled into a new snapshot
+    """
+    snapshot_file = getSnapshotPath(csv_file, columns)
+    state = getSnapshotState(csv_file, snapshot_file)
+
+    if state != "stale":
+        try:
+            dataset = loadSnapshot(snapshot_file)
+        except (OSError, EOFError, pickle.UnpicklingError, ValueError):
+            return buildIfscSnapshot(csv_file, snapshot_file, columns)
+
+        # Same contents, touched file: refresh stamp for the next run
+        if state == "touched":
+            header = readSnapshotHeader(snapshot_file)
+            _, header["mtime_ns"] = getFileStamp(csv_file)
+            try:
+                writeSnapshot(snapshot_file, header, dataset)
+            except OSError:
+                pass
+        return dataset
+
+    return buildIfscSnapshot(csv_file, snapshot_file, columns)
+
+
+# ========================== [ @SQLITE_FUNCTIONS ] ========================== #
+
+
+def getIndexPath(csv_file):
+    """
+    Parameter: Path to IFSC.csv
+    Returns: Path to the SQLite index stored next to it (IFSC.sqlite)
+    """
+    return Path(csv_file).with_suffix(".sqlite")
+
+
+def readIndexHeader(index_file):
+    """
+    Parameter: Path to SQLite index
+    Returns: Header dictionary stored in IfscMeta, or None if unusable
+    """
+    if not os.path.exists(index_file):
+        return None
+    try:
+        conn = sqlite3.connect(f"file:{index_file}?mode=ro", uri=True)
+        try:
+            rows = conn.execute("SELECT Key, Value FROM IfscMeta").fetchall()
+        finally:
+            conn.close()
+    except sqlite3.Error:
+        return None
+
+    header = dict(rows)
+    if header.get("version") != INDEX_VERSION:
+        return None
+    return header
+
+
+def buildIfscIndex(csv_file, index_file=None):
+    """
+    Imports csv_file into an indexed SQLite table (IFSC as primary key).
+    The table is built in a temporary file and swapped in atomically.
+    """
+    if index_file is None:
+        index_file = getIndexPath(csv_file)
+
+    index_file = Path(index_file)
+    tmp_file = index_file.with_name(index_file.name + ".tmp")
+    if tmp_file.exists():
+        tmp_file.unlink()
+
+    conn = sqlite3.connect(tmp_file)
+    try:
+        conn.execute("PRAGMA journal_mode = OFF")
+        conn.execute("PRAGMA synchronous = OFF")
+        conn.execute("""
+        CREATE TABLE Ifsc (
+            IFSC TEXT PRIMARY KEY,
+            Bank TEXT,
+            Branch TEXT,
+            Centre TEXT,
+            District TEXT,
+            State TEXT,
+            Address TEXT,
+            City TEXT,
+            ResolvedDistrict TEXT
+        ) WITHOUT ROWID
+        """)
+        conn.execute("CREATE TABLE IfscMeta (Key TEXT PRIMARY KEY, Value)")
+
+        rows = (
+            (ifsc, *values) for ifsc, values in iterIfscCsv(csv_file)
+        )
+        conn.executemany(
+            "INSERT OR REPLACE INTO Ifsc VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            rows
+        )
+
+        header = getSourceHeader(csv_file, INDEX_VERSION)
+        conn.executemany("INSERT INTO IfscMeta VALUES (?, ?)", header.items())
+        conn.commit()
+    finally:
+        conn.close()
+
+    os.replace(tmp_file, index_file)
+
+
+class IfscSqliteStore:
+    """
+    Read-only IFSC lookups against the SQLite index.
+
+    Exposes the same .get(ifsc) interface as the dataset dictionary,
+    so getBranchFromIfsc() / getDistrictFromIfsc() work unchanged.
+    Looked up rows are memoized since a form hits the same IFSC a few times.
+    """
+
+    def __init__(self, index_file):
+        self.index_file = index_file
+        self.conn = sqlite3.connect(
+            f"file:{index_file}?mode=ro", uri=True, check_same_thread=False
+        )
+        self.cache = {}
+        self.lock = threading.Lock()
+
+    def get(self, ifsc, default=None):
+        if ifsc in self.cache:
+            row = self.cache[ifsc]
+        else:
+            with self.lock:
+                cursor = self.conn.execute(
+                    "SELECT * FROM Ifsc WHERE IFSC = ?", (ifsc,)
+                )
+                result = cursor.fetchone()
+            row = None
+            if result:
+                keys = [key for key, _ in IFSC_DATASET_COLUMNS]
+                row = dict(zip(keys, result[1:]))
+            self.cache[ifsc] = row
+
+        if row is None:
+            return default
+        return row
+
+    def __contains__(self, ifsc):
+        return self.get(ifsc) is not None
+
+    def __len__(self):
+        with self.lock:
+            return self.conn.execute("SELECT COUNT(*) FROM Ifsc").fetchone()[0]
+
+    def close(self):
+        self.conn.close()
+
+
+def openIfscSqliteStore(csv_file):
+    """
+    Parameter: CSV Dataset from RazorPay
+    Returns: IfscSqliteStore, (re)importing the CSV if the index is stale
+    """
+    index_file = getIndexPath(csv_file)
+    header = readIndexHeader(index_file)
+    state = getSourceState(csv_file, header)
+
+    if state == "stale":
+        print("ℹ️ Building IFSC index (one time)")
+        buildIfscIndex(csv_file, index_file)
+
+    # Same contents, touched file: refresh stamp for the next run
+    if state == "touched":
+        _, mtime_ns = getFileStamp(csv_file)
+        conn = sqlite3.connect(index_file)
+        try:
+            with conn:
+                conn.execute(
+                    "UPDATE IfscMeta SET Value = ? WHERE Key = 'mtime_ns'",
+                    (mtime_ns,)
+                )
+        except sqlite3.Error:
+            pass
+        finally:
+            conn.close()
+
+    return IfscSqliteStore(index_file)
+
+
+# =========================== [ @MMAP_FUNCTIONS ] =========================== #
+
+
+def getMmapIndexPath(csv_file):
+    """
+    Parameter: Path to IFSC.csv
+    Returns: Path to the sorted fixed-width index stored next to it (IFSC.idx)
+    """
+    return Path(csv_file).with_suffix(".idx")
+
+
+def readMmapHeader(idx_file):
+    """
+    Parameter: Path to mmap index
+    Returns: Header dictionary, or None if missing / unreadable
+    """
+    try:
+        with open(idx_file, mode='rb') as f:
+            raw = f.read(MMAP_HEADER.size)
+    except OSError:
+        return None
+    if len(raw) != MMAP_HEADER.size:
+        return None
+
+    magic, version, count, size, mtime_ns, digest = MMAP_HEADER.unpack(raw)
+    if magic != MMAP_MAGIC or version != MMAP_VERSION:
+        return None
+
+    header = {
+        "version": version,
+        "count": count,
+        "size": size,
+        "mtime_ns": mtime_ns,
+        "sha256": digest.hex(),
+    }
+    return header
+
+
+def packMmapHeader(header):
+    return MMAP_HEADER.pack(
+        MMAP_MAGIC,
+        MMAP_VERSION,
+        header["count"],
+        header["size"],
+        header["mtime_ns"],
+        bytes.fromhex(header["sha256"]),
+    )
+
+
+def buildIfscMmapIndex(csv_file, idx_file=None, dataset=None):
+    """
+    Writes a sorted, fixed-width index of csv_file for binary search
+    over a memory map. Rows keep the IFSC_DATASET_COLUMNS order.
+    """
+    if idx_file is None:
+        idx_file = getMmapIndexPath(csv_file)
+    if dataset is None:
+        dataset = readIfscCsv(csv_file)
+
+    keys = [key for key, _ in IFSC_DATASET_COLUMNS]
+    entries = []
+    for ifsc in dataset:
+        key = ifsc.encode('ascii', errors='replace')
+        if len(key) <= MMAP_KEY_SIZE:
+            entries.append((key.ljust(MMAP_KEY_SIZE, b"\0"), ifsc))
+    entries.sort()
+
+    header = getSourceHeader(csv_file, MMAP_VERSION)
+    header["count"] = len(entries)
+    data_offset = MMAP_HEADER.size + MMAP_ENTRY.size * len(entries)
+
+    idx_file = Path(idx_file)
+    tmp_file = idx_file.with_name(idx_file.name + ".tmp")
+    with open(tmp_file, mode='wb') as f:
+        f.write(packMmapHeader(header))
+
+        records = []
+        offset = data_offset
+        for key, ifsc in entries:
+            row = dataset[ifsc]
+            record = MMAP_FIELD_SEP.join(row[k] for k in keys).encode('utf-8')
+            f.write(MMAP_ENTRY.pack(key, offset, len(record)))
+            records.append(record)
+            offset += len(record)
+
+        for record in records:
+            f.write(record)
+    os.replace(tmp_file, idx_file)
+
+
+class IfscMmapStore:
+    """
+    Read-only IFSC lookups by binary search over a memory-mapped index.
+
+    Only the touched entries are decoded into Python objects, and the
+    mapping is shared through the page cache by every process reading it.
+    Exposes the same .get(ifsc) interface as the dataset dictionary.
+    """
+
+    def __init__(self, idx_file):
+        self.idx_file = idx_file
+        with open(idx_file, mode='rb') as f:
+            self.mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.count = MMAP_HEADER.unpack_from(self.mm, 0)[2]
+        self.keys = [key for key, _ in IFSC_DATASET_COLUMNS]
+
+    def find(self, key):
+        """
+        Parameter: Padded IFSC bytes
+        Returns: (offset, length) of the row record, or None
+        """
+        mm = self.mm
+        low = 0
+        high = self.count
+        while low < high:
+            mid = (low + high) // 2
+            start = MMAP_HEADER.size + mid * MMAP_ENTRY.size
+            mid_key = mm[start:start + MMAP_KEY_SIZE]
+            if mid_key < key:
+                low = mid + 1
+            elif mid_key > key:
+                high = mid
+            else:
+                _, offset, length = MMAP_ENTRY.unpack_from(mm, start)
+                return offset, length
+        return None
+
+    def get(self, ifsc, default=None):
+        if type(ifsc) is not str:
+            return default
+        try:
+            key = ifsc.encode('ascii')
+        except UnicodeEncodeError:
+            return default
+        if len(key) > MMAP_KEY_SIZE:
+            return default
+
+        found = self.find(key.ljust(MMAP_KEY_SIZE, b"\0"))
+        if found is None:
+            return default
+
+        offset, length = found
+        record = self.mm[offset:offset + length].decode('utf-8')
+        return dict(zip(self.keys, record.split(MMAP_FIELD_SEP)))
+
+    def __contains__(self, ifsc):
+        return self.get(ifsc) is not None
+
+    def __len__(self):
+        return self.count
+
+    def close(self):
+        self.mm.close()
+
+
+def openIfscMmapStore(csv_file):
+    """
+    Parameter: CSV Dataset from RazorPay
+    Returns: IfscMmapStore, regenerating the index if it is stale
+    """
+    idx_file = getMmapIndexPath(csv_file)
+    header = readMmapHeader(idx_file)
+    state = getSourceState(csv_file, header)
+
+    if state == "stale":
+        print("ℹ️ Building IFSC mmap index (one time)")
+        buildIfscMmapIndex(csv_file, idx_file)
+
+    # Same contents, touched file: refresh stamp in place for the next run
+    if state == "touched":
+        _, header["mtime_ns"] = getFileStamp(csv_file)
+        try:
+            with open(idx_file, mode='r+b') as f:
+                f.write(packMmapHeader(header))
+        except OSError:
+            pass
+
+    return IfscMmapStore(idx_file)
+
+
+# ========================= [ @COLUMNAR_FUNCTIONS ] ========================= #
+
+
+class IfscColumnarStore:
+    """
+    Compact in-memory IFSC dataset.
+
+    Repetitive columns (Bank, Branch, Centre, District, State, City and
+    ResolvedDistrict) are
+    dictionary-encoded: one list of distinct values plus an integer code
+    per row. Address is kept as a plain list. A single ifsc -> row index
+    replaces the per-row dicts; .get(ifsc) builds the row dict on demand.
+    """
+
+    categorical = (
+        'Bank', 'Branch', 'Centre', 'District', 'State', 'City',
+        'ResolvedDistrict',
+    )
+
+    def __init__(self, projection=IFSC_DATASET_COLUMNS):
+        self.keys = [key for key, _ in projection]
+        self.index = {}
+        self.columns = {}
+        self.values = {}
+        self.lookup = {}
+        for key in self.keys:
+            if key in self.categorical:
+                self.columns[key] = array('I')
+                self.values[key] = []
+                self.lookup[key] = {}
+            else:
+                self.columns[key] = []
+
+    def append(self, ifsc, values):
+        """
+        Parameters: (ifsc, values)
+            - values: Row values in self.keys order
+        """
+        position = self.index.get(ifsc)
+        if position is None:
+            self.index[ifsc] = len(self.index)
+
+        for key, value in zip(self.keys, values):
+            if key in self.lookup:
+                value = self.encode(key, value)
+            if position is None:
+                self.columns[key].append(value)
+            else:
+                # Last row wins, same as the dataset dictionary
+                self.columns[key][position] = value
+
+    def encode(self, key, value):
+        lookup = self.lookup[key]
+        code = lookup.get(value)
+        if code is None:
+            code = len(self.values[key])
+            lookup[value] = code
+            self.values[key].append(value)
+        return code
+
+    def finalize(self):
+        """
+        Drops build-time lookups and narrows codes to the smallest width.
+        """
+        for key in self.values:
+            if len(self.values[key]) <= 0xFFFF:
+                self.columns[key] = array('H', self.columns[key])
+        self.lookup = {}
+        return self
+
+    def get(self, ifsc, default=None):
+        position = self.index.get(ifsc)
+        if position is None:
+            return default
+
+        row = {}
+        for key in self.keys:
+            value = self.columns[key][position]
+            if key in self.values:
+                value = self.values[key][value]
+            row[key] = value
+        return row
+
+    def __contains__(self, ifsc):
+        return ifsc in self.index
+
+    def __len__(self):
+        return len(self.index)
+
+    def __iter__(self):
+        return iter(self.index)
+
+
+def loadIfscColumnarStore(csv_file, columns=None):
+    """
+    Parameters: (csv_file, columns)
+        - csv_file: CSV Dataset from RazorPay
+        - columns: Dataset keys to keep, None keeps all
+
+    Returns: IfscColumnarStore built directly from the CSV rows
+    """
+    projection = getProjection(columns)
+    store = IfscColumnarStore(projection)
+    for ifsc, values in iterIfscCsv(csv_file, projection):
+        store.append(ifsc, values)
+    return store.finalize()
+
+
+# =========================== [ @UPDATE_FUNCTIONS ] =========================== #
+
+
+def getVersionPath(csv_file):
+    """
+    Parameter: Path to IFSC.csv
+    Returns: Path to the dataset version record (IFSC.version.json)
+    """
+    return Path(csv_file).with_suffix(".version.json")
+
+
+def readDatasetVersion(csv_file):
+    """
+    Returns: Dataset version record, or an empty record if none exists
+
+    record = {
+        "version": 3,
+        "sha256": csv_hash,
+        "updated": "2024-06-01",
+        "rows": 177000,
+        "added": 120,
+        "changed": 45,
+        "removed": 8,
+    }
+    """
+    try:
+        with open(getVersionPath(csv_file), mode='r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {"version": 0}
+
+
+def loadCurrentDataset(csv_file):
+    """
+    Returns: Full dataset (with derived columns) for the current csv_file,
+             from the snapshot when it is fresh
+    """
+    if os.path.exists(csv_file):
+        return loadIfscDatasetCached(csv_file)
+    return {}
+
+
+def diffIfscDataset(old_dataset, new_csv):
+    """
+    Parameters: (old_dataset, new_csv)
+        - old_dataset: Full dataset currently in use
+        - new_csv: New RazorPay release
+
+    Returns: (dataset, added, changed, removed)
+        - dataset: Full dataset for new_csv. Rows whose RazorPay columns
+                   did not change keep their stored derived values.
+        - added, changed, removed: Lists of IFSC codes
+    """
+    district_list = cfg.loadDistrictDataset()
+    raw_keys = [key for key, _ in IFSC_COLUMNS]
+
+    dataset = {}
+    added = []
+    changed = []
+    for ifsc, values in iterIfscCsv(new_csv, IFSC_COLUMNS):
+        row = dict(zip(raw_keys, values))
+        old_row = old_dataset.get(ifsc)
+
+        if old_row is None:
+            added.append(ifsc)
+        elif any(old_row.get(key) != row[key] for key in raw_keys):
+            changed.append(ifsc)
+        else:
+            dataset[ifsc] = old_row
+            continue
+
+        row["ResolvedDistrict"] = resolveDistrict(row, district_list)
+        dataset[ifsc] = row
+
+    removed = [ifsc for ifsc in old_dataset if ifsc not in dataset]
+    return dataset, added, changed, removed
+
+
+def patchIfscIndex(csv_file, dataset, upserts, removed, base_state):
+    """
+    Applies added / changed / removed rows to an existing SQLite index
+    and records the new CSV stamp. Returns False if there is no index.
+
+    base_state is getSourceState() of the index against the replaced CSV.
+    The diff only applies to an index built from that CSV, anything else
+    is rebuilt from csv_file.
+    """
+    index_file = getIndexPath(csv_file)
+    if readIndexHeader(index_file) is None:
+        return False
+    if base_state != "fresh":
+        buildIfscIndex(csv_file, index_file)
+        return True
+
+    keys = [key for key, _ in IFSC_DATASET_COLUMNS]
+    header = getSourceHeader(csv_file, INDEX_VERSION)
+    conn = sqlite3.connect(index_file)
+    try:
+        with conn:
+            conn.executemany(
+                "DELETE FROM Ifsc WHERE IFSC = ?",
+                ((ifsc,) for ifsc in removed)
+            )
+            conn.executemany(
+                "INSERT OR REPLACE INTO Ifsc VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                ((ifsc, *(dataset[ifsc][k] for k in keys)) for ifsc in upserts)
+            )
+            conn.executemany(
+                "INSERT OR REPLACE INTO IfscMeta VALUES (?, ?)",
+                header.items()
+            )
+    finally:
+        conn.close()
+    return True
+
+
+def updateIfscDataset(csv_file, new_csv):
+    """
+    Parameters: (csv_file, new_csv)
+        - csv_file: IFSC.csv currently in use
+        - new_csv: New RazorPay release to switch to
+
+    Diffs new_csv against the current dataset, replaces csv_file and brings
+    every compiled form of it up to date without re-resolving districts for
+    untouched codes: snapshots are rewritten from the merged dataset, the
+    SQLite index is patched in place and the mmap index is regenerated.
+
+    Returns: Dataset version record written to IFSC.version.json
+    """
+    csv_file = Path(csv_file)
+    old_dataset = loadCurrentDataset(csv_file)
+    dataset, added, changed, removed = diffIfscDataset(old_dataset, new_csv)
+
+    # Checked before csv_file is replaced, the diff is against its rows
+    index_state = getSourceState(
+        csv_file, readIndexHeader(getIndexPath(csv_file))
+    )
+
+    if Path(new_csv).resolve() != csv_file.resolve():
+        shutil.copyfile(new_csv, csv_file)
+
+    # Snapshots: full dataset plus every projection already in use
+    header = getSourceHeader(csv_file, SNAPSHOT_VERSION)
+    writeSnapshot(getSnapshotPath(csv_file), header, dataset)
+    for snapshot_file in csv_file.parent.glob(f"{csv_file.stem}.*.snapshot"):
+        columns = snapshot_file.name.split(".")[1].split("-")
+        try:
+            projection = getProjection(columns)
+        except ValueError:
+            continue
+        keys = [key for key, _ in projection]
+        projected = {
+            ifsc: {key: row[key] for key in keys}
+            for ifsc, row in dataset.items()
+        }
+        writeSnapshot(snapshot_file, header, projected)
+
+    patchIfscIndex(csv_file, dataset, added + changed, removed, index_state)
+
+    if readMmapHeader(getMmapIndexPath(csv_file)) is not None:
+        buildIfscMmapIndex(csv_file, dataset=dataset)
+
+    record = {
+        "version": readDatasetVersion(csv_file).get("version", 0) + 1,
+        "sha256": header["sha256"],
+        "updated": datetime.date.today().isoformat(),
+        "rows": len(dataset),
+        "added": len(added),
+        "changed": len(changed),
+        "removed": len(removed),
+    }
+    with open(getVersionPath(csv_file), mode='w', encoding='utf-8') as f:
+        json.dump(record, f, indent=4)
+
+    return record
+
+
+# ========================= [ @BACKEND_FUNCTIONS ] ========================= #
+
+
+def loadIfscBackend(csv_file, backend="dict", columns=None):
+    """
+    Parameters: (csv_file, backend, columns)
+        - csv_file: CSV Dataset from RazorPay
+        - backend: "dict" (in-memory snapshot), "sqlite" (indexed reads)
+                   "mmap" (binary search over a shared memory map)
+                   or "columnar" (dictionary-encoded columns in memory)
+        - columns: Dataset keys the caller reads, None keeps all.
+                   On-demand backends (sqlite, mmap) always return full rows.
+
+    Returns: Object with a dict-like .get(ifsc) lookup
+    """
+    if backend == "dict":
+        return loadIfscDatasetCached(csv_file, columns)
+    if backend == "sqlite":
+        return openIfscSqliteStore(csv_file)
+    if backend == "mmap":
+        return openIfscMmapStore(csv_file)
+    if backend == "columnar":
+        return loadIfscColumnarStore(csv_file, columns)
+    raise ValueError(f"Unknown IFSC backend: {backend}")
@@ -0,0 +1,159 @@
+import zipfile      # Docx / xlsx containers
+import codecs       # Incremental CSV decoding
+
+# Form parsers are picked by file contents, not by name, so
+# "St. Mary's H.S.S.docx" or a PDF saved as .docx still parse.
+#
+# Each parser declares a relative cost per file. Batch commands run
+# parsers below var["parser_pool_cost"] inline and send the rest
+# (PDF layout analysis) to a process pool.
+
+HEAD_SIZE = 4096
+
+COST_CHEAP = 1      # Plain XML / text
+COST_MEDIUM = 5     # Spreadsheet cells
+COST_HEAVY = 50     # PDF layout analysis
+
+# Excel on Windows saves "CSV" in the ANSI code page, not UTF-8
+CSV_ENCODINGS = ["utf-8-sig", "cp1252"]
+
+PARSERS = []
+
+
+class FormParser:
+    """
+    A registered form format
+
+        - name: Format name used in logs ("docx")
+        - detect: detect(head, file) -> bool, head is the first HEAD_SIZE bytes
+        - parse: parse(file) -> parsed form (see function.parseForm)
+        - institution: institution(file) -> institution details
+        - students: students(file) -> student details
+        - cost: Relative cost of parsing one file
+    """
+
+    def __init__(self, name, detect, parse, institution, students, cost):
+        self.name = name
+        self.detect = detect
+        self.parse = parse
+        self.institution = institution
+        self.students = students
+        self.cost = cost
+
+
+def registerParser(name, detect, parse, institution, students,
+                   cost=COST_CHEAP):
+    """
+    Adds a form parser, replacing any earlier one with the same name.
+    Parsers are tried in registration order.
+    """
+    parser = FormParser(name, detect, parse, institution, students, cost)
+    for i, registered in enumerate(PARSERS):
+        if registered.name == name:
+            PARSERS[i] = parser
+            return parser
+    PARSERS.append(parser)
+    return parser
+
+
+def readHead(file):
+    with open(file, mode="rb") as f:
+        return f.read(HEAD_SIZE)
+
+
+def detectParser(file):
+    """
+    Parameter: Path to a form
+    Returns: FormParser that recognises the file contents, None if none do
+    """
+    try:
+        head = readHead(file)
+    except OSError:
+        return None
+    for parser in PARSERS:
+        if parser.detect(head, file):
+            return parser
+    return None
+
+
+def splitByCost(file_list, pool_cost):
+    """
+    Parameters: (file_list, pool_cost)
+        - pool_cost: Parsers costing this much or more go to the pool
+    Returns: (inline_files, pool_files), each in file_list order.
+             Unrecognised files stay inline, they fail without parsing.
+    """
+    inline_files = []
+    pool_files = []
+    for file in file_list:
+        parser = detectParser(file)
+        if parser is not None and parser.cost >= pool_cost:
+            pool_files.append(file)
+        else:
+            inline_files.append(file)
+    return inline_files, pool_files
+
+
+# ========================== [ @SIGNATURE_FUNCTIONS ] ========================== #
+
+
+def getZipMembers(file):
+    try:
+        with zipfile.ZipFile(file) as archive:
+            return set(archive.namelist())
+    except (zipfile.BadZipFile, OSError):
+        return set()
+
+
+def isPdf(head, file):
+    # Some generators put a few bytes of junk before the header
+    return b"%PDF-" in head[:1024]
+
+
+def isDocx(head, file):
+    return head.startswith(b"PK\x03\x04") and (
+        "word/document.xml" in getZipMembers(file)
+    )
+
+
+def isXlsx(head, file):
+    return head.startswith(b"PK\x03\x04") and (
+        "xl/workbook.xml" in getZipMembers(file)
+    )
+
+
+def isCsv(head, file):
+    """
+    CSV has no signature: accept readable text with a cell delimiter
+    """
+    if b"\x00" in head:
+        return False
+    for encoding in CSV_ENCODINGS:
+        # Not final: the head may end inside a multi-byte character
+        decoder = codecs.getincrementaldecoder(encoding)()
+        try:
+            text = decoder.decode(head)
+        except UnicodeDecodeError:
+            continue
+        return any(delimiter in text for delimiter in ",;\t")
+    return False
+
+
+def getCsvEncoding(file):
+    """
+    Parameter: Path to a CSV file
+    Returns: First of CSV_ENCODINGS that decodes the whole file, the last
+             one if none do
+    """
+    for encoding in CSV_ENCODINGS[:-1]:
+        decoder = codecs.getincrementaldecoder(encoding)()
+        try:
+            with open(file, mode="rb") as f:
+                for chunk in iter(lambda: f.read(1 << 16), b""):
+                    decoder.decode(chunk)
+            decoder.decode(b"", final=True)
+        except UnicodeDecodeError:
+            continue
+        return encoding
+    return CSV_ENCODINGS[-1]
+
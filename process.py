@@ -6,6 +6,12 @@ import processDatabase
 import riteOfPassage
 import processNEFT
 import processFinal
+import processIfscUpdate
+import ifscDaemon
+import processCache
+import processBatch
+import processWebImport
+import processMigrate
 from sys import exit
 
 command = riteOfPassage.main()
@@ -34,3 +40,31 @@ if command == cmd["excel"]:
 if command == cmd["bank"]:
     processNEFT.main()
     exit(0)
+
+if command == cmd["ifsc_update"]:
+    processIfscUpdate.main()
+    exit(0)
+
+if command == cmd["ifsc_daemon"]:
+    ifscDaemon.main()
+    exit(0)
+
+if command == cmd["cache_clear"]:
+    processCache.clear()
+    exit(0)
+
+if command == cmd["cache_stats"]:
+    processCache.stats()
+    exit(0)
+
+if command == cmd["batch"]:
+    processBatch.main()
+    exit(0)
+
+if command == cmd["web_import"]:
+    processWebImport.main()
+    exit(0)
+
+if command == cmd["migrate"]:
+    processMigrate.main()
+    exit(0)
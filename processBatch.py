@@ -0,0 +1,313 @@
+from concurrent.futures import ProcessPoolExecutor  # Parallel form parsing
+from pathlib import Path    # OS Independent filepath
+import datetime     # Manifest timestamps
+import shutil       # Moving files
+import json         # Review queue manifest
+import time         # Stage timings
+import os           # Worker count
+import function as fn
+import database
+from function import var
+from formPipeline import prepareForm
+import parserRegistry
+
+# IFSC dataset columns read by this command
+IFSC_COLUMNS = ["Branch", "ResolvedDistrict"]
+
+REVIEW_QUEUE = "review_queue.json"
+
+
+# =========================== [ @WORKER_FUNCTIONS ] =========================== #
+
+
+def initWorker():
+    """
+    Loads the IFSC dataset once per worker process
+    """
+    fn.updateIfscInVar(var["ifsc_quick_backend"], IFSC_COLUMNS)
+
+
+def prepareBatchForm(file):
+    """
+    Parameter: Supported File
+    Returns: prepareForm() job with the worker side auto-accept checks
+
+    job["checks"] = {
+        "valid_classes": every class converted to a number,
+        "resolvable_ifsc": every IFSC found in the RazorPay dataset,
+        "known_district": district guess is one of var["district_dataset"],
+    }
+    """
+    job = prepareForm(file)
+
+    # Exceptions may not pickle back to the main process
+    if job["error"] is not None:
+        job["error"] = f"{type(job['error']).__name__}: {job['error']}"
+
+    student_data = job["students"]
+    ifsc_dataset = var["ifsc_dataset"]
+    ifsc_list = fn.getStudentIfscList(student_data)
+    fn.prefetchIfsc(ifsc_dataset, ifsc_list)
+
+    job["bad_classes"] = [
+        value[1] for value in student_data.values()
+        if type(value[1]) is not int
+    ]
+    job["bad_ifsc"] = [
+        ifsc for ifsc in ifsc_list if ifsc_dataset.get(ifsc) is None
+    ]
+    job["checks"] = {
+        "valid_classes": fn.isValidStudentStd(student_data),
+        "resolvable_ifsc": not job["bad_ifsc"],
+        "known_district": isKnownDistrict(job["district_guess"]),
+    }
+    return job
+
+
+def isKnownDistrict(district):
+    # processFinal adds "Unknown" to var["district_dataset"] on import
+    return district != "Unknown" and district in var["district_dataset"]
+
+
+# =========================== [ @REVIEW_FUNCTIONS ] =========================== #
+
+
+def getReviewReasons(job, duplicates):
+    """
+    Parameters: (job, duplicates)
+        - job: prepareBatchForm() job
+        - duplicates: Account numbers already in Database or this batch
+    Returns: List of reasons the form needs an operator, empty to accept
+    """
+    rules = var["batch_rules"]
+    form = job["form"]
+
+    if job["error"] is not None:
+        return [f"Parse error: {job['error']}"]
+    if not form["format"]:
+        return ["Formatting error"] + form["format_errors"]
+
+    reasons = []
+    checks = job["checks"]
+    if rules["valid_classes"] and not checks["valid_classes"]:
+        reasons.append(f"Class not convertible: {job['bad_classes']}")
+    if rules["resolvable_ifsc"] and not checks["resolvable_ifsc"]:
+        reasons.append(f"IFSC not found: {job['bad_ifsc']}")
+    if rules["known_district"] and not checks["known_district"]:
+        reasons.append(f"District not decided: {job['district_guess']}")
+    if rules["no_duplicates"] and duplicates:
+        reasons.append(f"Duplicate accounts: {duplicates}")
+    return reasons
+
+
+def getReviewQueuePath(input_dir):
+    return Path(input_dir) / REVIEW_QUEUE
+
+
+def loadReviewQueue(input_dir):
+    """
+    Returns: Review queue manifest written by the batch command
+
+    queue = {
+        "form.docx": {
+            "reasons": ["IFSC not found: ['SBIN0000000']"],
+            "district_guess": "Ernakulam",
+            "batch": "2024-06-01T10:30:00",
+        }
+    }
+    """
+    manifest = getReviewQueuePath(input_dir)
+    try:
+        with open(manifest, mode="r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def writeReviewQueue(input_dir, queue):
+    manifest = getReviewQueuePath(input_dir)
+    temp_file = manifest.with_suffix(".tmp")
+    with open(temp_file, mode="w", encoding="utf-8") as f:
+        json.dump(queue, f, indent=2, ensure_ascii=False)
+    os.replace(temp_file, manifest)
+
+
+def printReviewReasons(queue, file):
+    """
+    Shows why the batch command left this form for review, if it did
+    """
+    entry = queue.get(os.path.basename(file))
+    if entry is not None:
+        print("📋 Left for review by batch:")
+        for reason in entry["reasons"]:
+            print(f"   - {reason}")
+
+
+# =============================== [ @MAIN ] =============================== #
+
+
+def printStageReport(stages):
+    """
+    Parameter: List of (stage name, files, seconds)
+    """
+    horizontal_line = "-" * 80
+    print(horizontal_line)
+    print("STAGE THROUGHPUT".center(80))
+    print(horizontal_line)
+    for name, files, elapsed in stages:
+        rate = files / elapsed if elapsed > 0 else 0.0
+        line = f"{name:<18}: {files:>5} files {elapsed:7.2f}s {rate:8.1f} files/s"
+        print(line.center(80))
+    print(horizontal_line)
+
+
+def main():
+
+    db_file = var["db_file"]
+    input_dir = var["input_dir"]
+    file_list = fn.getFileList(input_dir, var["form_extensions"])
+    if not file_list:
+        print("ℹ️ No forms to process")
+        return
+
+    # PDF layout analysis goes to the pool, cheap formats run right here
+    inline_files, pool_files = parserRegistry.splitByCost(
+        file_list, var["parser_pool_cost"]
+    )
+    workers = var["batch_workers"] or os.cpu_count() or 1
+    workers = max(1, min(workers, len(pool_files)))
+    stages = []
+
+    # ----------------------------------------------- [ PARSE AND NORMALIZE ]
+
+    print(
+        f"🔵 Preparing {len(inline_files)} forms inline and "
+        f"{len(pool_files)} on {workers} processes"
+    )
+    start = time.perf_counter()
+    prepared = {}
+    if pool_files:
+        pool = ProcessPoolExecutor(workers, initializer=initWorker)
+        chunksize = max(1, len(pool_files) // (workers * 4))
+        pool_jobs = pool.map(prepareBatchForm, pool_files, chunksize=chunksize)
+    if inline_files:
+        initWorker()
+        for file in inline_files:
+            prepared[file] = prepareBatchForm(file)
+    if pool_files:
+        for file, job in zip(pool_files, pool_jobs):
+            prepared[file] = job
+        pool.shutdown()
+    jobs = [prepared[file] for file in file_list]
+    stages.append(("Prepare", len(jobs), time.perf_counter() - start))
+
+    # Time spent per step, summed over all forms as one process sees it
+    for step in ["parse", "normalize", "district"]:
+        step_time = sum(job["timings"][step] for job in jobs)
+        stages.append((f"  {step.capitalize()}", len(jobs), step_time))
+
+    # ------------------------------------------------ [ DUPLICATE CHECKING ]
+
+    print("🔵 Checking duplicates against Database")
+    start = time.perf_counter()
+    conn = database.connectDB(var, db_file, migrate=True)
+    database.loadAccountFilter(var, conn)
+    cursor = conn.cursor()
+    batch_accounts = set()
+    decisions = []
+    try:
+        for job in jobs:
+            duplicates = []
+            student_data = job["students"]
+            if job["error"] is None and job["form"]["format"] and student_data:
+                acc_nos = [value[3] for value in student_data.values()]
+                existing = fn.analyzeDuplicates(student_data, cursor)["existing"]
+                duplicates = [account[2] for account in existing]
+                duplicates += [
+                    acc_no for acc_no in acc_nos if acc_no in batch_accounts
+                ]
+            reasons = getReviewReasons(job, duplicates)
+            if not reasons:
+                batch_accounts.update(
+                    value[3] for value in student_data.values()
+                )
+            decisions.append((job, reasons))
+    finally:
+        database.closeDB()
+    stages.append(("Duplicate check", len(jobs), time.perf_counter() - start))
+
+    # ------------------------------------------------------- [ ACTUATION ]
+
+    start = time.perf_counter()
+    queue = loadReviewQueue(input_dir)
+    batch_time = datetime.datetime.now().isoformat(timespec="seconds")
+    accepted_count = 0
+    review_count = 0
+
+    # Targets are decided up front: same-named institutions in this batch
+    # or already sorted get a numbered name instead of overwriting
+    moves = []
+    taken = set()
+    for job, reasons in decisions:
+        file = job["file"]
+        if reasons:
+            queue[os.path.basename(file)] = {
+                "reasons": reasons,
+                "district_guess": job["district_guess"],
+                "batch": batch_time,
+            }
+            review_count += 1
+            continue
+
+        queue.pop(os.path.basename(file), None)
+        output_dir = fn.initNestedDir(input_dir, job["district_guess"])
+        file_name = fn.getInstitutionFilename(
+            job["form"]["institution"], Path(file).suffix
+        )
+        target = fn.getAvailablePath(output_dir, file_name, taken)
+        taken.add(target)
+        moves.append((job, target))
+
+    # Forms reviewed since the last batch have left the inbox
+    queue = {
+        name: entry for name, entry in queue.items()
+        if (Path(input_dir) / name).exists()
+    }
+    # Written before moving, a failed move below cannot lose the queue
+    writeReviewQueue(input_dir, queue)
+
+    for job, target in moves:
+        file = job["file"]
+        try:
+            shutil.move(file, target)
+        except (OSError, shutil.Error) as e:
+            print(f"⚠️ Could not move {file}: {e}")
+            queue[os.path.basename(file)] = {
+                "reasons": [f"Move failed: {e}"],
+                "district_guess": job["district_guess"],
+                "batch": batch_time,
+            }
+            review_count += 1
+            continue
+        accepted_count += 1
+    if accepted_count < len(moves):
+        writeReviewQueue(input_dir, queue)
+    stages.append(("Sorting", len(decisions), time.perf_counter() - start))
+
+    # ---------------------------------------------------------- [ REPORT ]
+
+    print("")
+    horizontal_line = "-" * 80
+    print(horizontal_line)
+    print("BATCH REPORT".center(80))
+    print(horizontal_line)
+    print(f"Auto Accepted     : {accepted_count}".center(80))
+    print(f"Left for Review   : {review_count}".center(80))
+    print(horizontal_line)
+    printStageReport(stages)
+    if review_count:
+        print(f"ℹ️ Run 'forms' to review, reasons in {REVIEW_QUEUE}")
+
+
+if __name__ == "__main__":
+    main()
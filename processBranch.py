@@ -3,6 +3,10 @@ import pyperclip    # Clipboard handling
 import threading    # Multithreading Stuff
 from function import var
 from function import updateIfscInVar
+from function import prefetchIfsc
+
+# IFSC dataset columns read by this command
+IFSC_COLUMNS = ["Branch"]
 
 
 def main():
@@ -11,7 +15,11 @@ def main():
 
 def getBranchFromPastedIfsc():
 
-    csv_thread = threading.Thread(target=updateIfscInVar)
+    # Near-zero startup: only the pasted codes are ever decoded
+    backend = var["ifsc_quick_backend"]
+    csv_thread = threading.Thread(
+        target=updateIfscInVar, args=(backend, IFSC_COLUMNS)
+    )
     csv_thread.start()
 
     # Get Input while thread loads dataset values
@@ -24,6 +32,8 @@ def getBranchFromPastedIfsc():
     csv_thread.join()
     ifsc_dataset = var["ifsc_dataset"]
 
+    prefetchIfsc(ifsc_dataset, [ifsc.strip() for ifsc in text])
+
     branch_list = []
     for ifsc in text:
         ifsc = ifsc.strip()
@@ -0,0 +1,38 @@
+import formCache
+from function import var
+
+
+def clear():
+    cache = formCache.openFormCache(var)
+    if cache is None:
+        print("ℹ️ Form cache is disabled in config")
+        return
+    removed = cache.clear()
+    cache.close()
+    print(f"✅ Removed {removed} cached forms")
+
+
+def stats():
+    cache = formCache.openFormCache(var)
+    if cache is None:
+        print("ℹ️ Form cache is disabled in config")
+        return
+    stats = cache.stats()
+    cache.close()
+
+    lookups = stats["hits"] + stats["misses"]
+    hit_rate = stats["hits"] / lookups * 100 if lookups else 0.0
+    used = stats["bytes"] / 2**20
+    limit = stats["max_bytes"] / 2**20
+
+    horizontal_line = "-" * 80
+    print(horizontal_line)
+    print("FORM CACHE".center(80))
+    print(horizontal_line)
+    print(f"Cached Forms      : {stats['entries']}".center(80))
+    print(f"Old Parser Forms  : {stats['stale_entries']}".center(80))
+    print(f"Size              : {used:.1f} / {limit:.0f} MiB".center(80))
+    print(f"Hit Rate          : {hit_rate:.0f}%".center(80))
+    print(f"Hits / Misses     : {stats['hits']} / {stats['misses']}".center(80))
+    print(f"Evictions         : {stats['evictions']}".center(80))
+    print(horizontal_line)
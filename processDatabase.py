@@ -1,13 +1,19 @@
-import sqlite3      # SQLite DB operations
 import datetime     # ISO Date format
 import shutil       # Copying and Moving files
 import function as fn
+import database
 from function import var
+from formPipeline import FormPipeline
+
+# IFSC dataset columns read by this command
+IFSC_COLUMNS = ["Branch", "ResolvedDistrict"]
 
 
 def main():
 
-    district_user = fn.getDistrictFromUser()
+    district_user = fn.getDistrictFromUser(
+        var["ifsc_quick_backend"], IFSC_COLUMNS
+    )
 
     db_file = var["db_file"]
     input_dir = var["input_dir"]
@@ -19,35 +25,40 @@ def main():
     rejected_dir = fn.initNestedDir(input_dir, "rejected")
 
     print("ℹ️ Connecting to Database")
-    conn = sqlite3.connect(db_file)
+    conn = database.connectDB(var, db_file, migrate=True)
 
     files_written = 0
     for_checking_count = 0
     incorrect_format_count = 0
     rejected_count = 0
 
-    file_list = fn.getFileList(input_dir, [".docx", ".pdf"])
+    file_list = fn.getFileList(input_dir, var["form_extensions"])
+
+    # Forms are prepared in the background while the operator reviews
+    pipeline = FormPipeline(file_list)
+    pipeline.start()
+
     try:
-        for file in file_list:
+        for job in pipeline:
 
+            file = job["file"]
             fn.printFileNameHeader(file)
-            if fn.correctFormat(file):
+            # Parsed, cleaned and normalized ahead of time (see formPipeline)
+            form = job["form"]
+            fn.printFormatErrors(form)
+
+            if form["format"]:
 
                 # -------------------------------------------- [ FORM PARSING ]
 
-                institution = fn.getInstitutionDetails(file)
-                student_data = fn.getStudentDetails(file)
+                institution = form["institution"]
+                student_data = job["students"]
 
                 # ----------------------------------------- [ DATA PROCESSING ]
 
-                # Cleaning up Student Data for processing
-                student_data = fn.cleanStudentData(student_data)
-                # Normalizing Student Data
-                student_data = fn.normalizeStudentData(student_data)
-
                 # Guessing District
-                ifsc_list = fn.getStudentIfscList(student_data)
-                district_guess = fn.guessDistrictFromIfscList(ifsc_list)
+                district_guess = job["district_guess"]
+                fn.printDistrictGuess(job["district_list"])
                 print(f"💡 Possible District: {district_guess}")
 
                 # Printing Data
@@ -96,11 +107,13 @@ def main():
 
     except KeyboardInterrupt:
         print("Caught the Keyboard Interrupt ;D")
+    finally:
+        pipeline.close()
 
     # -------------------------------------------------------------- [ REPORT ]
 
     print("ℹ️ Closing DB")
-    conn.close()
+    database.closeDB()
 
     print("")
     horizontal_line = "-"*80
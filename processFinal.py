@@ -1,7 +1,7 @@
-import sqlite3      # SQLite DB operations
 from openpyxl import Workbook       # Excel Workbook
 from openpyxl.styles import Font    # Excel Font Styles
 import function as fn
+import database
 from function import var
 
 # For recognising Unknown Districts (Other States)
@@ -19,6 +19,7 @@ def main():
 
     generateFinalNEFT(db_file, neft_file)
     print(f"Generated final Spreadsheet: {neft_file}")
+    database.closeDB()
 
 
 def generateFinalSpreadsheet(db_file, xlsx_file):
@@ -31,7 +32,7 @@ def generateFinalSpreadsheet(db_file, xlsx_file):
     Returns:
         Generated Excel.xlsx file
     """
-    conn = sqlite3.connect(db_file)
+    conn = database.connectDB(var, db_file)
     cursor = conn.cursor()
     wb = Workbook()
     ws = wb.active
@@ -51,9 +52,7 @@ def generateFinalSpreadsheet(db_file, xlsx_file):
     for district in district_dataset:
 
         if district != "Unknown":
-            schoolSQL = """
-            SELECT * FROM Schools WHERE District = ?
-            """
+            schoolSQL = database.SCHOOLS_OF_DISTRICT_SQL
             cursor.execute(schoolSQL, (district,))
 
         else:
@@ -67,9 +66,7 @@ def generateFinalSpreadsheet(db_file, xlsx_file):
             """
             cursor.execute(schoolSQL)
 
-        studentSQL = """
-        SELECT * FROM Students WHERE SchoolID = ?
-        """
+        studentSQL = database.STUDENTS_OF_SCHOOL_SQL
         schools_table = cursor.fetchall()
 
         # ---------------------------------------------------- DISTRICT HEADING
@@ -132,7 +129,6 @@ def generateFinalSpreadsheet(db_file, xlsx_file):
         ws.append([""])
 
     wb.save(xlsx_file)
-    conn.close()
 
 
 def generateFinalNEFT(db_file, xlsx_file):
@@ -145,7 +141,7 @@ def generateFinalNEFT(db_file, xlsx_file):
     Returns: xlsx file with bank NEFT format
     """
 
-    conn = sqlite3.connect(db_file)
+    conn = database.connectDB(var, db_file)
     cursor = conn.cursor()
     wb = Workbook()
     ws = wb.active
@@ -164,9 +160,7 @@ def generateFinalNEFT(db_file, xlsx_file):
     for district in district_dataset:
 
         if district != "Unknown":
-            schoolSQL = """
-            SELECT * FROM Schools WHERE District = ?
-            """
+            schoolSQL = database.SCHOOLS_OF_DISTRICT_SQL
             cursor.execute(schoolSQL, (district,))
 
         elif district == "Unknown":
@@ -180,9 +174,7 @@ def generateFinalNEFT(db_file, xlsx_file):
             """
             cursor.execute(schoolSQL)
 
-        studentSQL = """
-        SELECT * FROM Students WHERE SchoolID = ?
-        """
+        studentSQL = database.STUDENTS_OF_SCHOOL_SQL
         schools_table = cursor.fetchall()
 
         # ----------------------------------------------------- STUDENT DETAILS
@@ -206,4 +198,3 @@ def generateFinalNEFT(db_file, xlsx_file):
                 ws.append(st_row)
 
     wb.save(xlsx_file)
-    conn.close()
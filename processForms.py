@@ -1,8 +1,13 @@
 from sqlite3 import IntegrityError  # SQLite AccNo error
-import sqlite3  # SQLite DB operations
 import shutil  # Copying and Moving files
 import function as fn
+import database
 from function import var
+from formPipeline import FormPipeline, prepareForm
+from processBatch import loadReviewQueue, printReviewReasons
+
+# IFSC dataset columns read by this command
+IFSC_COLUMNS = ["Branch", "ResolvedDistrict"]
 
 
 def main():
@@ -12,29 +17,46 @@ def main():
     investigation_dir = fn.initNestedDir(input_dir, "for checking")
     formatting_dir = fn.initNestedDir(input_dir, "formatting issues")
     rejected_dir = fn.initNestedDir(input_dir, "rejected")
-    district_user = fn.getDistrictFromUser()
+    district_user = fn.getDistrictFromUser(columns=IFSC_COLUMNS)
     files_written = 0
     for_checking_count = 0
     incorrect_format_count = 0
     rejected_count = 0
-    file_list = fn.getFileList(input_dir, [".docx", ".pdf"])
+    file_list = fn.getFileList(input_dir, var["form_extensions"])
+    review_queue = loadReviewQueue(input_dir)
 
     print("🔵 Connecting to Database")
-    conn = sqlite3.connect(db_file)
+    conn = database.connectDB(var, db_file, migrate=True)
+    database.loadAccountFilter(var, conn)
     cursor = conn.cursor()
 
+    # Forms are prepared in the background while the operator reviews
+    pipeline = FormPipeline(file_list)
+    pipeline.start()
+
     try:
-        for file in file_list:
+        for job in pipeline:
 
+            file = job["file"]
             print(f"\n{file}")
+            printReviewReasons(review_queue, file)
             file = fn.sanitizeFilename(file)
+            if str(file) != str(job["file"]):
+                # Renamed to drop extra dots, parse under the new name
+                job = prepareForm(file)
+                if job["error"] is not None:
+                    raise job["error"]
 
-            if fn.correctFormat(file):
+            # Parsed, cleaned and normalized ahead of time (see formPipeline)
+            form = job["form"]
+            fn.printFormatErrors(form)
+
+            if form["format"]:
 
                 # -------------------------------------------- [ FORM PARSING ]
 
-                institution = fn.getInstitutionDetails(file)
-                student_data = fn.getStudentDetails(file)
+                institution = form["institution"]
+                student_data = job["students"]
 
                 # --------------------------------------- [ FILENAME RENAMING ]
 
@@ -43,22 +65,18 @@ def main():
 
                 # ----------------------------------------- [ DATA PROCESSING ]
 
-                # Cleaning up Student Data for processing
-                student_data = fn.cleanStudentData(student_data)
-                # Normalizing Student Data
-                student_data = fn.normalizeStudentData(student_data)
-
                 # Guessing District
-                ifsc_list = fn.getStudentIfscList(student_data)
-                district_guess = fn.guessDistrictFromIfscList(ifsc_list)
+                district_guess = job["district_guess"]
+                fn.printDistrictGuess(job["district_list"])
                 print(f"💡 Possible District: {district_guess}")
 
                 # Check for duplicate accounts in database
-                if fn.checkExistingAccounts(student_data, cursor):
+                duplicates = fn.analyzeDuplicates(student_data, cursor)
+                if duplicates["existing"]:
                     print("❌ Duplicate account detected in Database!")
-                    duplicate_accounts = fn.getExistingAccounts(student_data, cursor)
+                    duplicate_accounts = duplicates["existing"]
 
-                    school_id = fn.identifySchool(duplicate_accounts, cursor)
+                    school_id = duplicates["school_id"]
                     if school_id == None:
                         print("🤨 Students detected in different schools.")
                         input("Move for Investigation? (ret) ")
@@ -72,8 +90,8 @@ def main():
                     fn.printExistingAccountsDiff(student_data, duplicate_accounts)
 
                     # Update student vacancies
-                    vacancy_id, vacancy_list = fn.findVacancySpots(school_id, cursor)
-                    if school_id == vacancy_id and len(vacancy_list) > 0:
+                    vacancy_list = duplicates["vacancies"]
+                    if len(vacancy_list) > 0:
                         print(f"Vacancies: {vacancy_list}")
                         input("Fill vacancies? (ret) ")
                         conn.execute("BEGIN TRANSACTION")
@@ -145,8 +163,9 @@ def main():
     # -------------------------------------------------------------- [ REPORT ]
 
     finally:
+        pipeline.close()
         print("🔵 Closing DB")
-        conn.close()
+        database.closeDB()
         print("")
         horizontal_line = "-" * 80
         print(horizontal_line)
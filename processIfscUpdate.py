@@ -0,0 +1,33 @@
+import time         # Timing the update
+import ifscDataset
+from function import var
+
+
+def main():
+    csv_file = var["ifsc_dataset_path"]
+
+    current = ifscDataset.readDatasetVersion(csv_file)
+    print(f"ℹ️ Current IFSC dataset version: {current.get('version', 0)}")
+
+    new_csv = input("📝 Path to new IFSC.csv: ").strip().strip('"')
+    if not new_csv:
+        print("❌ No file given")
+        return
+
+    print("ℹ️ Diffing against current dataset")
+    start = time.perf_counter()
+    record = ifscDataset.updateIfscDataset(csv_file, new_csv)
+    elapsed = time.perf_counter() - start
+
+    print("")
+    horizontal_line = "-" * 80
+    print(horizontal_line)
+    print("IFSC UPDATE REPORT".center(80))
+    print(horizontal_line)
+    print(f"Dataset Version : {record['version']}".center(80))
+    print(f"Total Branches  : {record['rows']}".center(80))
+    print(f"Added           : {record['added']}".center(80))
+    print(f"Changed         : {record['changed']}".center(80))
+    print(f"Removed         : {record['removed']}".center(80))
+    print(f"Time Taken      : {elapsed:.1f}s".center(80))
+    print(horizontal_line)
@@ -0,0 +1,44 @@
+import sqlite3      # SQLite DB operations
+import database
+from function import var
+
+
+def main():
+    db_file = var["db_file"]
+
+    print("ℹ️ Connecting to Database")
+    try:
+        conn = database.connectDB(var, db_file)
+    except FileNotFoundError as e:
+        print(f"🔴 {e}")
+        return
+    try:
+        version = database.getSchemaVersion(conn)
+        applied = database.migrateDB(conn)
+        if applied:
+            print(f"✅ Schema v{version} -> v{database.SCHEMA_VERSION}")
+            for name in applied:
+                print(f"   - {name}")
+        else:
+            print(f"ℹ️ Schema is current (v{database.SCHEMA_VERSION})")
+        plans = database.checkQueryPlans(conn)
+    except (sqlite3.Error, RuntimeError) as e:
+        print(f"🔴 Migration failed: {e}")
+        return
+    finally:
+        database.closeDB()
+
+    # ---------------------------------------------------------- [ REPORT ]
+
+    horizontal_line = "-" * 80
+    print(horizontal_line)
+    print("QUERY PLANS".center(80))
+    print(horizontal_line)
+    for name, indexed, plan in plans:
+        status = "✅" if indexed else "❌"
+        print(f"{status} {name:<20}: {' / '.join(plan)}")
+    print(horizontal_line)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,8 @@
-import sqlite3      # SQLite DB operations
 from openpyxl import Workbook       # Excel Workbook
 from openpyxl.styles import Font    # Excel Font Styles
 from pathlib import Path            # Modern OS Path
 import function as fn
+import database
 from function import var
 
 
@@ -16,6 +16,7 @@ def main():
         xlsx_file = Path(spreadsheet_dir) / f"{district}.xlsx"
         generateOutputNEFT(db_file, district, xlsx_file)
         print(f"✅ {xlsx_file} generated for {district}")
+    database.closeDB()
 
 
 def generateOutputNEFT(db_file, district, xlsx_file):
@@ -28,7 +29,8 @@ def generateOutputNEFT(db_file, district, xlsx_file):
     Returns: xlsx file with bank NEFT format
     """
 
-    conn = sqlite3.connect(db_file)
+    # Shared connection, reused for every district
+    conn = database.connectDB(var, db_file)
     cursor = conn.cursor()
     wb = Workbook()
     ws = wb.active
@@ -36,9 +38,7 @@ def generateOutputNEFT(db_file, district, xlsx_file):
     # --------------------------------------------------------- [ SQL Queries ]
 
     if district != "Unknown":
-        schoolSQL = """
-        SELECT * FROM Schools WHERE District = ?
-        """
+        schoolSQL = database.SCHOOLS_OF_DISTRICT_SQL
         cursor.execute(schoolSQL, (district,))
 
     elif district == "Unknown":
@@ -52,9 +52,7 @@ def generateOutputNEFT(db_file, district, xlsx_file):
         """
         cursor.execute(schoolSQL)
 
-    studentSQL = """
-    SELECT * FROM Students WHERE SchoolID = ?
-    """
+    studentSQL = database.STUDENTS_OF_SCHOOL_SQL
     schools_table = cursor.fetchall()
 
     # -------------------------------------------------------- DISTRICT HEADING
@@ -95,4 +93,3 @@ def generateOutputNEFT(db_file, district, xlsx_file):
             ws.append(st_row)
 
     wb.save(xlsx_file)
-    conn.close()
@@ -0,0 +1,217 @@
+import datetime     # Import timestamps
+import sqlite3      # SQLite DB operations
+import function as fn
+import database
+from function import var
+
+# IFSC dataset columns read by this command
+IFSC_COLUMNS = ["Branch", "ResolvedDistrict"]
+
+
+# ========================== [ @DJANGO_FUNCTIONS ] ========================== #
+
+
+def openDjangoDB(django_db_file):
+    """
+    Returns: Read-only connection to the Django app database
+    """
+    uri = f"file:{django_db_file}?mode=ro"
+    return sqlite3.connect(uri, uri=True)
+
+
+def getPendingInstitutions(django_conn, imported_ids):
+    """
+    Parameters: (django_conn, imported_ids)
+    Returns: List of (id, institution, django_district) not imported yet
+    """
+    rows = django_conn.execute(
+        "SELECT id, name, place, district, phone_no, email "
+        "FROM create_institution ORDER BY id"
+    ).fetchall()
+
+    pending = []
+    for inst_id, name, place, district, phone_no, email in rows:
+        if inst_id in imported_ids:
+            continue
+        institution = {
+            "name": name,
+            "place": place,
+            "number": phone_no,
+            "email": email,
+        }
+        pending.append((inst_id, institution, district))
+    return pending
+
+
+def getWebStudentData(django_conn, inst_ids):
+    """
+    Parameters: (django_conn, inst_ids)
+    Returns: {institution_id: student_data} in getStudentDetails() layout,
+             read with one query per batch
+    """
+    students = {inst_id: {} for inst_id in inst_ids}
+    if not inst_ids:
+        return students
+
+    query = """
+    SELECT institution_id, student_name, student_class, student_ifsc,
+           student_account, student_holder, student_branch
+    FROM create_student
+    WHERE institution_id IN ({})
+    ORDER BY institution_id, id
+    """.format(",".join("?" for _ in inst_ids))
+
+    for inst_id, *row in django_conn.execute(query, list(inst_ids)):
+        student_data = students[inst_id]
+        student_data[len(student_data)] = tuple(
+            "" if value is None else value for value in row
+        )
+    return students
+
+
+def getImportDistrict(django_district, student_data):
+    """
+    Returns: District typed on the web form if it is a known district,
+             else the district guessed from student IFSCs
+    """
+    typed = (django_district or "").strip().lower()
+    for district in var["district_dataset"]:
+        if district.lower() == typed and district != "Unknown":
+            return district
+
+    ifsc_list = fn.getStudentIfscList(student_data)
+    if not ifsc_list:
+        return "Unknown"
+    district, _ = fn.getDistrictGuess(ifsc_list)
+    return district
+
+
+# =============================== [ @MAIN ] =============================== #
+
+
+def recordImport(cursor, inst_id, school_id, status, reason, timestamp):
+    cursor.execute(
+        "INSERT OR REPLACE INTO WebImports "
+        "(InstitutionID, SchoolID, Status, Reason, Imported) "
+        "VALUES (?, ?, ?, ?, ?)",
+        (inst_id, school_id, status, reason, timestamp),
+    )
+
+
+def main():
+    fn.updateIfscInVar(var["ifsc_quick_backend"], IFSC_COLUMNS)
+
+    db_file = var["db_file"]
+    django_db_file = var["django_db_file"]
+    batch_size = var["web_import_batch"]
+
+    print("ℹ️ Connecting to Databases")
+    conn = database.connectDB(var, db_file, migrate=True)
+    try:
+        django_conn = openDjangoDB(django_db_file)
+    except sqlite3.Error as e:
+        print(f"🔴 Cannot open {django_db_file}: {e}")
+        database.closeDB()
+        return
+
+    # Submissions held for review are checked again every run, in case
+    # the IFSC dataset now decides them, but reported only once
+    imported_ids = set()
+    review_ids = set()
+    for inst_id, status in conn.execute(
+        "SELECT InstitutionID, Status FROM WebImports"
+    ):
+        if status == "review":
+            review_ids.add(inst_id)
+        else:
+            imported_ids.add(inst_id)
+    pending = getPendingInstitutions(django_conn, imported_ids)
+    new_count = sum(1 for inst_id, _, _ in pending if inst_id not in review_ids)
+    print(f"ℹ️ {new_count} web submissions pending")
+
+    imported_count = 0
+    rejected_count = 0
+    unknown_count = 0
+    waiting_count = 0
+
+    try:
+        for start in range(0, len(pending), batch_size):
+            batch = pending[start:start + batch_size]
+            students = getWebStudentData(
+                django_conn, [inst_id for inst_id, _, _ in batch]
+            )
+            timestamp = datetime.datetime.now().isoformat(timespec="seconds")
+
+            inst_ids = []
+            forms = []
+            held = []   # (inst_id, status, reason) not written as forms
+            for inst_id, institution, django_district in batch:
+                student_data = fn.cleanStudentData(students[inst_id])
+                student_data = fn.normalizeStudentData(student_data)
+
+                if not student_data:
+                    print(f"❌ No students: {institution['name']}")
+                    held.append((inst_id, "rejected", "No students"))
+                    rejected_count += 1
+                    continue
+
+                district = getImportDistrict(django_district, student_data)
+                reasons = []
+                if district == "Unknown":
+                    reasons.append("District not decided")
+                if not fn.isValidStudentStd(student_data):
+                    reasons.append("Class not convertible")
+                if reasons:
+                    # Recorded so an operator can find it in WebImports
+                    if inst_id in review_ids:
+                        waiting_count += 1
+                        continue
+                    print(f"⚠️ Needs review: {institution['name']}")
+                    held.append((inst_id, "review", ", ".join(reasons)))
+                    unknown_count += 1
+                    continue
+                inst_ids.append(inst_id)
+                forms.append((district, institution, student_data))
+
+            if held:
+                cursor = conn.cursor()
+                for inst_id, status, reason in held:
+                    recordImport(cursor, inst_id, None, status, reason, timestamp)
+                conn.commit()
+
+            def record(cursor, index, school_id, error):
+                status = "imported" if error is None else "rejected"
+                recordImport(
+                    cursor, inst_ids[index], school_id, status, error, timestamp
+                )
+
+            # One transaction per batch, a duplicate account only rejects
+            # its own submission
+            results = fn.writeFormsToDB(conn, forms, record)
+            for (district, institution, _), (_, error) in zip(forms, results):
+                if error is None:
+                    print(f"✅ {institution['name']} ({district})")
+                    imported_count += 1
+                else:
+                    print(f"❌ Rejected by Database: {institution['name']}")
+                    rejected_count += 1
+
+    except KeyboardInterrupt:
+        print("Caught the Keyboard Interrupt ;D")
+
+    # -------------------------------------------------------------- [ REPORT ]
+
+    finally:
+        print("ℹ️ Closing DB")
+        django_conn.close()
+        database.closeDB()
+        print("")
+        horizontal_line = "-" * 80
+        print(horizontal_line)
+        print("WEB IMPORT REPORT".center(80))
+        print(horizontal_line)
+        print(f"Imported          : {imported_count}".center(80))
+        print(f"Needs Review      : {unknown_count}".center(80))
+        print(f"Still in Review   : {waiting_count}".center(80))
+        print(f"Rejected          : {rejected_count}".center(80))
+        print(horizontal_line)
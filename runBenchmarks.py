@@ -0,0 +1,707 @@
+import sys          # Command line arguments
+import time         # Timing
+from pathlib import Path
+import config as cfg
+var = cfg.initVarCommon()
+
+
+# ========================== [ @BENCH_HELPERS ] ========================== #
+
+
+def timeIt(func, *args, repeat=3):
+    """
+    Parameters: (func, *args, repeat)
+    Returns: (best time in seconds, result of last call)
+    """
+    best = None
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args)
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return best, result
+
+
+def printBenchHeader(title):
+    horizontal_line = "-" * 80
+    print(horizontal_line)
+    print(title.center(80))
+    print(horizontal_line)
+
+
+# ========================== [ @IFSC_BENCHMARKS ] ========================== #
+
+
+def benchIfscLoad():
+    """
+    Cold CSV parse vs compiled snapshot load of data/IFSC.csv
+    """
+    import ifscDataset
+    csv_file = var["ifsc_dataset_path"]
+    snapshot_file = ifscDataset.getSnapshotPath(csv_file)
+
+    printBenchHeader("IFSC LOADER: CSV vs SNAPSHOT")
+
+    csv_time, dataset = timeIt(ifscDataset.readIfscCsv, csv_file)
+    print(f"CSV parse         : {csv_time:.3f}s ({len(dataset)} rows)")
+
+    build_time, _ = timeIt(ifscDataset.buildIfscSnapshot, csv_file, repeat=1)
+    print(f"Snapshot build    : {build_time:.3f}s")
+
+    load_time, snapshot = timeIt(ifscDataset.loadSnapshot, snapshot_file)
+    print(f"Snapshot load     : {load_time:.3f}s ({len(snapshot)} rows)")
+
+    cached_time, _ = timeIt(ifscDataset.loadIfscDatasetCached, csv_file)
+    print(f"Cached load       : {cached_time:.3f}s (incl. freshness check)")
+
+    if load_time > 0:
+        print(f"Speedup           : {csv_time / load_time:.1f}x")
+    assert snapshot == dataset, "Snapshot differs from CSV dataset"
+
+
+def benchIfscBackends(lookups=50):
+    """
+    Startup + point lookups for each IFSC backend, as a form run does them
+    """
+    import ifscDataset
+    import random
+    csv_file = var["ifsc_dataset_path"]
+
+    printBenchHeader(f"IFSC BACKENDS: OPEN + {lookups} LOOKUPS")
+
+    # Make sure compiled files exist so only steady-state cost is measured
+    ifscDataset.loadIfscBackend(csv_file, "dict")
+    ifscDataset.loadIfscBackend(csv_file, "sqlite").close()
+    ifscDataset.loadIfscBackend(csv_file, "mmap").close()
+
+    keys = list(ifscDataset.readIfscCsv(csv_file).keys())
+    sample = random.Random(0).sample(keys, min(lookups, len(keys)))
+
+    def run(backend):
+        store = ifscDataset.loadIfscBackend(csv_file, backend)
+        return [store.get(ifsc) for ifsc in sample]
+
+    results = {}
+    for backend in ["dict", "sqlite", "mmap"]:
+        elapsed, rows = timeIt(run, backend)
+        results[backend] = rows
+        print(f"{backend:<18}: {elapsed * 1000:.1f}ms")
+        assert rows == results["dict"], f"{backend} disagrees with dict"
+
+
+def benchIfscMemory():
+    """
+    tracemalloc peak / retained memory: dict-of-dicts vs columnar store
+    """
+    import ifscDataset
+    import tracemalloc
+    csv_file = var["ifsc_dataset_path"]
+
+    printBenchHeader("IFSC MEMORY: DICT-OF-DICTS vs COLUMNAR")
+
+    loaders = [
+        ("dict-of-dicts", ifscDataset.readIfscCsv),
+        ("columnar", ifscDataset.loadIfscColumnarStore),
+    ]
+    stores = {}
+    for name, loader in loaders:
+        tracemalloc.start()
+        start = time.perf_counter()
+        store = loader(csv_file)
+        elapsed = time.perf_counter() - start
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        stores[name] = store
+        print(
+            f"{name:<18}: retained {current / 2**20:7.1f} MiB, "
+            f"peak {peak / 2**20:7.1f} MiB, load {elapsed:.2f}s"
+        )
+        del store
+
+    dataset = stores["dict-of-dicts"]
+    columnar = stores["columnar"]
+    assert all(columnar.get(k) == v for k, v in dataset.items())
+
+
+def benchIfscProjection():
+    """
+    Full-row parse vs column-projected parse (as used by the ifsc command)
+    """
+    import ifscDataset
+    import tracemalloc
+    csv_file = var["ifsc_dataset_path"]
+
+    printBenchHeader("IFSC PROJECTION: ALL COLUMNS vs BRANCH ONLY")
+
+    for name, columns in [("all columns", None), ("Branch only", ["Branch"])]:
+        elapsed, _ = timeIt(ifscDataset.readIfscCsv, csv_file, columns)
+        tracemalloc.start()
+        dataset = ifscDataset.readIfscCsv(csv_file, columns)
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(
+            f"{name:<18}: {elapsed:.3f}s, retained {current / 2**20:.1f} MiB"
+        )
+        del dataset
+
+
+# ========================= [ @PROCESSOR_BENCHMARKS ] ========================= #
+
+
+def legacyConvertStdToNum(data, std_aliases):
+    """
+    Per-call cost model of the old convertStdToNum: rebuild the alias
+    table on every call, then scan every alias of every class
+    """
+    data = str(data)
+    data = data.strip().lower()
+    std_dataset = {key: list(values) for key, values in std_aliases.items()}
+    if isinstance(data, str):
+        data = data.lower()
+        for key, values in std_dataset.items():
+            for value in values:
+                if data == value:
+                    data = key
+    return data
+
+
+# Must stay unconverted so the form goes for checking: two numbers are
+# not a class, and "year" without DC / PG is a college or +1 student
+STD_INVALID = [
+    "1 2", "1,2", "1/2", "1 & 2", "std 1 2", "1 1", "1 0",
+    "1st year", "2nd year", "3rd year", "first year", "I year", "year 1",
+]
+
+
+def getStdCorpus(size=20000):
+    """
+    Returns: Class strings as they show up on forms, aliases weighted by
+             how often schools use them, plus free-form and junk entries
+    """
+    import random
+    import function as fn
+    rng = random.Random(0)
+    aliases = [alias for values in fn.STD_ALIASES.values() for alias in values]
+    free_form = [
+        "10 B", "XII", "2nd DC", "1st year PG", "Class 5", "std 7", "10-A",
+        "X B", "Plus Two Science", "+2 bio", "first year degree", "V A",
+    ]
+    junk = ["", "lkg", "ukg", "b.com", "5 (five)", "-", "nil"] + STD_INVALID
+
+    corpus = []
+    for _ in range(size):
+        pick = rng.random()
+        if pick < 0.85:
+            alias = rng.choice(aliases)
+            corpus.append(rng.choice([alias, alias.upper(), f" {alias} "]))
+        elif pick < 0.95:
+            corpus.append(rng.choice(free_form))
+        else:
+            corpus.append(rng.choice(junk))
+    return corpus
+
+
+def benchStdNormalise():
+    """
+    Per-call cost of convertStdToNum: legacy scan vs alias index + grammar
+    """
+    import function as fn
+    corpus = getStdCorpus()
+
+    printBenchHeader(f"CLASS NORMALISER: {len(corpus)} CALLS")
+
+    def legacy():
+        return [legacyConvertStdToNum(d, fn.STD_ALIASES) for d in corpus]
+
+    def cold():
+        fn.lookupStd.cache_clear()
+        return [fn.convertStdToNum(d) for d in corpus]
+
+    def warm():
+        return [fn.convertStdToNum(d) for d in corpus]
+
+    legacy_time, legacy_result = timeIt(legacy)
+    cold_time, _ = timeIt(cold)
+    warm_time, result = timeIt(warm)
+
+    for name, elapsed in [
+        ("legacy scan", legacy_time),
+        ("index (cold)", cold_time),
+        ("index (memoized)", warm_time),
+    ]:
+        per_call = elapsed / len(corpus) * 1e6
+        print(f"{name:<18}: {per_call:8.2f}us/call")
+
+    # Every alias the legacy table knew must still convert the same way
+    for old, new in zip(legacy_result, result):
+        if isinstance(old, int):
+            assert old == new, f"{old} != {new}"
+
+    for text in STD_INVALID:
+        std = fn.convertStdToNum(text)
+        assert not isinstance(std, int), f"{text!r} converted to {std}"
+        assert std == legacyConvertStdToNum(text, fn.STD_ALIASES)
+    print(f"Invalid classes   : {len(STD_INVALID)} left unconverted")
+
+
+# =========================== [ @PARSER_BENCHMARKS ] =========================== #
+
+
+def writeDocxForm(docx_file, rng, rows):
+    """
+    Writes a scholarship form with python-docx the way schools fill it in:
+    institution paragraphs, a header row and student rows, with the odd
+    multi-line cell, tab, merged cell, blank row and extra table mixed in
+    """
+    import docx
+    doc = docx.Document()
+    doc.add_paragraph("Scholarship Application")
+    doc.add_paragraph("Institution Details")
+    doc.add_paragraph(f"Name of the Institution: School {rng.randint(1, 999)}")
+    doc.add_paragraph("Place : Kochi")
+    phone = doc.add_paragraph("Phone number: ")
+    phone.add_run("0484\t22").add_break()
+    doc.add_paragraph(f"Email Id: school{rng.randint(1, 999)}@example.com")
+
+    headers = ["STUDENT NAME", "CLASS", "IFSC", "ACCOUNT NO", "HOLDER", "BRANCH"]
+    table = doc.add_table(rows=rows + 1, cols=len(headers))
+    for cell, header in zip(table.rows[0].cells, headers):
+        cell.text = header
+    for row in table.rows[1:]:
+        if rng.random() < 0.05:
+            continue  # Blank row left in the template
+        values = [
+            f"Student {rng.randint(1, 99999)}",
+            rng.choice(["5", "X", "Plus Two", "1st DC"]),
+            f"SBIN{rng.randint(0, 9999999):07d}",
+            str(rng.randint(10**10, 10**12)),
+            f"Parent {rng.randint(1, 999)}",
+            rng.choice(["Kochi", "Aluva", "Thrissur\nMain"]),
+        ]
+        for cell, value in zip(row.cells, values):
+            cell.text = value
+        if rng.random() < 0.1:
+            row.cells[0].add_paragraph("(Guardian)")
+    if rows > 2 and rng.random() < 0.3:
+        table.cell(1, 4).merge(table.cell(1, 5))
+    if rows > 3 and rng.random() < 0.3:
+        table.cell(2, 5).merge(table.cell(3, 5))
+    if rng.random() < 0.2:
+        table.cell(rows, 0).add_table(rows=1, cols=2)
+    if rng.random() < 0.2:
+        doc.add_paragraph("Signature")
+        doc.add_table(rows=2, cols=6).cell(1, 0).text = "Late entry"
+    doc.save(docx_file)
+
+
+def benchDocxStream(forms=20, rows=40):
+    """
+    python-docx object model vs streaming reader on generated forms.
+    Both must return identical institution details and student tuples.
+    """
+    import function as fn
+    import docxStream
+    import tempfile
+    import random
+    rng = random.Random(0)
+
+    printBenchHeader(f"DOCX READER: {forms} FORMS x {rows} ROWS")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        files = []
+        for i in range(forms):
+            docx_file = Path(temp_dir) / f"form_{i}.docx"
+            writeDocxForm(docx_file, rng, rng.randint(1, rows))
+            files.append(docx_file)
+
+        for docx_file in files:
+            expected = fn.getStudentDetailsDocx(docx_file)
+            assert docxStream.getStudentDetailsDocxStream(docx_file) == expected
+            assert (
+                fn.parseDocxForm(docx_file, "stream")
+                == fn.parseDocxForm(docx_file, "python-docx")
+            ), f"Streaming parse differs: {docx_file.name}"
+        print(f"Parity            : {len(files)} forms identical")
+
+        def run(reader):
+            return [reader(docx_file) for docx_file in files]
+
+        readers = [
+            ("python-docx", fn.getStudentDetailsDocx),
+            ("stream", docxStream.getStudentDetailsDocxStream),
+        ]
+        results = {}
+        for name, reader in readers:
+            elapsed, _ = timeIt(run, reader)
+            results[name] = elapsed
+            print(f"{name:<18}: {elapsed:.3f}s ({forms / elapsed:.0f} forms/s)")
+        if results["stream"] > 0:
+            speedup = results["python-docx"] / results["stream"]
+            print(f"Speedup           : {speedup:.1f}x")
+
+
+# ========================== [ @DATABASE_BENCHMARKS ] ========================== #
+
+
+def writeLegacyDB(db_file, rng, schools, students):
+    """
+    Builds database.db the way it existed before migrations: tables only
+    """
+    import sqlite3
+    districts = [d for d in var["district_dataset"] if d != "Unknown"]
+    conn = sqlite3.connect(db_file)
+    conn.execute(
+        "CREATE TABLE Schools(SchoolID INTEGER PRIMARY KEY AUTOINCREMENT, "
+        "SchoolName, District, Place, Phone, Email)"
+    )
+    conn.execute(
+        "CREATE TABLE Students(StudentID INTEGER PRIMARY KEY AUTOINCREMENT, "
+        "SchoolID, StudentName, Class, IFSC, AccNo UNIQUE, AccHolder, "
+        "Branch, Verified)"
+    )
+    conn.executemany(
+        "INSERT INTO Schools VALUES (?, ?, ?, ?, ?, ?)",
+        (
+            (i, f"School {i}", rng.choice(districts), "Place", "", "")
+            for i in range(1, schools + 1)
+        ),
+    )
+    conn.executemany(
+        "INSERT INTO Students VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        (
+            (
+                i, rng.randint(1, schools), f"Student {i}",
+                rng.randint(1, 17), "SBIN0000001", str(10**11 + i),
+                f"Student {i}", "Branch", None,
+            )
+            for i in range(1, students + 1)
+        ),
+    )
+    conn.commit()
+    return conn
+
+
+def benchDbIndexes(schools=2000, students=100000):
+    """
+    Hot queries on a pre-migration database vs after migrateDB().
+    Every hot query must use an index once migrated.
+    """
+    import database
+    import tempfile
+    import random
+    rng = random.Random(0)
+
+    printBenchHeader(f"DATABASE INDEXES: {schools} SCHOOLS, {students} STUDENTS")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        conn = writeLegacyDB(Path(temp_dir) / "database.db", rng, schools, students)
+        school_ids = [rng.randint(1, schools) for _ in range(200)]
+        acc_nos = [str(10**11 + rng.randint(1, students)) for _ in range(200)]
+        districts = [d for d in var["district_dataset"] if d != "Unknown"]
+
+        def run():
+            for school_id, acc_no in zip(school_ids, acc_nos):
+                conn.execute(
+                    "SELECT DISTINCT SchoolID FROM Students WHERE AccNo IN (?)",
+                    (acc_no,),
+                ).fetchall()
+                conn.execute(
+                    "SELECT MIN(Class) FROM Students WHERE SchoolID = ?",
+                    (school_id,),
+                ).fetchall()
+                conn.execute(
+                    "SELECT * FROM Students WHERE SchoolID = ?", (school_id,)
+                ).fetchall()
+            for district in districts:
+                conn.execute(
+                    "SELECT * FROM Schools WHERE District = ?", (district,)
+                ).fetchall()
+
+        before, _ = timeIt(run)
+        applied = database.migrateDB(conn)
+        after, _ = timeIt(run)
+        print(f"Migrations        : {', '.join(applied)}")
+        print(f"Legacy schema     : {before:.3f}s")
+        print(f"Migrated schema   : {after:.3f}s")
+        if after > 0:
+            print(f"Speedup           : {before / after:.1f}x")
+
+        for name, indexed, plan in database.checkQueryPlans(conn):
+            assert indexed, f"{name} scans a table: {plan}"
+        print(f"Query plans       : {len(database.getHotQueries())} hot queries indexed")
+        assert database.migrateDB(conn) == [], "Migration is not idempotent"
+        conn.close()
+
+
+def legacyWriteToDB(conn, district, institution, student_data):
+    """
+    The old writeToDB: one execute per student and a commit per form
+    """
+    cursor = conn.cursor()
+    conn.execute("BEGIN TRANSACTION")
+    cursor.execute(
+        "INSERT INTO Schools (SchoolName, District, Place, Phone, Email) "
+        "VALUES (?, ?, ?, ?, ?)",
+        (institution["name"], district, institution["place"],
+         institution["number"], institution["email"]),
+    )
+    school_id = cursor.lastrowid
+    for value in student_data.values():
+        cursor.execute(
+            "INSERT INTO Students (SchoolID, StudentName, Class, IFSC, "
+            "AccNo, AccHolder, Branch) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (school_id, *value[:6]),
+        )
+    conn.commit()
+
+
+def getFormCorpus(students, per_form=40):
+    """
+    Returns: List of (district, institution, student_data) with unique
+             account numbers, the last form repeats one to be rejected
+    """
+    forms = []
+    for start in range(0, students, per_form):
+        institution = {
+            "name": f"School {start}", "place": "Place",
+            "number": "", "email": "",
+        }
+        student_data = {
+            i: (f"Student {i}", 5, "SBIN0000001", str(10**11 + start + i),
+                f"Student {i}", "Branch")
+            for i in range(min(per_form, students - start))
+        }
+        forms.append(("Kollam", institution, student_data))
+    institution = {"name": "Duplicate", "place": "", "number": "", "email": ""}
+    forms.append(("Kollam", institution, {0: forms[0][2][0]}))
+    return forms
+
+
+def benchDbWrite(sizes=(10000, 100000)):
+    """
+    Old per-form commits vs writeFormsToDB() on an on-disk database.
+    Both must store the same rows and reject only the duplicate form.
+    """
+    import function as fn
+    import database
+    import contextlib
+    import sqlite3
+    import tempfile
+    import io
+
+    for students in sizes:
+        printBenchHeader(f"DATABASE WRITE: {students} STUDENTS")
+        forms = getFormCorpus(students)
+
+        def legacy(conn):
+            for district, institution, student_data in forms:
+                try:
+                    legacyWriteToDB(conn, district, institution, student_data)
+                except sqlite3.IntegrityError:
+                    conn.rollback()
+
+        def bulk(conn):
+            with contextlib.redirect_stdout(io.StringIO()):
+                fn.writeFormsToDB(conn, forms)
+
+        counts = {}
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for name, writer in [("writeToDB", legacy), ("writeFormsToDB", bulk)]:
+                conn = sqlite3.connect(Path(temp_dir) / f"{name}.db")
+                database.migrateDB(conn)
+                start = time.perf_counter()
+                writer(conn)
+                elapsed = time.perf_counter() - start
+                counts[name] = conn.execute(
+                    "SELECT COUNT(*) FROM Students"
+                ).fetchone()[0]
+                conn.close()
+                rate = students / elapsed
+                print(f"{name:<18}: {elapsed:.3f}s ({rate:,.0f} rows/s)")
+        assert counts["writeToDB"] == counts["writeFormsToDB"] == students
+        print(f"Rows stored       : {students} in both, duplicate form rejected")
+
+
+def benchDbDuplicates(schools=12000, students=500000, forms=300):
+    """
+    checkExistingAccounts / getExistingAccounts / identifySchool /
+    findVacancySpots chain vs analyzeDuplicates() on a migrated database.
+    Forms are a third clean, a third from one school, a third mixed.
+    """
+    import function as fn
+    import database
+    import tempfile
+    import random
+    rng = random.Random(0)
+
+    printBenchHeader(f"DUPLICATE ANALYSIS: {students} STUDENTS, {forms} FORMS")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        conn = writeLegacyDB(Path(temp_dir) / "database.db", rng, schools, students)
+        database.migrateDB(conn)
+        cursor = conn.cursor()
+
+        corpus = []
+        for i in range(forms):
+            kind = i % 3
+            if kind == 0:
+                acc_nos = [str(10**12 + i * 40 + n) for n in range(40)]
+            elif kind == 1:
+                school_id = rng.randint(1, schools)
+                acc_nos = [row[0] for row in conn.execute(
+                    "SELECT AccNo FROM Students WHERE SchoolID = ?", (school_id,)
+                )] or [str(10**12)]
+            else:
+                acc_nos = [
+                    str(10**11 + rng.randint(1, students)) for _ in range(40)
+                ]
+            corpus.append({
+                n: ("Name", 5, "SBIN0000001", acc_no, "Name", "Branch")
+                for n, acc_no in enumerate(acc_nos)
+            })
+
+        def chain():
+            results = []
+            for student_data in corpus:
+                if not fn.checkExistingAccounts(student_data, cursor):
+                    results.append(([], None, []))
+                    continue
+                existing = fn.getExistingAccounts(student_data, cursor)
+                school_id = fn.identifySchool(existing, cursor)
+                _, vacancies = fn.findVacancySpots(school_id, cursor)
+                results.append((existing, school_id, vacancies))
+            return results
+
+        def single():
+            results = []
+            for student_data in corpus:
+                analysis = fn.analyzeDuplicates(student_data, cursor)
+                results.append((
+                    analysis["existing"],
+                    analysis["school_id"],
+                    analysis["vacancies"],
+                ))
+            return results
+
+        chain_time, expected = timeIt(chain)
+        single_time, results = timeIt(single)
+        for (existing, *rest), (got, *got_rest) in zip(expected, results):
+            assert sorted(existing) == sorted(got) and rest == got_rest
+        print(f"Parity            : {forms} forms identical")
+        print(f"Query chain       : {chain_time:.3f}s ({forms / chain_time:.0f} forms/s)")
+        print(f"analyzeDuplicates : {single_time:.3f}s ({forms / single_time:.0f} forms/s)")
+        if single_time > 0:
+            print(f"Speedup           : {chain_time / single_time:.1f}x")
+
+        sql = fn.DUPLICATE_ANALYSIS_SQL.format("?, ?")
+        plan = database.explainQuery(conn, sql, ("0", "1"))
+        assert database.isIndexedPlan(plan), f"Table scan: {plan}"
+        print("Query plan        : indexed")
+        conn.close()
+
+
+def benchDbFilter(schools=12000, students=500000, forms=1000):
+    """
+    analyzeDuplicates() with and without the in-memory account filter on
+    mostly clean forms. Both must report the same duplicates, including
+    rows another connection commits after the filter is loaded.
+    """
+    import function as fn
+    import database
+    import sqlite3
+    import tempfile
+    import random
+    rng = random.Random(0)
+
+    printBenchHeader(f"ACCOUNT FILTER: {students} STUDENTS, {forms} FORMS")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        db_file = Path(temp_dir) / "database.db"
+        conn = writeLegacyDB(db_file, rng, schools, students)
+        database.migrateDB(conn)
+        cursor = conn.cursor()
+
+        # One form in ten repeats an existing account
+        corpus = []
+        for i in range(forms):
+            acc_nos = [str(10**12 + i * 40 + n) for n in range(40)]
+            if i % 10 == 0:
+                acc_nos[0] = str(10**11 + rng.randint(1, students))
+            corpus.append({
+                n: ("Name", 5, "SBIN0000001", acc_no, "Name", "Branch")
+                for n, acc_no in enumerate(acc_nos)
+            })
+
+        def run():
+            return [fn.analyzeDuplicates(data, cursor) for data in corpus]
+
+        fn.var.pop("account_filter_store", None)
+        sql_time, expected = timeIt(run)
+
+        start = time.perf_counter()
+        account_filter = database.AccountFilter(conn)
+        load_time = time.perf_counter() - start
+        fn.var["account_filter_store"] = account_filter
+        try:
+            filter_time, results = timeIt(run)
+            assert results == expected, "Filter changed duplicate results"
+
+            # A form written by another process must still be caught
+            other = sqlite3.connect(db_file)
+            other.execute(
+                "INSERT INTO Students (SchoolID, AccNo) VALUES (1, ?)",
+                (corpus[1][0][3],),
+            )
+            other.commit()
+            other.close()
+            assert fn.analyzeDuplicates(corpus[1], cursor)["existing"]
+        finally:
+            fn.var.pop("account_filter_store", None)
+        conn.close()
+
+        size = account_filter.getSize() / 2**20
+        print(f"Filter load       : {load_time:.3f}s, {size:.1f} MiB")
+        print(f"SQL only          : {sql_time:.3f}s ({forms / sql_time:.0f} forms/s)")
+        print(f"With filter       : {filter_time:.3f}s ({forms / filter_time:.0f} forms/s)")
+        if filter_time > 0:
+            print(f"Speedup           : {sql_time / filter_time:.1f}x")
+        print("Parity            : identical, other process inserts seen")
+
+
+# =============================== [ @MAIN ] =============================== #
+
+
+benchmarks = {
+    "ifsc-load": benchIfscLoad,
+    "ifsc-backends": benchIfscBackends,
+    "ifsc-memory": benchIfscMemory,
+    "ifsc-projection": benchIfscProjection,
+    "std-normalise": benchStdNormalise,
+    "docx-stream": benchDocxStream,
+    "db-indexes": benchDbIndexes,
+    "db-write": benchDbWrite,
+    "db-duplicates": benchDbDuplicates,
+    "db-filter": benchDbFilter,
+}
+
+
+def main():
+    """
+    Usage: python runBenchmarks.py [benchmark ...]
+    Runs every benchmark when no name is given
+    """
+    names = sys.argv[1:] or list(benchmarks.keys())
+    for name in names:
+        if name not in benchmarks:
+            print(f"Unknown benchmark: {name}")
+            print("Available:\n > " + "\n > ".join(benchmarks.keys()))
+            return 1
+    for name in names:
+        benchmarks[name]()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
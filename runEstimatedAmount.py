@@ -1,6 +1,113 @@
+from concurrent.futures import ProcessPoolExecutor  # Parallel form parsing
+from collections import defaultdict     # Breakdown totals
+from pathlib import Path
+import json         # Estimate cache
+import os           # Worker count and file stamps
 import function as fn
 from function import var
-from pathlib import Path
+import formCache
+import parserRegistry
+
+# Bump when convertStdToNum / convertStdToAmount rules change so cached
+# per-file amounts are recomputed
+ESTIMATE_VERSION = 1
+
+
+# =========================== [ @WORKER_FUNCTIONS ] =========================== #
+
+
+def initWorker():
+    # Bulk runs only read the student table, streaming skips python-docx
+    var["docx_reader"] = "stream"
+
+
+def estimateForm(file):
+    """
+    Parameter: Supported File
+    Returns: (classes, error)
+        - classes: List of [class, students, amount] for one form.
+                   Classes that do not convert keep their text with 0.
+        - error: Message if the form could not be read, else None
+    """
+    try:
+        student_data = fn.getStudentDetails(file)
+    except Exception as e:
+        return [], f"{type(e).__name__}: {e}"
+
+    columns = fn.studentDataToColumns(student_data)
+    standards = fn.mapColumn(columns["standard"], fn.convertStdToNum)
+
+    classes = defaultdict(lambda: [0, 0])
+    for standard in standards:
+        if type(standard) is int:
+            amount = fn.convertStdToAmount(standard)
+        else:
+            amount = 0
+        classes[standard][0] += 1
+        classes[standard][1] += amount
+    classes = [
+        [standard, count, amount]
+        for standard, (count, amount) in classes.items()
+    ]
+    return classes, None
+
+
+# ============================ [ @CACHE_FUNCTIONS ] ============================ #
+
+
+def getCacheVersion():
+    return f"{ESTIMATE_VERSION}.{formCache.PARSER_VERSION}"
+
+
+def loadEstimateCache(cache_file):
+    """
+    Returns: Cached per-file estimates of the last run
+
+    files = {
+        "input/Kollam/School.docx": {
+            "stamp": [size, mtime_ns],
+            "classes": [[5, 12, 7200], ["lkg", 1, 0]],
+        }
+    }
+    """
+    try:
+        with open(cache_file, mode="r", encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if cache.get("version") != getCacheVersion():
+        return {}
+    return cache.get("files", {})
+
+
+def saveEstimateCache(cache_file, files):
+    cache = {"version": getCacheVersion(), "files": files}
+    temp_file = Path(cache_file).with_suffix(".tmp")
+    try:
+        with open(temp_file, mode="w", encoding="utf-8") as f:
+            json.dump(cache, f, ensure_ascii=False)
+        os.replace(temp_file, cache_file)
+    except OSError as e:
+        print(f"⚠️ Could not write estimate cache: {e}")
+
+
+def getFileStamp(file):
+    stat = os.stat(file)
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+# =============================== [ @MAIN ] =============================== #
+
+
+def printBreakdown(title, header, rows):
+    horizontal_line = "-" * 80
+    print(horizontal_line)
+    print(title.center(80))
+    print(horizontal_line)
+    print(" ".join(f"{column:>14}" for column in header).center(80))
+    for row in rows:
+        print(" ".join(f"{str(value):>14}" for value in row).center(80))
+    print(horizontal_line)
 
 
 def main():
@@ -11,27 +118,100 @@ def main():
 
     district_dataset = var["district_dataset"]
     input_dir = var["input_dir"]
+    cache_file = var["estimate_cache_path"]
 
-    file_list = []
+    file_districts = {}
     input_dir_path = Path(input_dir)
 
     for district in district_dataset:
         district_path = input_dir_path / district
-        dist_file_list = fn.getFileList(str(district_path), [".docx"])
+        dist_file_list = fn.getFileList(
+            str(district_path), var["form_extensions"]
+        )
+        for file in dist_file_list:
+            file_districts[file] = district
+
+    # Unchanged files keep the amounts of the last run
+    cache = loadEstimateCache(cache_file)
+    estimates = {}
+    stale_files = []
+    for file in file_districts:
+        entry = cache.get(file)
+        if entry is not None and entry["stamp"] == getFileStamp(file):
+            estimates[file] = entry
+        else:
+            stale_files.append(file)
+
+    print(f"ℹ️ {len(file_districts)} forms, {len(estimates)} unchanged")
+    if stale_files:
+        # PDF layout analysis goes to the pool, cheap formats run here
+        inline_files, pool_files = parserRegistry.splitByCost(
+            stale_files, var["parser_pool_cost"]
+        )
+        workers = var["batch_workers"] or os.cpu_count() or 1
+        workers = max(1, min(workers, len(pool_files)))
+        print(
+            f"🔵 Parsing {len(inline_files)} forms inline and "
+            f"{len(pool_files)} on {workers} processes"
+        )
+        results = {}
+        if pool_files:
+            pool = ProcessPoolExecutor(workers, initializer=initWorker)
+            chunksize = max(1, len(pool_files) // (workers * 4))
+            pool_results = pool.map(
+                estimateForm, pool_files, chunksize=chunksize
+            )
+        if inline_files:
+            initWorker()
+            for file in inline_files:
+                results[file] = estimateForm(file)
+        if pool_files:
+            results.update(zip(pool_files, pool_results))
+            pool.shutdown()
+
+        for file in stale_files:
+            classes, error = results[file]
+            if error is not None:
+                print(f"⚠️ Skipped {file}: {error}")
+                continue
+            estimates[file] = {
+                "stamp": getFileStamp(file),
+                "classes": classes,
+            }
+        saveEstimateCache(cache_file, estimates)
+
+    # ----------------------------------------------------------- [ BREAKDOWN ]
 
-        if dist_file_list:
-            file_list.append(dist_file_list)
+    districts = defaultdict(lambda: [0, 0, 0])
+    classes = defaultdict(lambda: [0, 0])
+    for file, entry in estimates.items():
+        district = districts[file_districts[file]]
+        district[0] += 1
+        for standard, count, amount in entry["classes"]:
+            district[1] += count
+            district[2] += amount
+            classes[standard][0] += count
+            classes[standard][1] += amount
+            total_amt += amount
 
-    for dist_files in file_list:
-        for file in dist_files:
-            print(file)
-            student_data = fn.getStudentDetails(file)
+    printBreakdown(
+        "ESTIMATE BY DISTRICT",
+        ["District", "Forms", "Students", "Amount"],
+        [
+            [name] + districts[name]
+            for name in district_dataset if name in districts
+        ],
+    )
 
-            for _, value in student_data.items():
-                standard = value[1]
-                standard = fn.convertStdToNum(standard)
-                amt = fn.convertStdToAmount(standard)
-                total_amt += amt
+    # Numbered classes in order, unconverted ones after them
+    numbered = sorted(std for std in classes if type(std) is int)
+    unconverted = sorted(std for std in classes if type(std) is not int)
+    printBreakdown(
+        "ESTIMATE BY CLASS",
+        ["Class", "Students", "Amount"],
+        [[fn.convertNumToStd(std)] + classes[std] for std in numbered]
+        + [[repr(std)] + classes[std] for std in unconverted],
+    )
 
     print(f"Estimated Amount: {total_amt}")
     return 0
@@ -1,4 +1,5 @@
 import sqlite3  # SQLite DB operations
+import database
 from function import var
 
 
@@ -6,7 +7,7 @@ def main():
     db_file = var["db_file"]
 
     print("ℹ️ Connecting to Database")
-    conn = sqlite3.connect(db_file)
+    conn = database.connectDB(var, db_file, migrate=True)
     cursor = conn.cursor()
 
     delete_graduates_sql = """
@@ -52,7 +53,7 @@ def main():
     finally:
         print("ℹ️ Closing DB")
         cursor.close()
-        conn.close()
+        database.closeDB()
 
 
 if __name__ == "__main__":